@@ -197,13 +197,20 @@ def _apply_i18n_labels(df: pd.DataFrame, dataset_id: str, language: str) -> pd.D
     return df
 
 
-def ingest(dataset_or_adapter_id: str, *, file_path: str) -> pd.DataFrame:
+def ingest(
+    dataset_or_adapter_id: str,
+    *,
+    file_path: str,
+    filters: Optional[Dict[str, Any]] = None,
+) -> pd.DataFrame:
     """
     Ingest a dataset from a local file.
     
     Args:
         dataset_or_adapter_id: Adapter or dataset identifier
         file_path: Path to the data file
+        filters: Optional row filters applied to the ingested frame in memory.
+            Use this instead of calling load() right after ingest().
     
     Returns:
         DataFrame with the ingested dataset
@@ -226,6 +233,8 @@ def ingest(dataset_or_adapter_id: str, *, file_path: str) -> pd.DataFrame:
         raise
     
     try:
+        if filters:
+            return adapter.ingest_and_load(dataset_or_adapter_id, file_path=file_path, filters=filters)
         return adapter.ingest(dataset_or_adapter_id, file_path=file_path)
     except NotImplementedError as e:
         logger.error(f"Ingest not supported for adapter {dataset_or_adapter_id}: {e}")
@@ -14,10 +14,16 @@ class SocDataConfig(BaseModel):
     max_retries: int = 3
     user_agent: str = "socdata/0.1"
     enable_lazy_loading: bool = Field(default=True, description="Enable lazy loading for large datasets")
+    arrow_dtypes: bool = Field(default=False, description="Return Arrow-backed pandas dtypes from load instead of NumPy/object columns")
     cache_ttl_hours: int = Field(default=24, description="Cache time-to-live in hours")
+    eurostat_cache_ttl_hours: int = Field(default=168, description="Time-to-live of the cached Eurostat dataset list in hours")
+    eurostat_async_refresh: bool = Field(default=False, description="Refresh the Eurostat dataset list in the background instead of blocking list_datasets")
     use_cloud_storage: bool = Field(default=False, description="Use cloud storage for caching")
     log_level: str = Field(default="INFO", description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)")
     log_file: Optional[Path] = Field(default=None, description="Optional path to log file")
+    parquet_compression: str = Field(default="zstd", description="Compression codec for cached Parquet files")
+    parquet_compression_level: Optional[int] = Field(default=3, description="Compression level for the Parquet codec")
+    parquet_row_group_size: int = Field(default=128_000, description="Maximum rows per Parquet row group")
 
 
 _CONFIG: Optional[SocDataConfig] = None
@@ -58,3 +58,8 @@ class StorageError(SocDataError):
 class MetadataError(SocDataError):
     """Raised when there is a metadata-related error (reading/writing)."""
     pass
+
+
+class ValidationError(SocDataError):
+    """Raised when data validation fails."""
+    pass
@@ -1,12 +1,113 @@
 from __future__ import annotations
 
+import csv
+import os
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import pyreadstat
 from pandas.io.stata import StataReader
 
+from .logging import get_logger
+
+try:
+	import polars as pl  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+	pl = None  # type: ignore
+
+logger = get_logger(__name__)
+
+# Formats that can be parsed directly into Arrow without a pandas round-trip
+ARROW_NATIVE_SUFFIXES = frozenset({".csv", ".tsv"})
+
+_SNIFF_BYTES = 64 * 1024
+
+_POLARS_INFER_SCHEMA_LENGTH = 10_000
+
+# pandas' default NA strings; the streaming reader uses them so it parses like read_csv_fast
+_PANDAS_NA_VALUES = (
+	"", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+	"<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+)
+
+
+def fast_io_enabled() -> bool:
+	"""Return True if the opt-in Polars CSV reader is enabled via SOCDATA_FAST_IO=1."""
+	return pl is not None and os.getenv("SOCDATA_FAST_IO") == "1"
+
+
+def read_csv_fast(path: Path, *, encoding: Optional[str] = None, sep: Optional[str] = ",") -> pd.DataFrame:
+	"""
+	Read a CSV/TSV file into pandas with the multithreaded pyarrow engine.
+
+	Every file goes through the same engine, so inferred dtypes do not depend on
+	file size. The delimiter is sniffed when sep is None. Files the pyarrow
+	engine rejects (malformed rows, unsupported encodings) are re-read with the
+	C engine; that fallback is logged since its dtype inference differs.
+	"""
+	if sep is None:
+		sep = _sniff_delimiter(path, encoding)
+	try:
+		return pd.read_csv(path, encoding=encoding, sep=sep, engine="pyarrow")
+	except (ImportError, ValueError) as e:
+		logger.debug("pyarrow CSV engine failed for %s, using the C engine: %s", path, e)
+	return pd.read_csv(path, encoding=encoding, sep=sep, engine="c", low_memory=False)
+
+
+def read_csv_filtered(
+	path: Path,
+	row_filter: Callable[[pd.DataFrame], pd.DataFrame],
+	*,
+	encoding: Optional[str] = None,
+	sep: Optional[str] = ",",
+	block_size: Optional[int] = None,
+) -> pd.DataFrame:
+	"""
+	Stream a CSV/TSV file block by block and keep only the rows row_filter returns.
+
+	Only one block (block_size bytes, pyarrow's default if None) is converted to
+	pandas at a time, so peak memory depends on the block size and the number of
+	matching rows rather than the file size. Column types are inferred from the
+	first block and fixed for the rest of the file, as the pyarrow engine of
+	read_csv_fast does, so the result has the dtypes and row labels of
+	row_filter(read_csv_fast(path)). Files the streaming reader rejects are read
+	in full with read_csv_fast instead.
+	"""
+	if sep is None:
+		sep = _sniff_delimiter(path, encoding)
+	read_options = pa_csv.ReadOptions(encoding=encoding or "utf8")
+	if block_size is not None:
+		read_options.block_size = block_size
+	convert_options = pa_csv.ConvertOptions(null_values=_PANDAS_NA_VALUES, strings_can_be_null=True)
+	frames = []
+	offset = 0
+	try:
+		with pa_csv.open_csv(
+			path,
+			read_options=read_options,
+			parse_options=pa_csv.ParseOptions(delimiter=sep),
+			convert_options=convert_options,
+		) as reader:
+			# All-null columns come back as float64, like the pyarrow engine returns them
+			schema = pa.schema([
+				field.with_type(pa.float64()) if pa.types.is_null(field.type) else field
+				for field in reader.schema
+			])
+			for batch in reader:
+				chunk = batch.cast(schema).to_pandas()
+				chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+				offset += len(chunk)
+				frames.append(row_filter(chunk))
+	except pa.ArrowInvalid as e:
+		logger.debug("Streaming CSV read failed for %s, reading it in full: %s", path, e)
+		return row_filter(read_csv_fast(path, encoding=encoding, sep=sep))
+	if not frames:
+		return schema.empty_table().to_pandas()
+	return pd.concat(frames)
+
 
 def read_table(path: Path, *, encoding: Optional[str] = None, sep: Optional[str] = None) -> pd.DataFrame:
 	lower = path.suffix.lower()
@@ -48,3 +149,36 @@ def read_table_with_meta(path: Path, *, encoding: Optional[str] = None, sep: Opt
 		return df, {"variable_labels": var_labels, "value_labels": val_labels}
 	raise ValueError(f"Unsupported file type: {path.suffix}")
 
+
+
+def _sniff_delimiter(path: Path, encoding: Optional[str]) -> str:
+	# Mirror pandas' sep=None behaviour (csv.Sniffer) on a bounded sample
+	with path.open("r", encoding=encoding or "utf-8", errors="replace", newline="") as f:
+		sample = f.read(_SNIFF_BYTES)
+	try:
+		return csv.Sniffer().sniff(sample, delimiters=",;\t|").delimiter
+	except csv.Error:
+		return ","
+
+
+def read_arrow_table(path: Path, *, encoding: Optional[str] = None, sep: Optional[str] = None) -> pa.Table:
+	"""
+	Read a CSV/TSV file directly into an Arrow table.
+
+	Uses the multithreaded Arrow CSV reader; the delimiter is sniffed when not given.
+	With SOCDATA_FAST_IO=1 and polars installed, Polars parses the file instead and
+	the Arrow reader is used as fallback.
+	"""
+	lower = path.suffix.lower()
+	if lower not in ARROW_NATIVE_SUFFIXES:
+		raise ValueError(f"Unsupported file type for Arrow reader: {path.suffix}")
+	if sep is None:
+		sep = "\t" if lower == ".tsv" else _sniff_delimiter(path, encoding)
+	if fast_io_enabled() and encoding in (None, "utf8", "utf-8"):
+		try:
+			return pl.read_csv(path, separator=sep, infer_schema_length=_POLARS_INFER_SCHEMA_LENGTH).to_arrow()
+		except (pl.exceptions.PolarsError, OSError, ValueError) as e:
+			logger.debug("Polars CSV reader failed for %s, using the Arrow reader: %s", path, e)
+	read_options = pa_csv.ReadOptions(encoding=encoding or "utf8")
+	parse_options = pa_csv.ParseOptions(delimiter=sep)
+	return pa_csv.read_csv(path, read_options=read_options, parse_options=parse_options)
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, Iterable
 
 from .config import get_config
 
@@ -13,3 +18,117 @@ def get_dataset_dir(source: str, dataset: str, version: str = "latest") -> Path:
     (base / "meta").mkdir(parents=True, exist_ok=True)
     return base
 
+
+# Bytes requested per os.copy_file_range call
+_COPY_RANGE_CHUNK = 64 * 1024 * 1024
+
+
+def _copy_file_range(src: Path, dst: Path) -> bool:
+    """Copy src to dst with os.copy_file_range; returns False if unsupported."""
+    if not hasattr(os, "copy_file_range"):  # pragma: no cover - Linux only
+        return False
+    with src.open("rb") as fsrc, dst.open("wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(
+                    fsrc.fileno(), fdst.fileno(), min(remaining, _COPY_RANGE_CHUNK)
+                )
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            # e.g. EXDEV on older kernels or filesystems without support
+            return False
+    return remaining == 0
+
+
+def cache_raw_file(src: Path, dst: Path, *, hardlink: bool = True) -> Path:
+    """
+    Place a source file in the raw cache.
+
+    Hard-links src to dst when both live on the same filesystem (and hardlink
+    is true), so no data is copied. Otherwise the data is copied in the kernel with os.copy_file_range
+    (which shares extents on copy-on-write filesystems such as Btrfs and XFS),
+    falling back to shutil.copyfile. Metadata is preserved with copystat.
+
+    Args:
+        src: Source file
+        dst: Destination path in the raw cache
+        hardlink: Try a hard link before copying
+
+    Returns:
+        The destination path
+    """
+    if dst.exists():
+        try:
+            if os.path.samefile(src, dst):
+                return dst
+        except OSError:
+            pass
+        dst.unlink()
+    if hardlink:
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            pass
+    if not _copy_file_range(src, dst):
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def write_text_atomic(path: Path, text: str, encoding: str = "utf-8") -> Path:
+    """
+    Write a text file so readers only ever see the old or the complete new content.
+
+    The text is written to a temporary file next to path and moved into place
+    with os.replace, which is atomic on the same filesystem.
+
+    Args:
+        path: Destination file
+        text: File content
+        encoding: Text encoding
+
+    Returns:
+        The destination path
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding=encoding)
+    os.replace(tmp, path)
+    return path
+
+
+def file_sha256(path: Path) -> str:
+    """
+    Compute the SHA-256 hex digest of a file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest
+    """
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def hash_files(paths: Iterable[Path]) -> Dict[str, str]:
+    """
+    Compute SHA-256 digests of several files concurrently.
+
+    hashlib releases the GIL while hashing, so files are read and hashed in
+    parallel threads.
+
+    Args:
+        paths: Files to hash (duplicates are hashed once)
+
+    Returns:
+        Mapping of str(path) to hex digest
+    """
+    unique = list(dict.fromkeys(paths))
+    if len(unique) <= 1:
+        return {str(p): file_sha256(p) for p in unique}
+    with ThreadPoolExecutor(max_workers=min(8, len(unique), os.cpu_count() or 1)) as executor:
+        return dict(zip(map(str, unique), executor.map(file_sha256, unique)))
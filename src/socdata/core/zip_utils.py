@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import os
+import shutil
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Iterator, Optional, Tuple
+
+# Data formats the adapters can ingest, and the ones preferred over CSV/TSV
+DATA_SUFFIXES: Tuple[str, ...] = (".dta", ".sav", ".zsav", ".csv", ".tsv")
+PREFERRED_SUFFIXES: Tuple[str, ...] = (".dta", ".sav", ".zsav")
+# Archive directories that hold documentation rather than data
+DOC_DIRS: Tuple[str, ...] = ("doc",)
+
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def walk_files(directory: str | os.PathLike, skip_dirs: Tuple[str, ...] = DOC_DIRS) -> Iterator[os.DirEntry]:
+    """
+    Yield the file entries below directory, pruning skip_dirs subdirectories.
+
+    Uses os.scandir, so entry types (and, on most platforms, sizes via
+    entry.stat()) come from the directory listing without a stat call per file.
+
+    Args:
+        directory: Root of the tree to walk
+        skip_dirs: Directory names that are not descended into
+
+    Returns:
+        Iterator over os.DirEntry objects for regular files and symlinks
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in skip_dirs:
+                    yield from walk_files(entry.path, skip_dirs)
+            else:
+                yield entry
+
+
+def _is_documentation(member: PurePosixPath, skip_dirs: Tuple[str, ...]) -> bool:
+    name = member.name.lower()
+    return (
+        any(part in skip_dirs for part in member.parts[:-1])
+        or "readme" in name
+        or "codebook" in name
+    )
+
+
+def select_data_member(
+    zf: zipfile.ZipFile,
+    *,
+    suffixes: Tuple[str, ...] = DATA_SUFFIXES,
+    preferred: Tuple[str, ...] = PREFERRED_SUFFIXES,
+    skip_dirs: Tuple[str, ...] = DOC_DIRS,
+    min_size: int = 0,
+) -> Optional[zipfile.ZipInfo]:
+    """
+    Pick the main data file of an archive from its central directory.
+
+    Documentation directories, readmes and codebooks are skipped. Preferred
+    formats win over the others, then the largest (uncompressed) file.
+
+    Args:
+        zf: Open ZIP archive
+        suffixes: Lowercase file suffixes that count as data files
+        preferred: Suffixes ranked ahead of the rest
+        skip_dirs: Directory names whose members are never selected
+        min_size: Members smaller than this many bytes are ignored
+
+    Returns:
+        The selected ZipInfo, or None if the archive holds no data file
+    """
+    best: Optional[zipfile.ZipInfo] = None
+    best_key: Optional[Tuple[int, int]] = None
+    for info in zf.infolist():
+        if info.is_dir():
+            continue
+        member = PurePosixPath(info.filename)
+        lower = member.name.lower()
+        if not lower.endswith(suffixes) or info.file_size < min_size:
+            continue
+        if _is_documentation(member, skip_dirs):
+            continue
+        key = (0 if lower.endswith(preferred) else 1, -info.file_size)
+        if best_key is None or key < best_key:
+            best, best_key = info, key
+    return best
+
+
+def extract_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo, extract_dir: Path) -> Path:
+    """
+    Stream a single archive member to disk.
+
+    The member keeps its relative path below extract_dir. Data is written to a
+    '.part' file first and moved into place, so an interrupted extraction never
+    leaves a truncated file under the final name.
+
+    Args:
+        zf: Open ZIP archive
+        info: Member to extract
+        extract_dir: Destination directory
+
+    Returns:
+        Path to the extracted file
+    """
+    # Drop absolute and parent components like ZipFile.extract does
+    parts = [p for p in PurePosixPath(info.filename).parts if p not in ("", "/", "..")]
+    target = extract_dir.joinpath(*parts)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(target.name + ".part")
+    with zf.open(info) as src, tmp.open("wb") as dst:
+        shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+    os.replace(tmp, target)
+    return target
+
+
+def extract_data_file(
+    zip_path: Path,
+    extract_dir: Path,
+    *,
+    skip_dirs: Tuple[str, ...] = DOC_DIRS,
+    min_size: int = 0,
+) -> Optional[Path]:
+    """
+    Extract only the main data file of a ZIP archive.
+
+    Args:
+        zip_path: Path to the ZIP archive
+        extract_dir: Destination directory
+        skip_dirs: Directory names whose members are never selected
+        min_size: Members smaller than this many bytes are ignored
+
+    Returns:
+        Path to the extracted data file, or None if the archive holds no data file
+    """
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        info = select_data_member(zf, skip_dirs=skip_dirs, min_size=min_size)
+        if info is None:
+            return None
+        extract_dir.mkdir(parents=True, exist_ok=True)
+        return extract_member(zf, info, extract_dir)
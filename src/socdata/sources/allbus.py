@@ -7,18 +7,22 @@ Data is available from https://www.gesis.org/allbus/
 
 from __future__ import annotations
 
+import os
+import re
+import shutil
 import zipfile
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
-import re
 
 import pandas as pd
 
 from .base import BaseAdapter
 from ..core.types import DatasetSummary
 from ..core.models import IngestionManifest
-from ..core.storage import get_dataset_dir
+from ..core.storage import get_dataset_dir, write_text_atomic
 from ..core.download import download_file
+from ..core.zip_utils import DATA_SUFFIXES, PREFERRED_SUFFIXES, walk_files
 
 
 class ALLBUSAdapter(BaseAdapter):
@@ -271,24 +275,25 @@ class ALLBUSAdapter(BaseAdapter):
             with zipfile.ZipFile(path, "r") as zf:
                 zf.extractall(extract_dir)
             
-            # Find data files
-            candidates: List[tuple[int, Path]] = []
-            for p in extract_dir.rglob("*"):
-                if p.is_file() and p.suffix.lower() in {".dta", ".sav", ".zsav", ".csv", ".tsv"}:
-                    if p.stat().st_size < 1024:
+            # Find data files (scandir entries carry their type, and one stat per candidate suffices)
+            candidates: List[tuple[int, os.DirEntry]] = []
+            for entry in walk_files(extract_dir, skip_dirs=()):
+                if entry.name.lower().endswith(DATA_SUFFIXES):
+                    size = entry.stat().st_size
+                    if size < 1024:
                         continue
-                    candidates.append((p.stat().st_size, p))
+                    candidates.append((size, entry))
             
             if not candidates:
                 raise ValueError(f"No supported data files found in ALLBUS ZIP: {path}")
             
-            def rank(p: Path) -> int:
-                if p.suffix.lower() in {".dta", ".sav", ".zsav"}:
+            def rank(entry: os.DirEntry) -> int:
+                if entry.name.lower().endswith(PREFERRED_SUFFIXES):
                     return 0
                 return 1
             
-            candidates.sort(key=lambda t: (rank(t[1]), -t[0]))
-            target_file = candidates[0][1]
+            _size, best = min(candidates, key=lambda t: (rank(t[1]), -t[0]))
+            target_file = Path(best.path)
             
             if not dataset_id or dataset_name == "allbus-unknown":
                 dataset_name = self._detect_allbus_year(target_file)
@@ -306,7 +311,7 @@ class ALLBUSAdapter(BaseAdapter):
         # Write to cache
         cache_dir = get_dataset_dir("allbus", dataset_name, version)
         manifest = IngestionManifest(
-            timestamp=pd.Timestamp.utcnow().to_pydatetime(),
+            timestamp=datetime.now(timezone.utc),
             adapter="allbus",
             parameters={
                 "file_path": str(path),
@@ -326,19 +331,15 @@ class ALLBUSAdapter(BaseAdapter):
         meta_dir = cache_dir / "meta"
         proc_dir = cache_dir / "processed"
         raw_dir = cache_dir / "raw"
-        meta_dir.mkdir(parents=True, exist_ok=True)
-        proc_dir.mkdir(parents=True, exist_ok=True)
-        raw_dir.mkdir(parents=True, exist_ok=True)
         
         # Copy original file to raw cache
-        import shutil
         if path.suffix.lower() == ".zip":
             shutil.copy2(path, raw_dir / path.name)
         else:
             shutil.copy2(target_file, raw_dir / target_file.name)
         
         manifest_path = meta_dir / "ingestion_manifest.json"
-        manifest_path.write_text(manifest.to_json(), encoding="utf-8")
+        write_text_atomic(manifest_path, manifest.to_json())
         
         # Save normalized parquet with Arrow metadata
         out_path = proc_dir / "data.parquet"
@@ -1,21 +1,189 @@
 from __future__ import annotations
 
+import atexit
+import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
 from ..core.config import get_config
 from ..core.exceptions import MetadataError, ParserError, StorageError
 from ..core.logging import get_logger
-from ..core.parsers import read_table, read_table_with_meta
+from ..core.parsers import read_arrow_table, read_table, read_table_with_meta
+from ..core.serialization import dumps_bytes, loads
+from ..core.storage import cache_raw_file, file_sha256
 from ..core.types import DatasetSummary
 
 logger = get_logger(__name__)
 
+# Default keyword arguments for pyarrow.parquet.write_table. ZSTD yields noticeably
+# smaller files than Snappy at similar decode throughput, and column statistics
+# allow readers to skip row groups when filtering; the page index lets readers
+# that support it prune individual pages as well. Compression and row-group size
+# can be overridden via the config (parquet_compression, parquet_row_group_size).
+PARQUET_WRITE_OPTIONS: Dict[str, Any] = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "row_group_size": 128_000,
+    "use_dictionary": True,
+    "data_page_size": 1_048_576,
+    "write_statistics": True,
+    "write_page_index": True,
+}
+
+
+# Executor for post-ingest housekeeping (e.g. search indexing) that callers do not
+# need to wait for. Pending tasks are joined at interpreter shutdown.
+_BACKGROUND_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="socdata-bg")
+atexit.register(_BACKGROUND_EXECUTOR.shutdown, wait=True)
+
+# Parquet writes that run alongside a caller waiting for them (see
+# _write_arrow_overlapped). Kept apart from _BACKGROUND_EXECUTOR so queued
+# indexing or raw-copy jobs never delay a write.
+_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="socdata-write")
+atexit.register(_WRITE_EXECUTOR.shutdown, wait=True)
+
+
+def parquet_write_options(row_group_size: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Return Parquet write options with config overrides applied.
+    
+    Args:
+        row_group_size: Optional adapter-specific row group size; takes
+            precedence over the configured default
+    """
+    cfg = get_config()
+    options = dict(PARQUET_WRITE_OPTIONS)
+    options["compression"] = cfg.parquet_compression
+    options["compression_level"] = cfg.parquet_compression_level
+    options["row_group_size"] = row_group_size or cfg.parquet_row_group_size
+    if options["compression_level"] is None:
+        # Codecs such as snappy do not accept a level
+        del options["compression_level"]
+    return options
+
+
+def _filters_to_dnf(filters: Dict[str, Any], schema_names: List[str]) -> Optional[List[Tuple[str, str, Any]]]:
+    """
+    Translate socdata filters into a pyarrow DNF predicate list.
+    
+    Lists become 'in' predicates and scalars become '=='. Keys that are not
+    columns of the file and None values are left to the post-read filter.
+    
+    Returns:
+        List of (column, op, value) tuples, or None if nothing can be pushed down
+    """
+    names = set(schema_names)
+    predicates: List[Tuple[str, str, Any]] = []
+    for key, value in filters.items():
+        if key not in names or value is None:
+            continue
+        if isinstance(value, list):
+            predicates.append((key, "in", value))
+        else:
+            predicates.append((key, "==", value))
+    return predicates or None
+
+
+# Upper bound on distinct values for automatic dictionary encoding
+_MAX_DICTIONARY_SIZE = 65_536
+
+
+def _read_parquet_table(
+    parquet_path: Path,
+    *,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+    arrow_dtypes: bool = False,
+) -> pd.DataFrame:
+    """
+    Read a cached Parquet file through a memory map and convert it to pandas.
+    
+    Pages are served from the OS page cache instead of being copied into a
+    separate read buffer. split_blocks gives every column its own pandas block,
+    so wide tables are not consolidated into one large copy, and self_destruct
+    releases each Arrow column as soon as its pandas counterpart has been built.
+    With arrow_dtypes the columns keep their Arrow buffers (pd.ArrowDtype)
+    instead of being converted to NumPy or Python-object arrays.
+    """
+    table = pq.read_table(parquet_path, columns=columns, filters=filters, memory_map=True)
+    return table.to_pandas(
+        self_destruct=True,
+        split_blocks=True,
+        types_mapper=pd.ArrowDtype if arrow_dtypes else None,
+    )
+
+
+def _trim_strings(col: pd.Series) -> pd.Series:
+    """
+    Strip surrounding whitespace from a string column, keeping missing values.
+    
+    The result is converted back the way pyarrow converts Parquet string
+    columns, so ingest and load return the same dtype. Non-string values in
+    mixed object columns are stringified; columns that hold no strings at all
+    (e.g. dates or all-null columns) are returned unchanged.
+    """
+    try:
+        arr = pa.array(col, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        arr = pa.array(col.where(col.isna(), col.astype(str)), type=pa.string(), from_pandas=True)
+    if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+        return col
+    trimmed = pc.utf8_trim_whitespace(arr).to_pandas()
+    trimmed.index = col.index
+    trimmed.name = col.name
+    return trimmed
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float, np.number)) and not isinstance(value, bool)
+
+
+def _column_matches(col: pd.Series, value: Any) -> np.ndarray:
+    """
+    Evaluate one equality/membership filter to a NumPy boolean mask.
+    
+    Arrow-backed columns are compared with pyarrow compute kernels and NumPy
+    numeric columns with NumPy directly, bypassing pandas' operator dispatch.
+    Everything else (and any type mismatch) goes through Series.isin / ==.
+    Missing values never match.
+    """
+    values = value if isinstance(value, list) else [value]
+    if isinstance(col.array, pd.arrays.ArrowExtensionArray):
+        try:
+            arr = pa.array(col.array)
+            if isinstance(value, list):
+                matches = pc.is_in(arr, value_set=pa.array(value, type=arr.type))
+            else:
+                matches = pc.equal(arr, pa.scalar(value, type=arr.type))
+            return matches.fill_null(False).to_numpy(zero_copy_only=False)
+        except (pa.ArrowException, TypeError, ValueError):
+            pass
+    elif isinstance(col.dtype, np.dtype) and col.dtype.kind in "iuf" and all(map(_is_number, values)):
+        data = col.to_numpy()
+        return np.isin(data, values) if isinstance(value, list) else data == value
+    matches = col.isin(value) if isinstance(value, list) else col == value
+    return matches.to_numpy(dtype=bool, na_value=False)
+
 
 class BaseAdapter(ABC):
+    # Low-cardinality columns stored as Arrow dictionary (categorical) columns in the cache
+    categorical_columns: Tuple[str, ...] = ()
+    # If set, other string columns with fewer distinct values than this share of rows are too
+    dictionary_cardinality_ratio: Optional[float] = None
+    # Rows per Parquet row group for this source; None uses the configured default
+    parquet_row_group_size: Optional[int] = None
+    # Hard-link source files into the raw cache instead of copying them. The link
+    # shares the inode, so later in-place edits of the source show up in the cache.
+    hardlink_raw: bool = True
+
     @abstractmethod
     def list_datasets(self) -> List[DatasetSummary]:  # lightweight built-ins
         raise NotImplementedError
@@ -27,6 +195,69 @@ class BaseAdapter(ABC):
     def ingest(self, dataset_id: str | None, *, file_path: str) -> pd.DataFrame:  # optional for manual adapters
         raise NotImplementedError
 
+    def ingest_and_load(
+        self, dataset_id: str | None, *, file_path: str, filters: Optional[Dict[str, Any]] = None
+    ) -> pd.DataFrame:
+        """
+        Ingest a file and return the filtered frame without re-reading the cache.
+        
+        ingest() already returns the normalized frame that was written to
+        Parquet, so filtering it in memory saves the decompression pass that
+        a load() right after ingest() would cost.
+        
+        Args:
+            dataset_id: Dataset identifier passed to ingest()
+            file_path: Path to the data file
+            filters: Optional row filters (same semantics as load())
+        
+        Returns:
+            Normalized, filtered DataFrame
+        """
+        df = self.ingest(dataset_id, file_path=file_path)
+        if filters:
+            df = self._apply_filters(df, filters)
+        return df
+
+    def _apply_filters(self, df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Apply equality/membership filters to a DataFrame.
+        
+        All predicates are combined into a single boolean mask, so the frame is
+        indexed once. Keys that are not columns are ignored; if none of them is
+        a column, df is returned as is.
+        
+        Args:
+            df: DataFrame to filter
+            filters: Mapping of column to value (list values match any element)
+        
+        Returns:
+            Filtered DataFrame
+        """
+        applicable = {key: value for key, value in filters.items() if key in df.columns}
+        if not applicable:
+            return df
+        mask: Optional[np.ndarray] = None
+        for key, value in applicable.items():
+            matches = _column_matches(df[key], value)
+            mask = matches if mask is None else mask & matches
+        return df.loc[mask]
+
+    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Normalize column names and string values.
+        
+        Mutates and returns df; callers pass a frame they just read. String
+        columns are trimmed with Arrow's UTF-8 kernel; missing values stay
+        missing and the columns keep the dtype load() returns for them.
+        """
+        names = [str(c).strip().lower() for c in df.columns]
+        # Leave the column index alone when the names are already normalized
+        if names != list(df.columns):
+            df.columns = names
+        for col in df.select_dtypes(include=["object", "string"]).columns:
+            df[col] = _trim_strings(df[col])
+        return df
+
     def _read_table_with_meta_fallback(
         self, path: Path, *, encoding: str | None = None, sep: str | None = None
     ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
@@ -46,15 +277,17 @@ class BaseAdapter(ABC):
         except (ParserError, MetadataError) as e:
             # Expected errors - log and fallback
             logger.warning(
-                f"Failed to read metadata from {path}, falling back to basic read: {e}",
-                exc_info=True
+                "Failed to read metadata from %s, falling back to basic read: %s",
+                path, e,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
             )
             df = read_table(path, encoding=encoding, sep=sep)
             return df, {"variable_labels": {}, "value_labels": {}}
         except Exception as e:
             # Unexpected errors - log with full traceback
             logger.error(
-                f"Unexpected error reading metadata from {path}: {e}",
+                "Unexpected error reading metadata from %s: %s",
+                path, e,
                 exc_info=True
             )
             # Still try to fallback to basic read
@@ -62,9 +295,130 @@ class BaseAdapter(ABC):
                 df = read_table(path, encoding=encoding, sep=sep)
                 return df, {"variable_labels": {}, "value_labels": {}}
             except Exception as e2:
-                logger.error(f"Fallback read also failed for {path}: {e2}", exc_info=True)
+                logger.error("Fallback read also failed for %s: %s", path, e2, exc_info=True)
                 raise ParserError(f"Failed to read file {path}: {e2}") from e2
 
+    def _read_arrow_with_meta_fallback(
+        self, path: Path, *, encoding: str | None = None, sep: str | None = None
+    ) -> Tuple[pa.Table, Dict[str, Any]]:
+        """
+        Read a CSV/TSV file directly into an Arrow table.
+        
+        Falls back to the pandas reader (and converts the result) if the Arrow
+        CSV reader cannot parse the file.
+        
+        Args:
+            path: Path to the file
+            encoding: Optional encoding
+            sep: Optional separator
+        
+        Returns:
+            Tuple of (Arrow table, metadata dict)
+        """
+        try:
+            return read_arrow_table(path, encoding=encoding, sep=sep), {"variable_labels": {}, "value_labels": {}}
+        except Exception as e:
+            logger.warning(
+                "Arrow CSV reader failed for %s, falling back to pandas: %s",
+                path, e,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
+            df, meta = self._read_table_with_meta_fallback(path, encoding=encoding, sep=sep)
+            return pa.Table.from_pandas(df, preserve_index=False), meta
+
+    def _normalize_arrow(self, table: pa.Table) -> pa.Table:
+        """Normalize column names and trim string values using Arrow compute kernels."""
+        names = [str(c).strip().lower() for c in table.column_names]
+        if names != table.column_names:
+            table = table.rename_columns(names)
+        for i, field in enumerate(table.schema):
+            if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+                table = table.set_column(i, field.name, pc.utf8_trim_whitespace(table.column(i)))
+        return table
+
+    def _dictionary_encode_columns(self, table: pa.Table) -> pa.Table:
+        """
+        Dictionary-encode categorical string columns present in table.
+        
+        Covers the adapter's categorical_columns and, when
+        dictionary_cardinality_ratio is set, any other string column whose
+        distinct count is below max(64, ratio * rows). Parquet already
+        dictionary-encodes pages of every column; this also keeps the Arrow
+        dictionary type in the file so the columns load back as categoricals.
+        Only string columns are converted since Parquet stores the Arrow
+        dictionary type for those alone.
+        """
+        if not self.categorical_columns and self.dictionary_cardinality_ratio is None:
+            return table
+        explicit = set(self.categorical_columns)
+        max_distinct = None
+        if self.dictionary_cardinality_ratio is not None:
+            max_distinct = min(
+                max(64, int(table.num_rows * self.dictionary_cardinality_ratio)), _MAX_DICTIONARY_SIZE
+            )
+        for idx, field in enumerate(table.schema):
+            if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+                continue
+            column = table.column(idx)
+            if field.name not in explicit and (
+                max_distinct is None or pc.count_distinct(column).as_py() >= max_distinct
+            ):
+                continue
+            table = table.set_column(idx, field.name, pc.dictionary_encode(column))
+        return table
+
+    def _dictionary_encode_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert the columns _dictionary_encode_columns would encode to categoricals, in place.
+        
+        The Parquet file keeps those columns dictionary encoded and load() reads
+        them back as categoricals; converting them here lets ingest return the
+        same dtypes. Frames Arrow cannot convert are returned unchanged, as the
+        writer then falls back to pandas and stores no dictionaries either.
+        """
+        if not self.categorical_columns and self.dictionary_cardinality_ratio is None:
+            return df
+        strings = df.select_dtypes(include=["object", "string"])
+        if strings.empty:
+            return df
+        try:
+            table = self._dictionary_encode_columns(pa.Table.from_pandas(strings, preserve_index=False))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return df
+        for idx, field in enumerate(table.schema):
+            if pa.types.is_dictionary(field.type):
+                df[field.name] = table.column(idx).to_pandas().array
+        return df
+
+    def _socdata_schema_metadata(
+        self,
+        *,
+        dataset_id: str,
+        source: str,
+        adapter: str,
+        manifest_path: Path,
+        variable_labels: Dict[str, str],
+        value_labels: Dict[str, Dict[str, str]],
+        manifest_json: Optional[str] = None,
+    ) -> Dict[bytes, bytes]:
+        """
+        Build the socdata.* key/value pairs stored in the Parquet schema metadata.
+        
+        When manifest_json is given it is embedded as socdata.manifest_json, so
+        readers can recover the manifest from the Parquet file alone.
+        """
+        aug = {
+            b"socdata.dataset_id": dataset_id.encode("utf-8"),
+            b"socdata.source": source.encode("utf-8"),
+            b"socdata.adapter": adapter.encode("utf-8"),
+            b"socdata.manifest_path": str(manifest_path).encode("utf-8"),
+            b"socdata.variable_labels": dumps_bytes(variable_labels),
+            b"socdata.value_labels": dumps_bytes(value_labels),
+        }
+        if manifest_json is not None:
+            aug[b"socdata.manifest_json"] = manifest_json.encode("utf-8")
+        return aug
+
     def _write_parquet_with_metadata(
         self,
         df: pd.DataFrame,
@@ -76,6 +430,7 @@ class BaseAdapter(ABC):
         manifest_path: Path,
         variable_labels: Dict[str, str],
         value_labels: Dict[str, Dict[str, str]],
+        manifest_json: Optional[str] = None,
     ) -> bool:
         """
         Write DataFrame to Parquet with metadata, best-effort.
@@ -89,34 +444,31 @@ class BaseAdapter(ABC):
             manifest_path: Path to manifest file
             variable_labels: Variable labels dict
             value_labels: Value labels dict
+            manifest_json: Serialized manifest to embed, if any
         
         Returns:
             True if successful, False otherwise
         """
         try:
-            import json as _json
-            import pyarrow as pa
-            import pyarrow.parquet as pq
-
-            table = pa.Table.from_pandas(df, preserve_index=False)
-            meta_bytes = table.schema.metadata or {}
-            aug = {
-                b"socdata.dataset_id": dataset_id.encode("utf-8"),
-                b"socdata.source": source.encode("utf-8"),
-                b"socdata.adapter": adapter.encode("utf-8"),
-                b"socdata.manifest_path": str(manifest_path).encode("utf-8"),
-                b"socdata.variable_labels": _json.dumps(variable_labels).encode("utf-8"),
-                b"socdata.value_labels": _json.dumps(value_labels).encode("utf-8"),
-            }
-            new_schema = table.schema.with_metadata({**meta_bytes, **aug})
-            table = table.replace_schema_metadata(new_schema.metadata)
-            pq.write_table(table, output_path)
+            table = self._dictionary_encode_columns(pa.Table.from_pandas(df, preserve_index=False))
+            aug = self._socdata_schema_metadata(
+                dataset_id=dataset_id,
+                source=source,
+                adapter=adapter,
+                manifest_path=manifest_path,
+                variable_labels=variable_labels,
+                value_labels=value_labels,
+                manifest_json=manifest_json,
+            )
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}), **aug})
+            pq.write_table(table, output_path, **parquet_write_options(self.parquet_row_group_size))
             return True
         except (OSError, IOError, PermissionError) as e:
             # File system errors - log and try fallback
             logger.warning(
-                f"Failed to write Parquet metadata for {dataset_id} (filesystem error): {e}",
-                exc_info=True
+                "Failed to write Parquet metadata for %s (filesystem error): %s",
+                dataset_id, e,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
             )
             # Fallback: write without metadata
             try:
@@ -124,15 +476,17 @@ class BaseAdapter(ABC):
                 return True
             except Exception as e2:
                 logger.error(
-                    f"Failed to write Parquet file {output_path}: {e2}",
+                    "Failed to write Parquet file %s: %s",
+                    output_path, e2,
                     exc_info=True
                 )
                 raise StorageError(f"Failed to write Parquet file {output_path}: {e2}") from e2
         except Exception as e:
             # Other errors (e.g., pyarrow errors) - log and try fallback
             logger.warning(
-                f"Failed to write Parquet metadata for {dataset_id}: {e}",
-                exc_info=True
+                "Failed to write Parquet metadata for %s: %s",
+                dataset_id, e,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
             )
             # Fallback: write without metadata
             try:
@@ -140,11 +494,88 @@ class BaseAdapter(ABC):
                 return True
             except Exception as e2:
                 logger.error(
-                    f"Failed to write Parquet file {output_path}: {e2}",
+                    "Failed to write Parquet file %s: %s",
+                    output_path, e2,
                     exc_info=True
                 )
                 raise StorageError(f"Failed to write Parquet file {output_path}: {e2}") from e2
 
+    def _write_arrow_with_metadata(
+        self,
+        table: pa.Table,
+        output_path: Path,
+        *,
+        dataset_id: str,
+        source: str,
+        adapter: str,
+        manifest_path: Path,
+        variable_labels: Dict[str, str],
+        value_labels: Dict[str, Dict[str, str]],
+        manifest_json: Optional[str] = None,
+    ) -> bool:
+        """
+        Write an Arrow table to Parquet with metadata, best-effort.
+        
+        Same contract as _write_parquet_with_metadata, but skips the
+        pandas-to-Arrow conversion for tables that are already in Arrow.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            table = self._dictionary_encode_columns(table)
+            aug = self._socdata_schema_metadata(
+                dataset_id=dataset_id,
+                source=source,
+                adapter=adapter,
+                manifest_path=manifest_path,
+                variable_labels=variable_labels,
+                value_labels=value_labels,
+                manifest_json=manifest_json,
+            )
+            pq.write_table(
+                table.replace_schema_metadata({**(table.schema.metadata or {}), **aug}),
+                output_path,
+                **parquet_write_options(self.parquet_row_group_size),
+            )
+            return True
+        except Exception as e:
+            logger.warning(
+                "Failed to write Parquet metadata for %s: %s",
+                dataset_id, e,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
+            # Fallback: write without metadata
+            try:
+                pq.write_table(table, output_path)
+                return True
+            except Exception as e2:
+                logger.exception("Failed to write Parquet file %s", output_path)
+                raise StorageError(f"Failed to write Parquet file {output_path}: {e2}") from e2
+
+    def _write_arrow_overlapped(self, table: pa.Table, **write_kwargs: Any) -> pd.DataFrame:
+        """
+        Write an Arrow table to Parquet while converting it to pandas.
+        
+        The Parquet writer and to_pandas both run in Arrow C++ with the GIL
+        released, so the write proceeds on a background thread while the
+        calling thread builds the DataFrame that ingest returns.
+        
+        Args:
+            table: Normalized table to cache
+            **write_kwargs: Keyword arguments for _write_arrow_with_metadata
+        
+        Returns:
+            The table as a DataFrame
+        """
+        write_future = _WRITE_EXECUTOR.submit(self._write_arrow_with_metadata, table, **write_kwargs)
+        try:
+            df = table.to_pandas()
+        finally:
+            # Wait for the file to be complete and surface write errors (StorageError)
+            write_future.result()
+        return df
+
     def _index_dataset_safe(self, dataset_id: str, manifest_path: Path) -> bool:
         """
         Index dataset from manifest, best-effort.
@@ -157,54 +588,147 @@ class BaseAdapter(ABC):
             True if successful, False otherwise
         """
         try:
-            from ..core.registry import index_dataset_from_manifest
             from ..core.exceptions import SearchIndexError
+            from ..core.registry import index_dataset_from_manifest
             
             index_dataset_from_manifest(dataset_id, str(manifest_path))
             return True
         except SearchIndexError as e:
             # Expected index errors - log but don't fail ingestion
             logger.warning(
-                f"Failed to index dataset {dataset_id} from manifest {manifest_path}: {e}",
+                "Failed to index dataset %s from manifest %s: %s",
+                dataset_id, manifest_path, e,
                 exc_info=True
             )
             return False
         except Exception as e:
             # Unexpected errors - log with full traceback
             logger.error(
-                f"Unexpected error indexing dataset {dataset_id} from manifest {manifest_path}: {e}",
+                "Unexpected error indexing dataset %s from manifest %s: %s",
+                dataset_id, manifest_path, e,
                 exc_info=True
             )
             return False
 
-    def _read_parquet_optimized(self, parquet_path: Path, *, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    def _index_dataset_async(self, dataset_id: str, manifest_path: Path) -> Future:
         """
-        Read Parquet file with optional lazy loading and column selection.
+        Index dataset from manifest on a background thread.
+        
+        The dataset may not show up in search results until the returned future
+        has completed; pending indexing is finished before the interpreter exits.
+        
+        Args:
+            dataset_id: Dataset identifier
+            manifest_path: Path to manifest file
+        
+        Returns:
+            Future resolving to the result of _index_dataset_safe
+        """
+        return _BACKGROUND_EXECUTOR.submit(self._index_dataset_safe, dataset_id, manifest_path)
+
+    def _manifest_has_source_hash(self, manifest_path: Path, source_hash: str) -> bool:
+        """
+        Check whether a previous ingestion manifest recorded the given source hash.
+        
+        Used to skip re-ingesting a file whose processed output is already cached.
+        Unreadable or missing manifests never match.
+        """
+        try:
+            manifest = loads(manifest_path.read_bytes())
+        except (OSError, ValueError):
+            return False
+        hashes = manifest.get("source_hashes") if isinstance(manifest, dict) else None
+        return isinstance(hashes, dict) and source_hash in hashes.values()
+
+    def _cache_raw_file_async(self, src: Path, dst: Path) -> Future:
+        """
+        Link or copy a source file into the raw cache on a background thread.
+        
+        Lets ingest overlap the raw-cache I/O with the Parquet write; callers
+        must wait on the returned future before returning.
+        
+        Args:
+            src: Source file
+            dst: Destination path in the raw cache
+        
+        Returns:
+            Future resolving to the destination path
+        """
+        return _BACKGROUND_EXECUTOR.submit(cache_raw_file, src, dst, hardlink=self.hardlink_raw)
+
+    def _file_sha256_async(self, path: Path) -> Future:
+        """
+        Hash a source file on a background thread.
+        
+        Lets ingest record the source hash in its manifest without hashing
+        up front; callers must wait on the returned future before returning.
+        
+        Args:
+            path: Source file
+        
+        Returns:
+            Future resolving to the hex SHA-256 digest
+        """
+        return _BACKGROUND_EXECUTOR.submit(file_sha256, path)
+
+    def _read_parquet_optimized(
+        self,
+        parquet_path: Path,
+        *,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> pd.DataFrame:
+        """
+        Read Parquet file with optional lazy loading, column selection and predicate pushdown.
+        
+        Equality and list filters on existing columns are passed to the Parquet
+        reader so that non-matching row groups are skipped. Callers should still
+        apply their filters to the result for keys that cannot be pushed down.
         
         Args:
             parquet_path: Path to Parquet file
             columns: Optional list of columns to read (for lazy loading)
+            filters: Optional filters to push down into the reader
         
         Returns:
             DataFrame with the data
         """
         cfg = get_config()
+        read_columns = columns if cfg.enable_lazy_loading and columns else None
+        
+        predicates = None
+        if filters or read_columns:
+            try:
+                schema_names = pq.read_schema(parquet_path, memory_map=True).names
+            except (OSError, pa.ArrowException) as e:
+                logger.debug("Could not read Parquet schema of %s: %s", parquet_path, e)
+            else:
+                if filters:
+                    predicates = _filters_to_dnf(filters, schema_names)
+                if read_columns and not set(read_columns).issubset(schema_names):
+                    # Selecting a missing column would fail; go straight to the full read
+                    read_columns = None
+        
+        arrow_dtypes = cfg.arrow_dtypes
+        if predicates:
+            try:
+                return _read_parquet_table(
+                    parquet_path, columns=read_columns, filters=predicates, arrow_dtypes=arrow_dtypes
+                )
+            except (pa.ArrowException, TypeError, ValueError) as e:
+                # e.g. filter value type does not match the column type
+                logger.debug("Predicate pushdown failed for %s, reading without it: %s", parquet_path, e)
         
-        if cfg.enable_lazy_loading and columns:
-            # Lazy loading: only read specified columns
+        if read_columns:
             try:
-                import pyarrow.parquet as pq
-                # Read only specified columns for better performance
-                table = pq.read_table(parquet_path, columns=columns)
-                return table.to_pandas()
+                return _read_parquet_table(parquet_path, columns=read_columns, arrow_dtypes=arrow_dtypes)
             except Exception as e:
                 logger.warning(
-                    f"Failed to read Parquet with column selection, falling back to full read: {e}",
-                    exc_info=True
+                    "Failed to read Parquet with column selection, falling back to full read: %s",
+                    e,
+                    exc_info=logger.isEnabledFor(logging.DEBUG)
                 )
                 # Fallback to full read
-                return pd.read_parquet(parquet_path)
-        else:
-            # Standard read - load all columns
-            return pd.read_parquet(parquet_path)
-
+                return _read_parquet_table(parquet_path, arrow_dtypes=arrow_dtypes)
+        # Standard read - load all columns
+        return _read_parquet_table(parquet_path, arrow_dtypes=arrow_dtypes)
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-import zipfile
+import re
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
-import re
 
 import pandas as pd
 
 from .base import BaseAdapter
 from ..core.types import DatasetSummary
 from ..core.models import IngestionManifest
-from ..core.storage import get_dataset_dir
+from ..core.storage import get_dataset_dir, write_text_atomic
 from ..core.download import download_file
+from ..core.parsers import ARROW_NATIVE_SUFFIXES
+from ..core.zip_utils import extract_data_file
+
+_MODULE_RE = re.compile(r"MODULE[_\s]?(\d+)")
 
 
 class CSESAdapter(BaseAdapter):
@@ -97,25 +101,6 @@ class CSESAdapter(BaseAdapter):
             "CSES data requires registration and download from https://cses.org/"
         )
 
-    def _apply_filters(self, df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
-        """Apply filters to DataFrame."""
-        result = df.copy()
-        for key, value in filters.items():
-            if key in result.columns:
-                if isinstance(value, list):
-                    result = result[result[key].isin(value)]
-                else:
-                    result = result[result[key] == value]
-        return result
-
-    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Normalize column names and string values."""
-        df = df.copy()
-        df.columns = [str(c).strip().lower() for c in df.columns]
-        for col in df.select_dtypes(include=["object"]).columns:
-            df[col] = df[col].astype(str).str.strip()
-        return df
-
     def _detect_cses_module(self, file_path: Path) -> str:
         """
         Try to detect CSES module from filename or content.
@@ -132,7 +117,7 @@ class CSESAdapter(BaseAdapter):
             return "cses-integrated"
         
         # Check for module pattern
-        module_match = re.search(r"MODULE[_\s]?(\d+)", name)
+        module_match = _MODULE_RE.search(name)
         if module_match:
             module_num = module_match.group(1)
             return f"cses-module-{module_num}"
@@ -148,33 +133,14 @@ class CSESAdapter(BaseAdapter):
         - Documentation files (.pdf, .txt)
         - Codebooks
         """
-        extract_dir.mkdir(parents=True, exist_ok=True)
-        
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            zf.extractall(extract_dir)
-        
-        # Find data files (prefer SPSS/Stata, then largest CSV)
-        candidates: List[tuple[int, Path]] = []
-        for p in extract_dir.rglob("*"):
-            if p.is_file() and p.suffix.lower() in {".dta", ".sav", ".zsav", ".csv", ".tsv"}:
-                # Skip documentation subdirectories
-                if "doc" in p.parts or "readme" in p.name.lower() or "codebook" in p.name.lower():
-                    continue
-                candidates.append((p.stat().st_size, p))
-        
-        if not candidates:
+        # Only the selected data file is decompressed; docs and codebooks stay in the archive.
+        # The shared ranking (SPSS/Stata before CSV/TSV, then largest) is the one CSES uses.
+        target = extract_data_file(zip_path, extract_dir)
+        if target is None:
             raise ValueError(
                 f"No supported data files (.dta/.sav/.zsav/.csv/.tsv) found in CSES ZIP: {zip_path}"
             )
-        
-        # Prefer SPSS/Stata formats, then largest file
-        def rank(p: Path) -> int:
-            if p.suffix.lower() in {".dta", ".sav", ".zsav"}:
-                return 0
-            return 1
-        
-        candidates.sort(key=lambda t: (rank(t[1]), -t[0]))
-        return candidates[0][1]
+        return target
 
     def ingest(self, dataset_id: str | None, *, file_path: str) -> pd.DataFrame:
         """
@@ -188,13 +154,19 @@ class CSESAdapter(BaseAdapter):
             Normalized DataFrame
         """
         path = Path(file_path)
+        downloaded = False
         
         # Handle URL downloads
+        # ZIP archives keep their central directory at the end of the file, so
+        # extraction cannot start before the download is complete. The download
+        # stays in downloads/temp so a re-ingest can reuse it; the raw cache
+        # below links to it rather than copying it a second time.
         if file_path.startswith(("http://", "https://")):
             cache_dir = get_dataset_dir("cses", "downloads", "temp")
             path = cache_dir / Path(file_path).name
             if not path.exists():
                 download_file(file_path, path)
+            downloaded = True
         
         if not path.exists():
             raise FileNotFoundError(f"CSES data file not found: {path}")
@@ -224,19 +196,32 @@ class CSESAdapter(BaseAdapter):
             if not dataset_id or dataset_name == "cses-unknown":
                 dataset_name = self._detect_cses_module(target_file)
         
-        # Read with metadata when possible
-        df, meta = self._read_table_with_meta_fallback(target_file)
-        
-        # Normalize
-        df = self._normalize(df)
+        # Read with metadata when possible. CSV/TSV go straight to Arrow so the
+        # Parquet writer does not need a second pandas -> Arrow conversion.
+        table = None
+        if target_file.suffix.lower() in ARROW_NATIVE_SUFFIXES:
+            table, meta = self._read_arrow_with_meta_fallback(target_file)
+            table = self._normalize_arrow(table)
+            df = table.to_pandas()
+        else:
+            df, meta = self._read_table_with_meta_fallback(target_file)
+            df = self._normalize(df)
         
         # Write to cache
         cache_dir = get_dataset_dir("cses", dataset_name, version)
+        meta_dir = cache_dir / "meta"
+        proc_dir = cache_dir / "processed"
+        raw_dir = cache_dir / "raw"
+        
+        # Link (or copy) the source file into the raw cache while the Parquet file is written
+        raw_src = path if path.suffix.lower() == ".zip" else target_file
+        raw_future = self._cache_raw_file_async(raw_src, raw_dir / raw_src.name)
+        
         manifest = IngestionManifest(
-            timestamp=pd.Timestamp.utcnow().to_pydatetime(),
+            timestamp=datetime.now(timezone.utc),
             adapter="cses",
             parameters={
-                "file_path": str(path),
+                "file_path": file_path if downloaded else str(path),
                 "target": str(target_file),
                 "dataset_name": dataset_name,
                 "version": version,
@@ -250,37 +235,28 @@ class CSESAdapter(BaseAdapter):
             value_labels=meta.get("value_labels", {}),
         )
         
-        meta_dir = cache_dir / "meta"
-        proc_dir = cache_dir / "processed"
-        raw_dir = cache_dir / "raw"
-        meta_dir.mkdir(parents=True, exist_ok=True)
-        proc_dir.mkdir(parents=True, exist_ok=True)
-        raw_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Copy original file to raw cache
-        import shutil
-        if path.suffix.lower() == ".zip":
-            shutil.copy2(path, raw_dir / path.name)
-        else:
-            shutil.copy2(target_file, raw_dir / target_file.name)
-        
         manifest_path = meta_dir / "ingestion_manifest.json"
-        manifest_path.write_text(manifest.to_json(), encoding="utf-8")
+        write_text_atomic(manifest_path, manifest.to_json())
         
         # Save normalized parquet with Arrow metadata
         out_path = proc_dir / "data.parquet"
-        self._write_parquet_with_metadata(
-            df=df,
-            output_path=out_path,
-            dataset_id=f"cses:{dataset_name}",
-            source="cses",
-            adapter="cses",
-            manifest_path=manifest_path,
-            variable_labels=manifest.variable_labels,
-            value_labels=manifest.value_labels,
-        )
+        write_kwargs = {
+            "output_path": out_path,
+            "dataset_id": f"cses:{dataset_name}",
+            "source": "cses",
+            "adapter": "cses",
+            "manifest_path": manifest_path,
+            "variable_labels": manifest.variable_labels,
+            "value_labels": manifest.value_labels,
+        }
+        if table is not None:
+            self._write_arrow_with_metadata(table, **write_kwargs)
+        else:
+            self._write_parquet_with_metadata(df=df, **write_kwargs)
+        
+        raw_future.result()
         
-        # Index the dataset
-        self._index_dataset_safe(f"cses:{dataset_name}", manifest_path)
+        # Index the dataset in the background; ingest returns without waiting
+        self._index_dataset_async(f"cses:{dataset_name}", manifest_path)
         
         return df
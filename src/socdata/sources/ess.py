@@ -1,16 +1,54 @@
 from __future__ import annotations
 
-import zipfile
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import pandas as pd
 
 from .base import BaseAdapter
 from ..core.types import DatasetSummary
 from ..core.models import IngestionManifest
-from ..core.storage import get_dataset_dir
+from ..core.storage import get_dataset_dir, write_text_atomic
 from ..core.download import download_file
+from ..core.parsers import ARROW_NATIVE_SUFFIXES
+from ..core.zip_utils import extract_data_file
+
+_ESS_ROUND_RE = re.compile(r"ESS(\d+)")
+
+
+@lru_cache(maxsize=256)
+def _detect_round_from_stem(stem: str) -> str:
+    name = stem.upper()
+    
+    # Check for cumulative
+    if "CUMULATIVE" in name:
+        return "ess-cumulative"
+    
+    # Check for round pattern (ESS followed by digits)
+    round_match = _ESS_ROUND_RE.search(name)
+    if round_match:
+        round_num = round_match.group(1)
+        return f"ess-round-{round_num}"
+    
+    return "ess-unknown"
+
+
+_ESS_DATASETS: Tuple[DatasetSummary, ...] = (
+    DatasetSummary(id="ess:ess-round-1", source="ess", title="ESS Round 1 (2002-2003)"),
+    DatasetSummary(id="ess:ess-round-2", source="ess", title="ESS Round 2 (2004-2005)"),
+    DatasetSummary(id="ess:ess-round-3", source="ess", title="ESS Round 3 (2006-2007)"),
+    DatasetSummary(id="ess:ess-round-4", source="ess", title="ESS Round 4 (2008-2009)"),
+    DatasetSummary(id="ess:ess-round-5", source="ess", title="ESS Round 5 (2010-2011)"),
+    DatasetSummary(id="ess:ess-round-6", source="ess", title="ESS Round 6 (2012-2013)"),
+    DatasetSummary(id="ess:ess-round-7", source="ess", title="ESS Round 7 (2014-2015)"),
+    DatasetSummary(id="ess:ess-round-8", source="ess", title="ESS Round 8 (2016-2017)"),
+    DatasetSummary(id="ess:ess-round-9", source="ess", title="ESS Round 9 (2018-2019)"),
+    DatasetSummary(id="ess:ess-round-10", source="ess", title="ESS Round 10 (2020-2022)"),
+    DatasetSummary(id="ess:ess-cumulative", source="ess", title="ESS Cumulative File (all rounds)"),
+)
 
 
 class ESSAdapter(BaseAdapter):
@@ -23,65 +61,12 @@ class ESSAdapter(BaseAdapter):
 
     ESS_BASE_URL = "https://www.europeansocialsurvey.org/download.html"
 
+    categorical_columns = ("cntry", "essround", "edition", "edulvlb")
+    dictionary_cardinality_ratio = 0.05
+
     def list_datasets(self) -> List[DatasetSummary]:
         """List available ESS datasets."""
-        return [
-            DatasetSummary(
-                id="ess:ess-round-1",
-                source="ess",
-                title="ESS Round 1 (2002-2003)"
-            ),
-            DatasetSummary(
-                id="ess:ess-round-2",
-                source="ess",
-                title="ESS Round 2 (2004-2005)"
-            ),
-            DatasetSummary(
-                id="ess:ess-round-3",
-                source="ess",
-                title="ESS Round 3 (2006-2007)"
-            ),
-            DatasetSummary(
-                id="ess:ess-round-4",
-                source="ess",
-                title="ESS Round 4 (2008-2009)"
-            ),
-            DatasetSummary(
-                id="ess:ess-round-5",
-                source="ess",
-                title="ESS Round 5 (2010-2011)"
-            ),
-            DatasetSummary(
-                id="ess:ess-round-6",
-                source="ess",
-                title="ESS Round 6 (2012-2013)"
-            ),
-            DatasetSummary(
-                id="ess:ess-round-7",
-                source="ess",
-                title="ESS Round 7 (2014-2015)"
-            ),
-            DatasetSummary(
-                id="ess:ess-round-8",
-                source="ess",
-                title="ESS Round 8 (2016-2017)"
-            ),
-            DatasetSummary(
-                id="ess:ess-round-9",
-                source="ess",
-                title="ESS Round 9 (2018-2019)"
-            ),
-            DatasetSummary(
-                id="ess:ess-round-10",
-                source="ess",
-                title="ESS Round 10 (2020-2022)"
-            ),
-            DatasetSummary(
-                id="ess:ess-cumulative",
-                source="ess",
-                title="ESS Cumulative File (all rounds)"
-            ),
-        ]
+        return list(_ESS_DATASETS)
 
     def load(self, dataset_id: str, *, filters: Dict[str, Any]) -> pd.DataFrame:
         """
@@ -106,10 +91,10 @@ class ESSAdapter(BaseAdapter):
         parquet_path = cache_dir / "processed" / "data.parquet"
         
         if parquet_path.exists():
-            # Use optimized read with column selection if filters are provided
+            # Use optimized read with column selection and predicate pushdown
             columns = list(filters.keys()) if filters else None
-            df = self._read_parquet_optimized(parquet_path, columns=columns)
-            # Apply filters if provided
+            df = self._read_parquet_optimized(parquet_path, columns=columns, filters=filters)
+            # Re-apply filters for keys that could not be pushed down
             if filters:
                 df = self._apply_filters(df, filters)
             return df
@@ -121,25 +106,6 @@ class ESSAdapter(BaseAdapter):
             "ESS data requires registration and download from https://www.europeansocialsurvey.org/"
         )
 
-    def _apply_filters(self, df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
-        """Apply filters to DataFrame."""
-        result = df.copy()
-        for key, value in filters.items():
-            if key in result.columns:
-                if isinstance(value, list):
-                    result = result[result[key].isin(value)]
-                else:
-                    result = result[result[key] == value]
-        return result
-
-    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Normalize column names and string values."""
-        df = df.copy()
-        df.columns = [str(c).strip().lower() for c in df.columns]
-        for col in df.select_dtypes(include=["object"]).columns:
-            df[col] = df[col].astype(str).str.strip()
-        return df
-
     def _detect_ess_round(self, file_path: Path) -> str:
         """
         Try to detect ESS round from filename or content.
@@ -149,20 +115,7 @@ class ESSAdapter(BaseAdapter):
         - ESS10e01_1.sav (Round 10, edition 1, version 1)
         - ESS_cumulative_edition_1.sav
         """
-        name = file_path.stem.upper()
-        
-        # Check for cumulative
-        if "CUMULATIVE" in name:
-            return "ess-cumulative"
-        
-        # Check for round pattern (ESS followed by digits)
-        import re
-        round_match = re.search(r"ESS(\d+)", name)
-        if round_match:
-            round_num = round_match.group(1)
-            return f"ess-round-{round_num}"
-        
-        return "ess-unknown"
+        return _detect_round_from_stem(file_path.stem)
 
     def _extract_ess_zip(self, zip_path: Path, extract_dir: Path) -> Path:
         """
@@ -173,33 +126,13 @@ class ESSAdapter(BaseAdapter):
         - Documentation files (.pdf, .txt)
         - Codebooks
         """
-        extract_dir.mkdir(parents=True, exist_ok=True)
-        
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            zf.extractall(extract_dir)
-        
-        # Find data files (prefer SPSS/Stata, then largest CSV)
-        candidates: List[tuple[int, Path]] = []
-        for p in extract_dir.rglob("*"):
-            if p.is_file() and p.suffix.lower() in {".dta", ".sav", ".zsav", ".csv", ".tsv"}:
-                # Skip documentation subdirectories
-                if "doc" in p.parts or "readme" in p.name.lower() or "codebook" in p.name.lower():
-                    continue
-                candidates.append((p.stat().st_size, p))
-        
-        if not candidates:
+        # Only the selected data file is decompressed; docs and codebooks stay in the archive
+        target = extract_data_file(zip_path, extract_dir)
+        if target is None:
             raise ValueError(
                 f"No supported data files (.dta/.sav/.zsav/.csv/.tsv) found in ESS ZIP: {zip_path}"
             )
-        
-        # Prefer SPSS/Stata formats, then largest file
-        def rank(p: Path) -> int:
-            if p.suffix.lower() in {".dta", ".sav", ".zsav"}:
-                return 0
-            return 1
-        
-        candidates.sort(key=lambda t: (rank(t[1]), -t[0]))
-        return candidates[0][1]
+        return target
 
     def ingest(self, dataset_id: str | None, *, file_path: str) -> pd.DataFrame:
         """
@@ -230,35 +163,36 @@ class ESSAdapter(BaseAdapter):
             dataset_name = parts[1] if len(parts) > 1 else "ess-unknown"
             version = parts[2] if len(parts) > 2 else "latest"
         else:
-            # Auto-detect from filename
-            if path.suffix.lower() == ".zip":
-                # Will detect after extraction
-                dataset_name = "ess-unknown"
-            else:
-                dataset_name = self._detect_ess_round(path)
+            # Auto-detect from the given file name (ZIP or data file)
+            dataset_name = self._detect_ess_round(path)
             version = "latest"
         
-        # Handle ZIP files
-        if path.suffix.lower() == ".zip":
+        # Handle ZIP files; the archive is opened once to select and extract the data file
+        is_zip = path.suffix.lower() == ".zip"
+        if is_zip:
             extract_dir = path.parent / f"{path.stem}_extracted"
             target_file = self._extract_ess_zip(path, extract_dir)
-            if not dataset_id or dataset_name == "ess-unknown":
-                dataset_name = self._detect_ess_round(target_file)
         else:
             target_file = path
-            if not dataset_id or dataset_name == "ess-unknown":
-                dataset_name = self._detect_ess_round(target_file)
-        
-        # Read with metadata when possible
-        df, meta = self._read_table_with_meta_fallback(target_file)
-        
-        # Normalize
-        df = self._normalize(df)
+        # Adapter-only ids and bundles with generic names: detect from the data file
+        if dataset_name == "ess-unknown":
+            dataset_name = self._detect_ess_round(target_file)
+        
+        # Read with metadata when possible. CSV/TSV go straight to Arrow so the
+        # Parquet writer does not need a second pandas -> Arrow conversion.
+        table = None
+        if target_file.suffix.lower() in ARROW_NATIVE_SUFFIXES:
+            table, meta = self._read_arrow_with_meta_fallback(target_file)
+            table = self._dictionary_encode_columns(self._normalize_arrow(table))
+            df = table.to_pandas()
+        else:
+            df, meta = self._read_table_with_meta_fallback(target_file)
+            df = self._dictionary_encode_frame(self._normalize(df))
         
         # Write to cache
         cache_dir = get_dataset_dir("ess", dataset_name, version)
         manifest = IngestionManifest(
-            timestamp=pd.Timestamp.utcnow().to_pydatetime(),
+            timestamp=datetime.now(timezone.utc),
             adapter="ess",
             parameters={
                 "file_path": str(path),
@@ -278,32 +212,31 @@ class ESSAdapter(BaseAdapter):
         meta_dir = cache_dir / "meta"
         proc_dir = cache_dir / "processed"
         raw_dir = cache_dir / "raw"
-        meta_dir.mkdir(parents=True, exist_ok=True)
-        proc_dir.mkdir(parents=True, exist_ok=True)
-        raw_dir.mkdir(parents=True, exist_ok=True)
         
-        # Copy original file to raw cache
-        import shutil
-        if path.suffix.lower() == ".zip":
-            shutil.copy2(path, raw_dir / path.name)
-        else:
-            shutil.copy2(target_file, raw_dir / target_file.name)
+        # Link (or copy) original file into raw cache while the Parquet file is written
+        raw_src = path if is_zip else target_file
+        raw_future = self._cache_raw_file_async(raw_src, raw_dir / raw_src.name)
         
         manifest_path = meta_dir / "ingestion_manifest.json"
-        manifest_path.write_text(manifest.to_json(), encoding="utf-8")
+        write_text_atomic(manifest_path, manifest.to_json())
         
         # Save normalized parquet with Arrow metadata
         out_path = proc_dir / "data.parquet"
-        self._write_parquet_with_metadata(
-            df=df,
-            output_path=out_path,
-            dataset_id=f"ess:{dataset_name}",
-            source="ess",
-            adapter="ess",
-            manifest_path=manifest_path,
-            variable_labels=manifest.variable_labels,
-            value_labels=manifest.value_labels,
-        )
+        write_kwargs = {
+            "output_path": out_path,
+            "dataset_id": f"ess:{dataset_name}",
+            "source": "ess",
+            "adapter": "ess",
+            "manifest_path": manifest_path,
+            "variable_labels": manifest.variable_labels,
+            "value_labels": manifest.value_labels,
+        }
+        if table is not None:
+            self._write_arrow_with_metadata(table, **write_kwargs)
+        else:
+            self._write_parquet_with_metadata(df=df, **write_kwargs)
+        
+        raw_future.result()
         
         # Index the dataset
         self._index_dataset_safe(f"ess:{dataset_name}", manifest_path)
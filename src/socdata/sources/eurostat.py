@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import json
+import tempfile
+import threading
+import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 import requests
@@ -14,48 +18,194 @@ except Exception:  # pragma: no cover - optional dependency
     eurostat = None  # type: ignore
 
 from .base import BaseAdapter
-from ..core.config import get_config
+from ..core.config import SocDataConfig, get_config
 from ..core.exceptions import CacheError, DownloadError, ParserError
+from ..core.http import get_session
 from ..core.logging import get_logger
+from ..core.serialization import dumps_bytes, loads
 from ..core.types import DatasetSummary
 
 logger = get_logger(__name__)
 
+# Background refresh of the dataset-list cache (see eurostat_async_refresh)
+_refresh_lock = threading.Lock()
+_refresh_thread: Optional[threading.Thread] = None
+
+# Common Eurostat datasets - curated list
+# This serves as both fallback and primary source until full API integration
+_COMMON_DATASETS: Tuple[Tuple[str, str], ...] = (
+    ("une_rt_m", "Unemployment rate - monthly"),
+    ("demo_r_pjangroup", "Population on 1 January by age group, sex and NUTS 3 region"),
+    ("nama_10_gdp", "GDP and main components"),
+    ("nama_10_p3", "Final consumption expenditure of households"),
+    ("lfsq_egan2", "Employment by sex, age and educational attainment level"),
+    ("ilc_li02", "At-risk-of-poverty rate by poverty threshold, age and sex"),
+    ("edat_lfse_03", "Early leavers from education and training by sex and age"),
+    ("hlth_silc_10", "Self-perceived health by sex, age and educational attainment level"),
+    ("crim_hom_soff", "Intentional homicide offences"),
+    ("migr_imm1ctz", "Immigration by age group, sex and citizenship"),
+    ("demo_gind", "Demographic balance and crude rates"),
+    ("nama_10r_2gdp", "GDP at regional level"),
+    ("educ_uoe_enrt01", "Pupils and students enrolled in education"),
+    ("hlth_dh010", "Healthcare expenditure"),
+    ("env_ac_ainah_r2", "Air emissions accounts by NACE Rev. 2 activity"),
+)
+
+# Built once at import; list_datasets hands out copies of this tuple
+_CURATED_DATASETS: Tuple[DatasetSummary, ...] = tuple(
+    DatasetSummary(id=f"eurostat:{code}", source="eurostat", title=title)
+    for code, title in _COMMON_DATASETS
+)
+
+# Cache file payload for the curated list
+_CURATED_CACHE_ENTRIES: List[Dict[str, str]] = [
+    {"code": code, "title": title} for code, title in _COMMON_DATASETS
+]
+
+
+def _to_summaries(entries: List[Dict[str, str]]) -> List[DatasetSummary]:
+    """Convert cached/API dataset entries to summaries."""
+    # A cache holding the curated list maps straight onto the prebuilt summaries
+    if entries == _CURATED_CACHE_ENTRIES:
+        return list(_CURATED_DATASETS)
+    return [
+        DatasetSummary(id=f"eurostat:{ds['code']}", source="eurostat", title=ds.get("title", ds["code"]))
+        for ds in entries
+    ]
+
+
+# SDMX 2.1 namespaces (Clark notation for ElementTree tag matching)
+_SDMX_STRUCTURE_NS = "http://www.sdmx.org/resources/sdmxml/schemas/v2_1/structure"
+_SDMX_COMMON_NS = "http://www.sdmx.org/resources/sdmxml/schemas/v2_1/common"
+_DATAFLOW_TAG = f"{{{_SDMX_STRUCTURE_NS}}}Dataflow"
+_COMMON_NAME_TAG = f"{{{_SDMX_COMMON_NS}}}Name"
+_STRUCTURE_NAME_TAG = f"{{{_SDMX_STRUCTURE_NS}}}Name"
+
+# SDMX 2.1 structure endpoint for ESTAT dataflows; several ids are joined with '+'
+_SDMX_DATAFLOW_URL = "https://ec.europa.eu/eurostat/api/dissemination/sdmx/2.1/dataflow/ESTAT"
+_METADATA_BATCH_WORKERS = 4
+
+
+def _parse_dataflows(source: Any) -> List[Dict[str, str]]:
+    """
+    Extract dataflow ids and names from an SDMX structure message.
+    
+    Parses incrementally with iterparse and drops every Dataflow element once
+    it has been read, so the full ALL-dataflows document is never held as a tree.
+    
+    Args:
+        source: File-like object with the SDMX XML
+    
+    Returns:
+        List of {'code', 'title'} dicts
+    
+    Raises:
+        ET.ParseError: If the XML is malformed
+    """
+    datasets: List[Dict[str, str]] = []
+    stack: List[ET.Element] = []
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            continue
+        stack.pop()
+        if elem.tag != _DATAFLOW_TAG:
+            continue
+        
+        dataflow_id = elem.get("id", "")
+        if dataflow_id:
+            # Try to get name from various possible locations
+            name_elem = next(elem.iter(_COMMON_NAME_TAG), None)
+            if name_elem is None:
+                # Try alternative location
+                name_elem = next(elem.iter(_STRUCTURE_NAME_TAG), None)
+            
+            name = name_elem.text if name_elem is not None and name_elem.text else dataflow_id
+            datasets.append({
+                "code": dataflow_id,
+                "title": name.strip() if name else dataflow_id,
+            })
+        
+        # Release the element: it is the last child of its (still open) parent
+        if stack:
+            del stack[-1][-1]
+    return datasets
+
 
 class EurostatAdapter(BaseAdapter):
-    def _get_cached_dataset_list(self) -> Optional[List[Dict[str, str]]]:
-        """Get cached dataset list from file."""
-        cfg = get_config()
+    def _read_cache_payload(self, cfg: SocDataConfig) -> Optional[Dict[str, Any]]:
+        """Read the dataset-list cache file; None if it is missing, unreadable or has no timestamp."""
         cache_file = cfg.cache_dir / "eurostat_datasets.json"
         
-        if cache_file.exists():
-            try:
-                with cache_file.open(encoding="utf-8") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                # Corrupted cache file - log and return None to regenerate
-                logger.warning(f"Failed to parse cached Eurostat dataset list (corrupted): {e}")
-                return None
-            except (OSError, IOError, PermissionError) as e:
-                # File system errors
-                logger.warning(f"Failed to read cached Eurostat dataset list (filesystem error): {e}")
-                return None
-            except Exception as e:
-                # Unexpected errors
-                logger.error(f"Unexpected error reading cached Eurostat dataset list: {e}", exc_info=True)
-                return None
+        if not cache_file.exists():
+            return None
+        try:
+            payload = loads(cache_file.read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            # Corrupted cache file - log and return None to regenerate
+            logger.warning(f"Failed to parse cached Eurostat dataset list (corrupted): {e}")
+            return None
+        except (OSError, IOError, PermissionError) as e:
+            # File system errors
+            logger.warning(f"Failed to read cached Eurostat dataset list (filesystem error): {e}")
+            return None
+        except Exception as e:
+            # Unexpected errors
+            logger.error(f"Unexpected error reading cached Eurostat dataset list: {e}", exc_info=True)
+            return None
+        
+        # Entries written before the timestamp was added are treated as stale
+        if not isinstance(payload, dict) or not isinstance(payload.get("ts"), (int, float)):
+            return None
+        return payload
+
+    def _get_cached_dataset_list(
+        self, cfg: Optional[SocDataConfig] = None, payload: Optional[Dict[str, Any]] = None
+    ) -> Optional[List[Dict[str, str]]]:
+        """
+        Get cached dataset list from file.
         
-        return None
+        Args:
+            cfg: Optional config (looked up if omitted)
+            payload: Cache payload the caller already read (read from file if omitted)
+        
+        Returns:
+            Cached dataset entries, or None if the cache is missing or expired
+        """
+        cfg = cfg or get_config()
+        payload = payload if payload is not None else self._read_cache_payload(cfg)
+        if payload is None:
+            return None
+        age_seconds = time.time() - payload["ts"]
+        if age_seconds > cfg.eurostat_cache_ttl_hours * 3600:
+            logger.debug("Cached Eurostat dataset list expired (%.0f s old)", age_seconds)
+            return None
+        return payload.get("datasets")
+
+    def _cache_half_expired(self, payload: Dict[str, Any], cfg: SocDataConfig) -> bool:
+        """Whether more than half of the dataset-list cache TTL has elapsed since payload was written."""
+        return time.time() - payload["ts"] > cfg.eurostat_cache_ttl_hours * 1800
 
-    def _cache_dataset_list(self, datasets: List[Dict[str, str]]) -> None:
+    def _cache_dataset_list(self, datasets: List[Dict[str, str]], cfg: Optional[SocDataConfig] = None) -> None:
         """Cache dataset list to file."""
-        cfg = get_config()
+        cfg = cfg or get_config()
         cache_file = cfg.cache_dir / "eurostat_datasets.json"
         
         try:
             cache_file.parent.mkdir(parents=True, exist_ok=True)
-            with cache_file.open("w", encoding="utf-8") as f:
-                json.dump(datasets, f, indent=2, ensure_ascii=False)
+            # Write to a uniquely named temporary file and swap it in so readers never see
+            # a partial file and a background refresh cannot clobber a foreground write
+            with tempfile.NamedTemporaryFile(
+                dir=cache_file.parent, prefix=f"{cache_file.name}.", suffix=".tmp", delete=False
+            ) as tmp:
+                tmp_file = Path(tmp.name)
+                try:
+                    tmp.write(dumps_bytes({"ts": time.time(), "datasets": datasets}))
+                    tmp.close()
+                    tmp_file.replace(cache_file)
+                except BaseException:
+                    tmp_file.unlink(missing_ok=True)
+                    raise
         except (OSError, IOError, PermissionError) as e:
             # File system errors - log but don't fail
             logger.warning(f"Failed to cache Eurostat dataset list (filesystem error): {e}")
@@ -63,7 +213,7 @@ class EurostatAdapter(BaseAdapter):
             # Unexpected errors
             logger.error(f"Unexpected error caching Eurostat dataset list: {e}", exc_info=True)
 
-    def _fetch_datasets_from_api(self) -> Optional[List[Dict[str, str]]]:
+    def _fetch_datasets_from_api(self, cfg: Optional[SocDataConfig] = None) -> Optional[List[Dict[str, str]]]:
         """Fetch dataset list from Eurostat REST API."""
         try:
             # Eurostat REST API endpoint for dataset list
@@ -77,62 +227,32 @@ class EurostatAdapter(BaseAdapter):
             # Try to fetch dataset metadata from Eurostat SDMX API
             sdmx_url = "https://ec.europa.eu/eurostat/api/dissemination/statistics/1.0/dataflow/ALL"
             
-            cfg = get_config()
+            cfg = cfg or get_config()
             headers = {"User-Agent": cfg.user_agent}
             
             try:
-                response = requests.get(sdmx_url, headers=headers, timeout=cfg.timeout_seconds)
-                response.raise_for_status()
-                
-                # Parse SDMX XML response
-                # Eurostat SDMX API returns XML with dataflow definitions
-                try:
-                    root = ET.fromstring(response.content)
+                with get_session().get(
+                    sdmx_url, headers=headers, timeout=cfg.timeout_seconds, stream=True
+                ) as response:
+                    response.raise_for_status()
                     
-                    # SDMX namespace
-                    namespaces = {
-                        'structure': 'http://www.sdmx.org/resources/sdmxml/schemas/v2_1/structure',
-                        'common': 'http://www.sdmx.org/resources/sdmxml/schemas/v2_1/common',
-                    }
-                    
-                    # Extract dataflows (datasets)
-                    datasets = []
-                    # Try to find dataflows in the XML
-                    # The exact structure depends on Eurostat's SDMX implementation
-                    for dataflow in root.findall('.//structure:Dataflow', namespaces):
-                        # Extract ID and name
-                        dataflow_id = dataflow.get('id', '')
-                        if not dataflow_id:
-                            continue
-                        
-                        # Try to get name from various possible locations
-                        name_elem = dataflow.find('.//common:Name', namespaces)
-                        if name_elem is None:
-                            # Try alternative location
-                            name_elem = dataflow.find('.//structure:Name', namespaces)
+                    # Parse SDMX XML response incrementally as the bytes arrive
+                    # Eurostat SDMX API returns XML with dataflow definitions
+                    try:
+                        response.raw.decode_content = True
+                        datasets = _parse_dataflows(response.raw)
                         
-                        name = name_elem.text if name_elem is not None and name_elem.text else dataflow_id
-                        
-                        datasets.append({
-                            'code': dataflow_id,
-                            'title': name.strip() if name else dataflow_id
-                        })
-                    
-                    if datasets:
-                        logger.info(f"Successfully fetched {len(datasets)} datasets from Eurostat API")
-                        return datasets
-                    else:
-                        logger.debug("Eurostat SDMX API response received but no datasets found in expected format")
+                        if datasets:
+                            logger.info(f"Successfully fetched {len(datasets)} datasets from Eurostat API")
+                            return datasets
+                        else:
+                            logger.debug("Eurostat SDMX API response received but no datasets found in expected format")
+                            return None
+                            
+                    except ET.ParseError as e:
+                        # XML parsing error
+                        logger.warning(f"Failed to parse Eurostat SDMX XML response: {e}")
                         return None
-                        
-                except ET.ParseError as e:
-                    # XML parsing error
-                    logger.warning(f"Failed to parse Eurostat SDMX XML response: {e}")
-                    return None
-                except KeyError as e:
-                    # Namespace or structure issue
-                    logger.debug(f"SDMX XML structure not as expected: {e}, using curated list")
-                    return None
                     
             except requests.RequestException as e:
                 # Expected network/API errors - log and fallback
@@ -147,36 +267,94 @@ class EurostatAdapter(BaseAdapter):
             logger.error(f"Unexpected error fetching datasets from Eurostat API: {e}", exc_info=True)
             return None
 
+    def _fetch_dataflow_chunk(self, codes: List[str], cfg: SocDataConfig) -> List[Dict[str, str]]:
+        """Fetch the dataflow stubs of several datasets with one SDMX request."""
+        url = f"{_SDMX_DATAFLOW_URL}/{'+'.join(codes)}"
+        try:
+            with get_session().get(
+                url,
+                params={"detail": "allstubs"},
+                headers={"User-Agent": cfg.user_agent},
+                timeout=cfg.timeout_seconds,
+                stream=True,
+            ) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                return _parse_dataflows(response.raw)
+        except (requests.RequestException, ET.ParseError) as e:
+            logger.debug("Eurostat dataflow request for %d datasets failed: %s", len(codes), e)
+            return []
+
+    def _fetch_metadata_batch(
+        self, codes: List[str], batch_size: int = 50, cfg: Optional[SocDataConfig] = None
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Fetch dataflow metadata for many datasets in a few requests.
+        
+        Codes are sent in chunks of batch_size per SDMX request instead of one
+        request per dataset; up to four chunks are fetched concurrently over
+        the shared session. Failed chunks are skipped.
+        
+        Args:
+            codes: Eurostat dataset codes
+            batch_size: Number of codes per request
+            cfg: Optional config (looked up if omitted)
+        
+        Returns:
+            Mapping of dataset code to {'code', 'title'}
+        """
+        cfg = cfg or get_config()
+        chunks = [codes[i:i + batch_size] for i in range(0, len(codes), batch_size)]
+        if not chunks:
+            return {}
+        
+        metadata: Dict[str, Dict[str, str]] = {}
+        with ThreadPoolExecutor(max_workers=min(_METADATA_BATCH_WORKERS, len(chunks))) as executor:
+            for entries in executor.map(lambda chunk: self._fetch_dataflow_chunk(chunk, cfg), chunks):
+                for entry in entries:
+                    metadata[entry["code"]] = entry
+        return metadata
+
+    def _refresh_dataset_cache(self, cfg: SocDataConfig) -> None:
+        """Fetch the dataset list from the API and store it in the cache."""
+        datasets = self._fetch_datasets_from_api(cfg)
+        if datasets:
+            self._cache_dataset_list(datasets, cfg)
+
+    def _schedule_refresh(self, cfg: SocDataConfig) -> None:
+        """
+        Refresh the dataset-list cache on a daemon thread, at most one at a time.
+        
+        A daemon thread is used so a slow API never delays interpreter exit;
+        the cache write itself is atomic, so an interrupted refresh is harmless.
+        """
+        global _refresh_thread
+        with _refresh_lock:
+            if _refresh_thread is not None and _refresh_thread.is_alive():
+                return
+            _refresh_thread = threading.Thread(
+                target=self._refresh_dataset_cache,
+                args=(cfg,),
+                name="socdata-eurostat-refresh",
+                daemon=True,
+            )
+            _refresh_thread.start()
+
     def list_datasets(self) -> List[DatasetSummary]:
         """List available Eurostat datasets."""
-        # Common Eurostat datasets - curated list
-        # This serves as both fallback and primary source until full API integration
-        common_datasets = [
-            ("une_rt_m", "Unemployment rate - monthly"),
-            ("demo_r_pjangroup", "Population on 1 January by age group, sex and NUTS 3 region"),
-            ("nama_10_gdp", "GDP and main components"),
-            ("nama_10_p3", "Final consumption expenditure of households"),
-            ("lfsq_egan2", "Employment by sex, age and educational attainment level"),
-            ("ilc_li02", "At-risk-of-poverty rate by poverty threshold, age and sex"),
-            ("edat_lfse_03", "Early leavers from education and training by sex and age"),
-            ("hlth_silc_10", "Self-perceived health by sex, age and educational attainment level"),
-            ("crim_hom_soff", "Intentional homicide offences"),
-            ("migr_imm1ctz", "Immigration by age group, sex and citizenship"),
-            ("demo_gind", "Demographic balance and crude rates"),
-            ("nama_10r_2gdp", "GDP at regional level"),
-            ("educ_uoe_enrt01", "Pupils and students enrolled in education"),
-            ("hlth_dh010", "Healthcare expenditure"),
-            ("env_ac_ainah_r2", "Air emissions accounts by NACE Rev. 2 activity"),
-        ]
-        
-        # Try to get cached list first
-        cached = self._get_cached_dataset_list()
+        # Resolve the config once and share it with the cache and API helpers
+        cfg = get_config()
+        
+        # Try to get cached list first; expiry and refresh both go by the payload timestamp
+        payload = self._read_cache_payload(cfg)
+        cached = self._get_cached_dataset_list(cfg, payload) if payload is not None else None
         if cached:
             try:
-                return [
-                    DatasetSummary(id=f"eurostat:{ds['code']}", source="eurostat", title=ds.get("title", ds["code"]))
-                    for ds in cached
-                ]
+                summaries = _to_summaries(cached)
+                if cfg.eurostat_async_refresh and self._cache_half_expired(payload, cfg):
+                    # Stale-while-revalidate: serve the cache, refresh it for later calls
+                    self._schedule_refresh(cfg)
+                return summaries
             except (KeyError, TypeError) as e:
                 # Invalid data structure in cache
                 logger.warning(f"Failed to parse cached dataset list (invalid structure): {e}")
@@ -184,16 +362,18 @@ class EurostatAdapter(BaseAdapter):
                 # Unexpected errors
                 logger.error(f"Unexpected error parsing cached dataset list: {e}", exc_info=True)
         
+        if cfg.eurostat_async_refresh:
+            # Do not block on the SDMX download: answer from the curated list now
+            self._schedule_refresh(cfg)
+            return list(_CURATED_DATASETS)
+        
         # Try to fetch from API
-        api_datasets = self._fetch_datasets_from_api()
+        api_datasets = self._fetch_datasets_from_api(cfg)
         if api_datasets:
             # Cache the API results
-            self._cache_dataset_list(api_datasets)
+            self._cache_dataset_list(api_datasets, cfg)
             try:
-                return [
-                    DatasetSummary(id=f"eurostat:{ds['code']}", source="eurostat", title=ds.get("title", ds["code"]))
-                    for ds in api_datasets
-                ]
+                return _to_summaries(api_datasets)
             except (KeyError, TypeError) as e:
                 # Invalid data structure from API
                 logger.warning(f"Failed to parse API dataset list (invalid structure): {e}")
@@ -201,17 +381,13 @@ class EurostatAdapter(BaseAdapter):
                 # Unexpected errors
                 logger.error(f"Unexpected error parsing API dataset list: {e}", exc_info=True)
         
-        # Fallback to curated list
-        datasets = [
-            DatasetSummary(id=f"eurostat:{code}", source="eurostat", title=title)
-            for code, title in common_datasets
-        ]
-        
+        # Fallback to curated list, with current titles from one batched dataflow lookup
+        metadata = self._fetch_metadata_batch([code for code, _ in _COMMON_DATASETS], cfg=cfg)
+        entries = [metadata.get(entry["code"], entry) for entry in _CURATED_CACHE_ENTRIES]
         # Cache the curated list for future use
-        curated_for_cache = [{"code": code, "title": title} for code, title in common_datasets]
-        self._cache_dataset_list(curated_for_cache)
+        self._cache_dataset_list(entries, cfg)
         
-        return datasets
+        return _to_summaries(entries)
 
     def load(self, dataset_id: str, *, filters: Dict[str, Any]) -> pd.DataFrame:
         if eurostat is None:
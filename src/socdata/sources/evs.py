@@ -1,17 +1,20 @@
 from __future__ import annotations
 
-import zipfile
+import re
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
-import re
 
 import pandas as pd
 
 from .base import BaseAdapter
 from ..core.types import DatasetSummary
 from ..core.models import IngestionManifest
-from ..core.storage import get_dataset_dir
+from ..core.storage import file_sha256, get_dataset_dir, write_text_atomic
 from ..core.download import download_file
+from ..core.zip_utils import extract_data_file
+
+_EVS_WAVE_RE = re.compile(r"EVS[_\s]?(\d{4})")
 
 
 class EVSAdapter(BaseAdapter):
@@ -24,6 +27,12 @@ class EVSAdapter(BaseAdapter):
 
     EVS_BASE_URL = "https://europeanvaluesstudy.eu/"
 
+    # Country/wave identifiers of the integrated and wave files
+    categorical_columns = ("country", "c_abrv", "s002evs", "s003")
+    dictionary_cardinality_ratio = 0.01
+    # Files are long but made of small coded columns: fewer, larger row groups
+    parquet_row_group_size = 256_000
+
     def list_datasets(self) -> List[DatasetSummary]:
         """List available EVS datasets."""
         return [
@@ -82,10 +91,10 @@ class EVSAdapter(BaseAdapter):
         parquet_path = cache_dir / "processed" / "data.parquet"
         
         if parquet_path.exists():
-            # Use optimized read with column selection if filters are provided
+            # Use optimized read with column selection and predicate pushdown
             columns = list(filters.keys()) if filters else None
-            df = self._read_parquet_optimized(parquet_path, columns=columns)
-            # Apply filters if provided
+            df = self._read_parquet_optimized(parquet_path, columns=columns, filters=filters)
+            # Re-apply filters for keys that could not be pushed down
             if filters:
                 df = self._apply_filters(df, filters)
             return df
@@ -97,25 +106,6 @@ class EVSAdapter(BaseAdapter):
             "EVS data requires registration and download from https://europeanvaluesstudy.eu/"
         )
 
-    def _apply_filters(self, df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
-        """Apply filters to DataFrame."""
-        result = df.copy()
-        for key, value in filters.items():
-            if key in result.columns:
-                if isinstance(value, list):
-                    result = result[result[key].isin(value)]
-                else:
-                    result = result[result[key] == value]
-        return result
-
-    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Normalize column names and string values."""
-        df = df.copy()
-        df.columns = [str(c).strip().lower() for c in df.columns]
-        for col in df.select_dtypes(include=["object"]).columns:
-            df[col] = df[col].astype(str).str.strip()
-        return df
-
     def _detect_evs_wave(self, file_path: Path) -> str:
         """
         Try to detect EVS wave from filename or content.
@@ -132,7 +122,7 @@ class EVSAdapter(BaseAdapter):
             return "evs-integrated"
         
         # Check for year pattern (4 digits)
-        year_match = re.search(r"EVS[_\s]?(\d{4})", name)
+        year_match = _EVS_WAVE_RE.search(name)
         if year_match:
             year = year_match.group(1)
             return f"evs-{year}"
@@ -148,33 +138,13 @@ class EVSAdapter(BaseAdapter):
         - Documentation files (.pdf, .txt)
         - Codebooks
         """
-        extract_dir.mkdir(parents=True, exist_ok=True)
-        
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            zf.extractall(extract_dir)
-        
-        # Find data files (prefer SPSS/Stata, then largest CSV)
-        candidates: List[tuple[int, Path]] = []
-        for p in extract_dir.rglob("*"):
-            if p.is_file() and p.suffix.lower() in {".dta", ".sav", ".zsav", ".csv", ".tsv"}:
-                # Skip documentation subdirectories
-                if "doc" in p.parts or "readme" in p.name.lower() or "codebook" in p.name.lower():
-                    continue
-                candidates.append((p.stat().st_size, p))
-        
-        if not candidates:
+        # Only the selected data file is decompressed; docs and codebooks stay in the archive
+        target = extract_data_file(zip_path, extract_dir)
+        if target is None:
             raise ValueError(
                 f"No supported data files (.dta/.sav/.zsav/.csv/.tsv) found in EVS ZIP: {zip_path}"
             )
-        
-        # Prefer SPSS/Stata formats, then largest file
-        def rank(p: Path) -> int:
-            if p.suffix.lower() in {".dta", ".sav", ".zsav"}:
-                return 0
-            return 1
-        
-        candidates.sort(key=lambda t: (rank(t[1]), -t[0]))
-        return candidates[0][1]
+        return target
 
     def ingest(self, dataset_id: str | None, *, file_path: str) -> pd.DataFrame:
         """
@@ -185,7 +155,8 @@ class EVSAdapter(BaseAdapter):
             file_path: Path to EVS data file (.sav, .dta, .csv) or ZIP archive
         
         Returns:
-            Normalized DataFrame
+            Normalized DataFrame. If the file is unchanged since the last ingest,
+            the cached Parquet data is returned as load() would return it.
         """
         path = Path(file_path)
         
@@ -205,35 +176,62 @@ class EVSAdapter(BaseAdapter):
             dataset_name = parts[1] if len(parts) > 1 else "evs-unknown"
             version = parts[2] if len(parts) > 2 else "latest"
         else:
-            # Auto-detect from filename
-            if path.suffix.lower() == ".zip":
-                # Will detect after extraction
-                dataset_name = "evs-unknown"
-            else:
-                dataset_name = self._detect_evs_wave(path)
+            dataset_name = "evs-unknown"
             version = "latest"
+        # Auto-detect from the given file name (ZIP or data file)
+        if dataset_name == "evs-unknown":
+            dataset_name = self._detect_evs_wave(path)
+        is_zip = path.suffix.lower() == ".zip"
+        
+        # Re-ingesting the same file: the processed cache already holds its data.
+        # Checked before extraction, and only when a previous ingest left output behind.
+        source_hash = None
+        if dataset_name != "evs-unknown":
+            cache_dir = get_dataset_dir("evs", dataset_name, version)
+            manifest_path = cache_dir / "meta" / "ingestion_manifest.json"
+            out_path = cache_dir / "processed" / "data.parquet"
+            if out_path.exists() and manifest_path.exists():
+                source_hash = file_sha256(path)
+                if self._manifest_has_source_hash(manifest_path, source_hash):
+                    return self._read_parquet_optimized(out_path)
         
         # Handle ZIP files
-        if path.suffix.lower() == ".zip":
+        if is_zip:
             extract_dir = path.parent / f"{path.stem}_extracted"
             target_file = self._extract_evs_zip(path, extract_dir)
-            if not dataset_id or dataset_name == "evs-unknown":
+            # Bundles with generic names: fall back to the data file inside the ZIP
+            if dataset_name == "evs-unknown":
                 dataset_name = self._detect_evs_wave(target_file)
         else:
             target_file = path
-            if not dataset_id or dataset_name == "evs-unknown":
-                dataset_name = self._detect_evs_wave(target_file)
+        
+        # get_dataset_dir creates the meta/processed/raw layout
+        cache_dir = get_dataset_dir("evs", dataset_name, version)
+        meta_dir = cache_dir / "meta"
+        proc_dir = cache_dir / "processed"
+        raw_dir = cache_dir / "raw"
+        manifest_path = meta_dir / "ingestion_manifest.json"
+        out_path = proc_dir / "data.parquet"
+        
+        # First ingest: hash the source for the manifest while the data is read
+        hash_future = self._file_sha256_async(path) if source_hash is None else None
+        
+        # Link (or copy) original file into raw cache while the data is read and written
+        raw_src = path if is_zip else target_file
+        raw_future = self._cache_raw_file_async(raw_src, raw_dir / raw_src.name)
         
         # Read with metadata when possible
         df, meta = self._read_table_with_meta_fallback(target_file)
         
         # Normalize
-        df = self._normalize(df)
+        df = self._dictionary_encode_frame(self._normalize(df))
+        
+        if hash_future is not None:
+            source_hash = hash_future.result()
         
         # Write to cache
-        cache_dir = get_dataset_dir("evs", dataset_name, version)
         manifest = IngestionManifest(
-            timestamp=pd.Timestamp.utcnow().to_pydatetime(),
+            timestamp=datetime.now(timezone.utc),
             adapter="evs",
             parameters={
                 "file_path": str(path),
@@ -241,7 +239,7 @@ class EVSAdapter(BaseAdapter):
                 "dataset_name": dataset_name,
                 "version": version,
             },
-            source_hashes={},
+            source_hashes={str(path): source_hash},
             transforms=["lowercase_columns", "strip_object_columns"],
             dataset_id=f"evs:{dataset_name}",
             source="evs",
@@ -250,25 +248,9 @@ class EVSAdapter(BaseAdapter):
             value_labels=meta.get("value_labels", {}),
         )
         
-        meta_dir = cache_dir / "meta"
-        proc_dir = cache_dir / "processed"
-        raw_dir = cache_dir / "raw"
-        meta_dir.mkdir(parents=True, exist_ok=True)
-        proc_dir.mkdir(parents=True, exist_ok=True)
-        raw_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Copy original file to raw cache
-        import shutil
-        if path.suffix.lower() == ".zip":
-            shutil.copy2(path, raw_dir / path.name)
-        else:
-            shutil.copy2(target_file, raw_dir / target_file.name)
-        
-        manifest_path = meta_dir / "ingestion_manifest.json"
-        manifest_path.write_text(manifest.to_json(), encoding="utf-8")
+        write_text_atomic(manifest_path, manifest.to_json())
         
         # Save normalized parquet with Arrow metadata
-        out_path = proc_dir / "data.parquet"
         self._write_parquet_with_metadata(
             df=df,
             output_path=out_path,
@@ -280,6 +262,8 @@ class EVSAdapter(BaseAdapter):
             value_labels=manifest.value_labels,
         )
         
+        raw_future.result()
+        
         # Index the dataset
         self._index_dataset_safe(f"evs:{dataset_name}", manifest_path)
         
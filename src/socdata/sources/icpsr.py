@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import re
 import zipfile
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
-import re
 
 import pandas as pd
 
 from .base import BaseAdapter
 from ..core.types import DatasetSummary
 from ..core.models import IngestionManifest
-from ..core.storage import get_dataset_dir
+from ..core.storage import file_sha256, get_dataset_dir, hash_files, write_text_atomic
 from ..core.download import download_file
+from ..core.parsers import ARROW_NATIVE_SUFFIXES
+from ..core.zip_utils import extract_data_file, select_data_member
+
+# Archive directories holding documentation rather than data
+_SKIP_DIRS = ("doc", "documentation", "codebook", "readme", "setup")
+
+_ICPSR_STUDY_RE = re.compile(r"ICPSR[_\s]?(\d{5})")
+_YEAR_RE = re.compile(r"(\d{4})")
+_WAVE_RE = re.compile(r"WAVE[_\s]?(\d+)")
 
 
 class ICPSRAdapter(BaseAdapter):
@@ -24,6 +34,9 @@ class ICPSRAdapter(BaseAdapter):
 
     ICPSR_BASE_URL = "https://www.icpsr.umich.edu/"
 
+    # String columns with few distinct values (coded answers) are dictionary encoded
+    dictionary_cardinality_ratio = 0.1
+
     def list_datasets(self) -> List[DatasetSummary]:
         """List available ICPSR datasets."""
         return [
@@ -102,10 +115,10 @@ class ICPSRAdapter(BaseAdapter):
         parquet_path = cache_dir / "processed" / "data.parquet"
         
         if parquet_path.exists():
-            # Use optimized read with column selection if filters are provided
+            # Use optimized read with column selection and predicate pushdown
             columns = list(filters.keys()) if filters else None
-            df = self._read_parquet_optimized(parquet_path, columns=columns)
-            # Apply filters if provided
+            df = self._read_parquet_optimized(parquet_path, columns=columns, filters=filters)
+            # Re-apply filters for keys that could not be pushed down
             if filters:
                 df = self._apply_filters(df, filters)
             return df
@@ -117,25 +130,6 @@ class ICPSRAdapter(BaseAdapter):
             "ICPSR data requires registration and download from https://www.icpsr.umich.edu/"
         )
 
-    def _apply_filters(self, df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
-        """Apply filters to DataFrame."""
-        result = df.copy()
-        for key, value in filters.items():
-            if key in result.columns:
-                if isinstance(value, list):
-                    result = result[result[key].isin(value)]
-                else:
-                    result = result[result[key] == value]
-        return result
-
-    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Normalize column names and string values."""
-        df = df.copy()
-        df.columns = [str(c).strip().lower() for c in df.columns]
-        for col in df.select_dtypes(include=["object"]).columns:
-            df[col] = df[col].astype(str).str.strip()
-        return df
-
     def _detect_icpsr_study(self, file_path: Path) -> str:
         """
         Try to detect ICPSR study from filename or content.
@@ -148,26 +142,36 @@ class ICPSRAdapter(BaseAdapter):
         name = file_path.stem.upper()
         
         # Check for ICPSR study number pattern (5 digits)
-        study_match = re.search(r"ICPSR[_\s]?(\d{5})", name)
+        study_match = _ICPSR_STUDY_RE.search(name)
         if study_match:
             return f"icpsr-{study_match.group(1)}"
         
         # Check for ANES
         if "ANES" in name:
-            year_match = re.search(r"(\d{4})", name)
+            year_match = _YEAR_RE.search(name)
             if year_match:
                 return f"anes-{year_match.group(1)}"
             return "anes"
         
         # Check for WVS
         if "WVS" in name or "WORLD.VALUES" in name:
-            wave_match = re.search(r"WAVE[_\s]?(\d+)", name)
+            wave_match = _WAVE_RE.search(name)
             if wave_match:
                 return f"wvs-wave{wave_match.group(1)}"
             return "world-values-survey"
         
         return "icpsr-general"
 
+    def _icpsr_data_member(self, zip_path: Path) -> Path:
+        """Relative path of the data file _extract_icpsr_zip extracts, read from the central directory."""
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            info = select_data_member(zf, skip_dirs=_SKIP_DIRS, min_size=1024)
+        if info is None:
+            raise ValueError(
+                f"No supported data files (.dta/.sav/.zsav/.csv/.tsv) found in ICPSR ZIP: {zip_path}"
+            )
+        return Path(info.filename)
+
     def _extract_icpsr_zip(self, zip_path: Path, extract_dir: Path) -> Path:
         """
         Extract ICPSR ZIP and find the main data file.
@@ -178,37 +182,14 @@ class ICPSRAdapter(BaseAdapter):
         - Codebooks
         - Setup files
         """
-        extract_dir.mkdir(parents=True, exist_ok=True)
-        
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            zf.extractall(extract_dir)
-        
-        # Find data files (prefer SPSS/Stata, then largest CSV)
-        candidates: List[tuple[int, Path]] = []
-        for p in extract_dir.rglob("*"):
-            if p.is_file() and p.suffix.lower() in {".dta", ".sav", ".zsav", ".csv", ".tsv"}:
-                # Skip documentation subdirectories
-                skip_dirs = ["doc", "documentation", "codebook", "readme", "setup"]
-                if any(skip in p.parts for skip in skip_dirs):
-                    continue
-                # Skip very small files (likely not data)
-                if p.stat().st_size < 1024:  # Less than 1KB
-                    continue
-                candidates.append((p.stat().st_size, p))
-        
-        if not candidates:
+        # Only the selected data file is decompressed; docs, codebooks and setup
+        # files stay in the archive. Files under 1 KB are not considered data.
+        target = extract_data_file(zip_path, extract_dir, skip_dirs=_SKIP_DIRS, min_size=1024)
+        if target is None:
             raise ValueError(
                 f"No supported data files (.dta/.sav/.zsav/.csv/.tsv) found in ICPSR ZIP: {zip_path}"
             )
-        
-        # Prefer SPSS/Stata formats, then largest file
-        def rank(p: Path) -> int:
-            if p.suffix.lower() in {".dta", ".sav", ".zsav"}:
-                return 0
-            return 1
-        
-        candidates.sort(key=lambda t: (rank(t[1]), -t[0]))
-        return candidates[0][1]
+        return target
 
     def ingest(self, dataset_id: str | None, *, file_path: str) -> pd.DataFrame:
         """
@@ -239,35 +220,52 @@ class ICPSRAdapter(BaseAdapter):
             dataset_name = parts[1] if len(parts) > 1 else "icpsr-general"
             version = parts[2] if len(parts) > 2 else "latest"
         else:
-            # Auto-detect from filename
-            if path.suffix.lower() == ".zip":
-                # Will detect after extraction
-                dataset_name = "icpsr-general"
-            else:
-                dataset_name = self._detect_icpsr_study(path)
+            dataset_name = "icpsr-general"
             version = "latest"
+        is_zip = path.suffix.lower() == ".zip"
+        # Auto-detect from the data file name; for ZIPs it is read from the
+        # central directory so the name is known before anything is extracted
+        if dataset_name == "icpsr-general":
+            dataset_name = self._detect_icpsr_study(self._icpsr_data_member(path) if is_zip else path)
+        
+        # get_dataset_dir creates the meta/processed/raw layout
+        cache_dir = get_dataset_dir("icpsr", dataset_name, version)
+        meta_dir = cache_dir / "meta"
+        proc_dir = cache_dir / "processed"
+        raw_dir = cache_dir / "raw"
+        manifest_path = meta_dir / "ingestion_manifest.json"
+        out_path = proc_dir / "data.parquet"
+        
+        # Re-ingesting the same file: the processed cache already holds its data.
+        # Checked before extraction, and only when a previous ingest left output behind.
+        source_hashes: Dict[str, str] = {}
+        if out_path.exists() and manifest_path.exists():
+            source_hashes[str(path)] = file_sha256(path)
+            if self._manifest_has_source_hash(manifest_path, source_hashes[str(path)]):
+                return self._read_parquet_optimized(out_path)
         
         # Handle ZIP files
-        if path.suffix.lower() == ".zip":
+        if is_zip:
             extract_dir = path.parent / f"{path.stem}_extracted"
             target_file = self._extract_icpsr_zip(path, extract_dir)
-            if not dataset_id or dataset_name == "icpsr-general":
-                dataset_name = self._detect_icpsr_study(target_file)
         else:
             target_file = path
-            if not dataset_id or dataset_name == "icpsr-general":
-                dataset_name = self._detect_icpsr_study(target_file)
-        
-        # Read with metadata when possible
-        df, meta = self._read_table_with_meta_fallback(target_file)
-        
-        # Normalize
-        df = self._normalize(df)
+        source_hashes.update(hash_files(p for p in (path, target_file) if str(p) not in source_hashes))
+        
+        # Read with metadata when possible. CSV/TSV go straight to Arrow so the
+        # Parquet writer does not need a second pandas -> Arrow conversion.
+        table = None
+        if target_file.suffix.lower() in ARROW_NATIVE_SUFFIXES:
+            table, meta = self._read_arrow_with_meta_fallback(target_file)
+            table = self._dictionary_encode_columns(self._normalize_arrow(table))
+            df = table.to_pandas()
+        else:
+            df, meta = self._read_table_with_meta_fallback(target_file)
+            df = self._dictionary_encode_frame(self._normalize(df))
         
         # Write to cache
-        cache_dir = get_dataset_dir("icpsr", dataset_name, version)
         manifest = IngestionManifest(
-            timestamp=pd.Timestamp.utcnow().to_pydatetime(),
+            timestamp=datetime.now(timezone.utc),
             adapter="icpsr",
             parameters={
                 "file_path": str(path),
@@ -275,7 +273,7 @@ class ICPSRAdapter(BaseAdapter):
                 "dataset_name": dataset_name,
                 "version": version,
             },
-            source_hashes={},
+            source_hashes=source_hashes,
             transforms=["lowercase_columns", "strip_object_columns"],
             dataset_id=f"icpsr:{dataset_name}",
             source="icpsr",
@@ -284,35 +282,28 @@ class ICPSRAdapter(BaseAdapter):
             value_labels=meta.get("value_labels", {}),
         )
         
-        meta_dir = cache_dir / "meta"
-        proc_dir = cache_dir / "processed"
-        raw_dir = cache_dir / "raw"
-        meta_dir.mkdir(parents=True, exist_ok=True)
-        proc_dir.mkdir(parents=True, exist_ok=True)
-        raw_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Copy original file to raw cache
-        import shutil
-        if path.suffix.lower() == ".zip":
-            shutil.copy2(path, raw_dir / path.name)
-        else:
-            shutil.copy2(target_file, raw_dir / target_file.name)
+        # Link (or copy) original file into raw cache while the Parquet file is written
+        raw_src = path if path.suffix.lower() == ".zip" else target_file
+        raw_future = self._cache_raw_file_async(raw_src, raw_dir / raw_src.name)
         
-        manifest_path = meta_dir / "ingestion_manifest.json"
-        manifest_path.write_text(manifest.to_json(), encoding="utf-8")
+        write_text_atomic(manifest_path, manifest.to_json())
         
         # Save normalized parquet with Arrow metadata
-        out_path = proc_dir / "data.parquet"
-        self._write_parquet_with_metadata(
-            df=df,
-            output_path=out_path,
-            dataset_id=f"icpsr:{dataset_name}",
-            source="icpsr",
-            adapter="icpsr",
-            manifest_path=manifest_path,
-            variable_labels=manifest.variable_labels,
-            value_labels=manifest.value_labels,
-        )
+        write_kwargs = {
+            "output_path": out_path,
+            "dataset_id": f"icpsr:{dataset_name}",
+            "source": "icpsr",
+            "adapter": "icpsr",
+            "manifest_path": manifest_path,
+            "variable_labels": manifest.variable_labels,
+            "value_labels": manifest.value_labels,
+        }
+        if table is not None:
+            self._write_arrow_with_metadata(table, **write_kwargs)
+        else:
+            self._write_parquet_with_metadata(df=df, **write_kwargs)
+        
+        raw_future.result()
         
         # Index the dataset
         self._index_dataset_safe(f"icpsr:{dataset_name}", manifest_path)
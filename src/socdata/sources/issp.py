@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import zipfile
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 import re
 
 import pandas as pd
@@ -10,8 +10,50 @@ import pandas as pd
 from .base import BaseAdapter
 from ..core.types import DatasetSummary
 from ..core.models import IngestionManifest
-from ..core.storage import get_dataset_dir
+from ..core.storage import get_dataset_dir, write_text_atomic
 from ..core.download import download_file
+from ..core.parsers import ARROW_NATIVE_SUFFIXES
+from ..core.zip_utils import extract_data_file
+
+_ISSP_YEAR_RE = re.compile(r"(?:ISSP|ZA\d+)[_\s]?(\d{4})")
+
+_ISSP_DATASETS: Tuple[DatasetSummary, ...] = (
+    DatasetSummary(id="issp:issp-1985", source="issp", title="ISSP 1985 - Role of Government I"),
+    DatasetSummary(id="issp:issp-1986", source="issp", title="ISSP 1986 - Social Networks"),
+    DatasetSummary(id="issp:issp-1987", source="issp", title="ISSP 1987 - Social Inequality I"),
+    DatasetSummary(id="issp:issp-1989", source="issp", title="ISSP 1989 - Work Orientations I"),
+    DatasetSummary(id="issp:issp-1990", source="issp", title="ISSP 1990 - Role of Government II"),
+    DatasetSummary(id="issp:issp-1991", source="issp", title="ISSP 1991 - Religion I"),
+    DatasetSummary(id="issp:issp-1992", source="issp", title="ISSP 1992 - Social Inequality II"),
+    DatasetSummary(id="issp:issp-1993", source="issp", title="ISSP 1993 - Environment I"),
+    DatasetSummary(id="issp:issp-1994", source="issp", title="ISSP 1994 - Family and Changing Gender Roles I"),
+    DatasetSummary(id="issp:issp-1995", source="issp", title="ISSP 1995 - National Identity I"),
+    DatasetSummary(id="issp:issp-1996", source="issp", title="ISSP 1996 - Role of Government III"),
+    DatasetSummary(id="issp:issp-1997", source="issp", title="ISSP 1997 - Work Orientations II"),
+    DatasetSummary(id="issp:issp-1998", source="issp", title="ISSP 1998 - Religion II"),
+    DatasetSummary(id="issp:issp-1999", source="issp", title="ISSP 1999 - Social Inequality III"),
+    DatasetSummary(id="issp:issp-2000", source="issp", title="ISSP 2000 - Environment II"),
+    DatasetSummary(id="issp:issp-2001", source="issp", title="ISSP 2001 - Social Relations and Support Systems"),
+    DatasetSummary(id="issp:issp-2002", source="issp", title="ISSP 2002 - Family and Changing Gender Roles II"),
+    DatasetSummary(id="issp:issp-2003", source="issp", title="ISSP 2003 - National Identity II"),
+    DatasetSummary(id="issp:issp-2004", source="issp", title="ISSP 2004 - Citizenship"),
+    DatasetSummary(id="issp:issp-2005", source="issp", title="ISSP 2005 - Work Orientations III"),
+    DatasetSummary(id="issp:issp-2006", source="issp", title="ISSP 2006 - Role of Government IV"),
+    DatasetSummary(id="issp:issp-2007", source="issp", title="ISSP 2007 - Leisure Time and Sports"),
+    DatasetSummary(id="issp:issp-2008", source="issp", title="ISSP 2008 - Religion III"),
+    DatasetSummary(id="issp:issp-2009", source="issp", title="ISSP 2009 - Social Inequality IV"),
+    DatasetSummary(id="issp:issp-2010", source="issp", title="ISSP 2010 - Environment III"),
+    DatasetSummary(id="issp:issp-2011", source="issp", title="ISSP 2011 - Health and Health Care"),
+    DatasetSummary(id="issp:issp-2012", source="issp", title="ISSP 2012 - Family and Changing Gender Roles III"),
+    DatasetSummary(id="issp:issp-2013", source="issp", title="ISSP 2013 - National Identity III"),
+    DatasetSummary(id="issp:issp-2014", source="issp", title="ISSP 2014 - Citizenship II"),
+    DatasetSummary(id="issp:issp-2015", source="issp", title="ISSP 2015 - Work Orientations IV"),
+    DatasetSummary(id="issp:issp-2016", source="issp", title="ISSP 2016 - Role of Government V"),
+    DatasetSummary(id="issp:issp-2017", source="issp", title="ISSP 2017 - Social Networks and Social Resources"),
+    DatasetSummary(id="issp:issp-2018", source="issp", title="ISSP 2018 - Religion IV"),
+    DatasetSummary(id="issp:issp-2019", source="issp", title="ISSP 2019 - Social Inequality V"),
+    DatasetSummary(id="issp:issp-2020", source="issp", title="ISSP 2020 - Environment IV"),
+)
 
 
 class ISSPAdapter(BaseAdapter):
@@ -24,185 +66,15 @@ class ISSPAdapter(BaseAdapter):
 
     ISSP_BASE_URL = "https://www.issp.org/"
 
+    # Country identifiers and coded education/occupation variables
+    categorical_columns = ("country", "c_alphan", "degree", "isco08")
+    dictionary_cardinality_ratio = 0.02
+    # Country-level filters are the common case: smaller row groups prune better
+    parquet_row_group_size = 64_000
+
     def list_datasets(self) -> List[DatasetSummary]:
         """List available ISSP datasets."""
-        return [
-            DatasetSummary(
-                id="issp:issp-1985",
-                source="issp",
-                title="ISSP 1985 - Role of Government I"
-            ),
-            DatasetSummary(
-                id="issp:issp-1986",
-                source="issp",
-                title="ISSP 1986 - Social Networks"
-            ),
-            DatasetSummary(
-                id="issp:issp-1987",
-                source="issp",
-                title="ISSP 1987 - Social Inequality I"
-            ),
-            DatasetSummary(
-                id="issp:issp-1989",
-                source="issp",
-                title="ISSP 1989 - Work Orientations I"
-            ),
-            DatasetSummary(
-                id="issp:issp-1990",
-                source="issp",
-                title="ISSP 1990 - Role of Government II"
-            ),
-            DatasetSummary(
-                id="issp:issp-1991",
-                source="issp",
-                title="ISSP 1991 - Religion I"
-            ),
-            DatasetSummary(
-                id="issp:issp-1992",
-                source="issp",
-                title="ISSP 1992 - Social Inequality II"
-            ),
-            DatasetSummary(
-                id="issp:issp-1993",
-                source="issp",
-                title="ISSP 1993 - Environment I"
-            ),
-            DatasetSummary(
-                id="issp:issp-1994",
-                source="issp",
-                title="ISSP 1994 - Family and Changing Gender Roles I"
-            ),
-            DatasetSummary(
-                id="issp:issp-1995",
-                source="issp",
-                title="ISSP 1995 - National Identity I"
-            ),
-            DatasetSummary(
-                id="issp:issp-1996",
-                source="issp",
-                title="ISSP 1996 - Role of Government III"
-            ),
-            DatasetSummary(
-                id="issp:issp-1997",
-                source="issp",
-                title="ISSP 1997 - Work Orientations II"
-            ),
-            DatasetSummary(
-                id="issp:issp-1998",
-                source="issp",
-                title="ISSP 1998 - Religion II"
-            ),
-            DatasetSummary(
-                id="issp:issp-1999",
-                source="issp",
-                title="ISSP 1999 - Social Inequality III"
-            ),
-            DatasetSummary(
-                id="issp:issp-2000",
-                source="issp",
-                title="ISSP 2000 - Environment II"
-            ),
-            DatasetSummary(
-                id="issp:issp-2001",
-                source="issp",
-                title="ISSP 2001 - Social Relations and Support Systems"
-            ),
-            DatasetSummary(
-                id="issp:issp-2002",
-                source="issp",
-                title="ISSP 2002 - Family and Changing Gender Roles II"
-            ),
-            DatasetSummary(
-                id="issp:issp-2003",
-                source="issp",
-                title="ISSP 2003 - National Identity II"
-            ),
-            DatasetSummary(
-                id="issp:issp-2004",
-                source="issp",
-                title="ISSP 2004 - Citizenship"
-            ),
-            DatasetSummary(
-                id="issp:issp-2005",
-                source="issp",
-                title="ISSP 2005 - Work Orientations III"
-            ),
-            DatasetSummary(
-                id="issp:issp-2006",
-                source="issp",
-                title="ISSP 2006 - Role of Government IV"
-            ),
-            DatasetSummary(
-                id="issp:issp-2007",
-                source="issp",
-                title="ISSP 2007 - Leisure Time and Sports"
-            ),
-            DatasetSummary(
-                id="issp:issp-2008",
-                source="issp",
-                title="ISSP 2008 - Religion III"
-            ),
-            DatasetSummary(
-                id="issp:issp-2009",
-                source="issp",
-                title="ISSP 2009 - Social Inequality IV"
-            ),
-            DatasetSummary(
-                id="issp:issp-2010",
-                source="issp",
-                title="ISSP 2010 - Environment III"
-            ),
-            DatasetSummary(
-                id="issp:issp-2011",
-                source="issp",
-                title="ISSP 2011 - Health and Health Care"
-            ),
-            DatasetSummary(
-                id="issp:issp-2012",
-                source="issp",
-                title="ISSP 2012 - Family and Changing Gender Roles III"
-            ),
-            DatasetSummary(
-                id="issp:issp-2013",
-                source="issp",
-                title="ISSP 2013 - National Identity III"
-            ),
-            DatasetSummary(
-                id="issp:issp-2014",
-                source="issp",
-                title="ISSP 2014 - Citizenship II"
-            ),
-            DatasetSummary(
-                id="issp:issp-2015",
-                source="issp",
-                title="ISSP 2015 - Work Orientations IV"
-            ),
-            DatasetSummary(
-                id="issp:issp-2016",
-                source="issp",
-                title="ISSP 2016 - Role of Government V"
-            ),
-            DatasetSummary(
-                id="issp:issp-2017",
-                source="issp",
-                title="ISSP 2017 - Social Networks and Social Resources"
-            ),
-            DatasetSummary(
-                id="issp:issp-2018",
-                source="issp",
-                title="ISSP 2018 - Religion IV"
-            ),
-            DatasetSummary(
-                id="issp:issp-2019",
-                source="issp",
-                title="ISSP 2019 - Social Inequality V"
-            ),
-            DatasetSummary(
-                id="issp:issp-2020",
-                source="issp",
-                title="ISSP 2020 - Environment IV"
-            ),
-        ]
+        return list(_ISSP_DATASETS)
 
     def load(self, dataset_id: str, *, filters: Dict[str, Any]) -> pd.DataFrame:
         """
@@ -227,10 +99,10 @@ class ISSPAdapter(BaseAdapter):
         parquet_path = cache_dir / "processed" / "data.parquet"
         
         if parquet_path.exists():
-            # Use optimized read with column selection if filters are provided
+            # Use optimized read with column selection and predicate pushdown
             columns = list(filters.keys()) if filters else None
-            df = self._read_parquet_optimized(parquet_path, columns=columns)
-            # Apply filters if provided
+            df = self._read_parquet_optimized(parquet_path, columns=columns, filters=filters)
+            # Re-apply filters for keys that could not be pushed down
             if filters:
                 df = self._apply_filters(df, filters)
             return df
@@ -242,25 +114,6 @@ class ISSPAdapter(BaseAdapter):
             "ISSP data requires registration and download from https://www.issp.org/"
         )
 
-    def _apply_filters(self, df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
-        """Apply filters to DataFrame."""
-        result = df.copy()
-        for key, value in filters.items():
-            if key in result.columns:
-                if isinstance(value, list):
-                    result = result[result[key].isin(value)]
-                else:
-                    result = result[result[key] == value]
-        return result
-
-    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Normalize column names and string values."""
-        df = df.copy()
-        df.columns = [str(c).strip().lower() for c in df.columns]
-        for col in df.select_dtypes(include=["object"]).columns:
-            df[col] = df[col].astype(str).str.strip()
-        return df
-
     def _detect_issp_year(self, file_path: Path) -> str:
         """
         Try to detect ISSP year from filename or content.
@@ -273,7 +126,7 @@ class ISSPAdapter(BaseAdapter):
         name = file_path.stem.upper()
         
         # Check for year pattern (4 digits)
-        year_match = re.search(r"(?:ISSP|ZA\d+)[_\s]?(\d{4})", name)
+        year_match = _ISSP_YEAR_RE.search(name)
         if year_match:
             year = year_match.group(1)
             return f"issp-{year}"
@@ -289,33 +142,13 @@ class ISSPAdapter(BaseAdapter):
         - Documentation files (.pdf, .txt)
         - Codebooks
         """
-        extract_dir.mkdir(parents=True, exist_ok=True)
-        
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            zf.extractall(extract_dir)
-        
-        # Find data files (prefer SPSS/Stata, then largest CSV)
-        candidates: List[tuple[int, Path]] = []
-        for p in extract_dir.rglob("*"):
-            if p.is_file() and p.suffix.lower() in {".dta", ".sav", ".zsav", ".csv", ".tsv"}:
-                # Skip documentation subdirectories
-                if "doc" in p.parts or "readme" in p.name.lower() or "codebook" in p.name.lower():
-                    continue
-                candidates.append((p.stat().st_size, p))
-        
-        if not candidates:
+        # Only the selected data file is decompressed; docs and codebooks stay in the archive
+        target = extract_data_file(zip_path, extract_dir)
+        if target is None:
             raise ValueError(
                 f"No supported data files (.dta/.sav/.zsav/.csv/.tsv) found in ISSP ZIP: {zip_path}"
             )
-        
-        # Prefer SPSS/Stata formats, then largest file
-        def rank(p: Path) -> int:
-            if p.suffix.lower() in {".dta", ".sav", ".zsav"}:
-                return 0
-            return 1
-        
-        candidates.sort(key=lambda t: (rank(t[1]), -t[0]))
-        return candidates[0][1]
+        return target
 
     def ingest(self, dataset_id: str | None, *, file_path: str) -> pd.DataFrame:
         """
@@ -340,41 +173,43 @@ class ISSPAdapter(BaseAdapter):
         if not path.exists():
             raise FileNotFoundError(f"ISSP data file not found: {path}")
         
+        is_zip = path.suffix.lower() == ".zip"
+        
         # Determine dataset name and version
+        dataset_name = "issp-unknown"
+        version = "latest"
         if dataset_id:
             parts = dataset_id.split(":")
-            dataset_name = parts[1] if len(parts) > 1 else "issp-unknown"
-            version = parts[2] if len(parts) > 2 else "latest"
-        else:
-            # Auto-detect from filename
-            if path.suffix.lower() == ".zip":
-                # Will detect after extraction
-                dataset_name = "issp-unknown"
-            else:
-                dataset_name = self._detect_issp_year(path)
-            version = "latest"
+            if len(parts) > 1:
+                dataset_name = parts[1]
+            if len(parts) > 2:
+                version = parts[2]
         
         # Handle ZIP files
-        if path.suffix.lower() == ".zip":
+        if is_zip:
             extract_dir = path.parent / f"{path.stem}_extracted"
             target_file = self._extract_issp_zip(path, extract_dir)
-            if not dataset_id or dataset_name == "issp-unknown":
-                dataset_name = self._detect_issp_year(target_file)
         else:
             target_file = path
-            if not dataset_id or dataset_name == "issp-unknown":
-                dataset_name = self._detect_issp_year(target_file)
         
-        # Read with metadata when possible
-        df, meta = self._read_table_with_meta_fallback(target_file)
+        # Auto-detect from the data file name once it is known
+        if dataset_name == "issp-unknown":
+            dataset_name = self._detect_issp_year(target_file)
         
-        # Normalize
-        df = self._normalize(df)
+        # Read with metadata when possible. CSV/TSV go straight to Arrow so the
+        # Parquet writer does not need a second pandas -> Arrow conversion.
+        table = None
+        if target_file.suffix.lower() in ARROW_NATIVE_SUFFIXES:
+            table, meta = self._read_arrow_with_meta_fallback(target_file)
+            table = self._dictionary_encode_columns(self._normalize_arrow(table))
+        else:
+            df, meta = self._read_table_with_meta_fallback(target_file)
+            df = self._dictionary_encode_frame(self._normalize(df))
         
         # Write to cache
         cache_dir = get_dataset_dir("issp", dataset_name, version)
         manifest = IngestionManifest(
-            timestamp=pd.Timestamp.utcnow().to_pydatetime(),
+            timestamp=datetime.now(timezone.utc),
             adapter="issp",
             parameters={
                 "file_path": str(path),
@@ -391,37 +226,37 @@ class ISSPAdapter(BaseAdapter):
             value_labels=meta.get("value_labels", {}),
         )
         
+        # get_dataset_dir has already created the meta/processed/raw layout
         meta_dir = cache_dir / "meta"
         proc_dir = cache_dir / "processed"
         raw_dir = cache_dir / "raw"
-        meta_dir.mkdir(parents=True, exist_ok=True)
-        proc_dir.mkdir(parents=True, exist_ok=True)
-        raw_dir.mkdir(parents=True, exist_ok=True)
         
-        # Copy original file to raw cache
-        import shutil
-        if path.suffix.lower() == ".zip":
-            shutil.copy2(path, raw_dir / path.name)
-        else:
-            shutil.copy2(target_file, raw_dir / target_file.name)
+        # Link (or copy) original file into raw cache while the Parquet file is written
+        raw_src = path if is_zip else target_file
+        raw_future = self._cache_raw_file_async(raw_src, raw_dir / raw_src.name)
         
         manifest_path = meta_dir / "ingestion_manifest.json"
-        manifest_path.write_text(manifest.to_json(), encoding="utf-8")
+        write_text_atomic(manifest_path, manifest.to_json())
         
         # Save normalized parquet with Arrow metadata
         out_path = proc_dir / "data.parquet"
-        self._write_parquet_with_metadata(
-            df=df,
-            output_path=out_path,
-            dataset_id=f"issp:{dataset_name}",
-            source="issp",
-            adapter="issp",
-            manifest_path=manifest_path,
-            variable_labels=manifest.variable_labels,
-            value_labels=manifest.value_labels,
-        )
+        write_kwargs = {
+            "output_path": out_path,
+            "dataset_id": f"issp:{dataset_name}",
+            "source": "issp",
+            "adapter": "issp",
+            "manifest_path": manifest_path,
+            "variable_labels": manifest.variable_labels,
+            "value_labels": manifest.value_labels,
+        }
+        if table is not None:
+            df = self._write_arrow_overlapped(table, **write_kwargs)
+        else:
+            self._write_parquet_with_metadata(df=df, **write_kwargs)
+        
+        raw_future.result()
         
-        # Index the dataset
-        self._index_dataset_safe(f"issp:{dataset_name}", manifest_path)
+        # Index the dataset in the background; ingest returns without waiting
+        self._index_dataset_async(f"issp:{dataset_name}", manifest_path)
         
         return df
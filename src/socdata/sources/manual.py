@@ -1,18 +1,19 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from pathlib import Path
-import zipfile
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List
 
 import pandas as pd
 
-from .base import BaseAdapter
-from ..core.exceptions import MetadataError, ParserError, SearchIndexError, StorageError
+from ..core.exceptions import MetadataError, ParserError
+from ..core.logging import get_logger
+from ..core.models import IngestionManifest
 from ..core.parsers import read_table, read_table_with_meta
+from ..core.storage import get_dataset_dir, write_text_atomic
 from ..core.types import DatasetSummary
-from ..core.models import IngestionManifest
-from ..core.storage import get_dataset_dir
-from ..core.logging import get_logger
+from ..core.zip_utils import extract_data_file
+from .base import BaseAdapter
 
 logger = get_logger(__name__)
 
@@ -29,33 +30,12 @@ class ManualAdapter(BaseAdapter):
 		)
 
 	def _select_target_from_zip(self, zip_path: Path) -> Path:
-		# Extract zip to a sibling directory next to the zip
-		extract_dir = zip_path.with_suffix("")
-		extract_dir.mkdir(parents=True, exist_ok=True)
-		with zipfile.ZipFile(zip_path, "r") as zf:
-			zf.extractall(extract_dir)
-		# Pick a candidate data file
-		candidates: List[Tuple[int, Path]] = []
-		for p in extract_dir.rglob("*"):
-			if p.is_file() and p.suffix.lower() in {".dta", ".sav", ".zsav", ".csv", ".tsv"}:
-				candidates.append((p.stat().st_size, p))
-		if not candidates:
-			raise ValueError("No supported data files (.dta/.sav/.zsav/.csv/.tsv) found in extracted zip")
-		# Prefer Stata/SPSS formats, then largest
-		def rank(p: Path) -> int:
-			if p.suffix.lower() in {".dta", ".sav", ".zsav"}:
-				return 0
-			return 1
-		candidates.sort(key=lambda t: (rank(t[1]), -t[0]))
-		return candidates[0][1]
-
-	def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
-		# lowercase columns and strip whitespace in object columns
-		df = df.copy()
-		df.columns = [str(c).strip().lower() for c in df.columns]
-		for col in df.select_dtypes(include=["object"]).columns:
-			df[col] = df[col].astype(str).str.strip()
-		return df
+		# Extract only the selected data file (Stata/SPSS first, then largest) to a
+		# sibling directory next to the zip
+		target = extract_data_file(zip_path, zip_path.with_suffix(""), skip_dirs=())
+		if target is None:
+			raise ValueError("No supported data files (.dta/.sav/.zsav/.csv/.tsv) found in zip")
+		return target
 
 	def ingest(self, dataset_id: str | None, *, file_path: str) -> pd.DataFrame:
 		path = Path(file_path)
@@ -78,17 +58,17 @@ class ManualAdapter(BaseAdapter):
 			df, meta = read_table_with_meta(target)
 		except (ParserError, MetadataError) as e:
 			# Expected errors - fallback to basic read
-			logger.debug(f"Failed to read metadata from {target}, falling back to basic read: {e}")
+			logger.debug("Failed to read metadata from %s, falling back to basic read: %s", target, e)
 			df = read_table(target)
 			meta = {"variable_labels": {}, "value_labels": {}}
 		except Exception as e:
 			# Unexpected errors - try fallback but log
-			logger.warning(f"Unexpected error reading metadata from {target}: {e}", exc_info=True)
+			logger.warning("Unexpected error reading metadata from %s: %s", target, e, exc_info=True)
 			try:
 				df = read_table(target)
 				meta = {"variable_labels": {}, "value_labels": {}}
 			except Exception as e2:
-				logger.error(f"Fallback read also failed for {target}: {e2}", exc_info=True)
+				logger.exception("Fallback read also failed for %s", target)
 				raise ParserError(f"Failed to read file {target}: {e2}") from e2
 
 		# Normalize
@@ -99,7 +79,7 @@ class ManualAdapter(BaseAdapter):
 		dsid = dataset_id or "manual:wvs"
 		cache_dir = get_dataset_dir(source, dsid.replace(":", "_"), version="latest")
 		manifest = IngestionManifest(
-			timestamp=pd.Timestamp.utcnow().to_pydatetime(),
+			timestamp=datetime.now(timezone.utc),
 			adapter="manual",
 			parameters={"file_path": str(path), "target": str(target), "recipe": str(recipe)},
 			source_hashes={},
@@ -110,59 +90,29 @@ class ManualAdapter(BaseAdapter):
 			variable_labels=meta.get("variable_labels", {}),
 			value_labels=meta.get("value_labels", {}),
 		)
+		# get_dataset_dir has already created the meta/processed/raw layout
 		meta_dir = cache_dir / "meta"
 		proc_dir = cache_dir / "processed"
-		meta_dir.mkdir(parents=True, exist_ok=True)
-		proc_dir.mkdir(parents=True, exist_ok=True)
 		manifest_path = meta_dir / "ingestion_manifest.json"
-		manifest_path.write_text(manifest.to_json(), encoding="utf-8")
-
-		# Save normalized parquet with Arrow metadata
-		try:
-			import json as _json
-			import pyarrow as pa
-			import pyarrow.parquet as pq
-			table = pa.Table.from_pandas(df, preserve_index=False)
-			meta_bytes = table.schema.metadata or {}
-			aug = {
-				b"socdata.dataset_id": dsid.encode("utf-8"),
-				b"socdata.source": source.encode("utf-8"),
-				b"socdata.adapter": b"manual",
-				b"socdata.manifest_path": str(manifest_path).encode("utf-8"),
-				b"socdata.variable_labels": _json.dumps(manifest.variable_labels).encode("utf-8"),
-				b"socdata.value_labels": _json.dumps(manifest.value_labels).encode("utf-8"),
-			}
-			new_schema = table.schema.with_metadata({**meta_bytes, **aug})
-			table = table.replace_schema_metadata(new_schema.metadata)
-			out_path = proc_dir / "data.parquet"
-			pq.write_table(table, out_path)
-		except (OSError, IOError, PermissionError) as e:
-			# File system errors - try fallback
-			logger.warning(f"Failed to write Parquet metadata for {dsid} (filesystem error): {e}", exc_info=True)
-			try:
-				df.to_parquet(out_path, index=False)
-			except Exception as e2:
-				logger.error(f"Fallback Parquet write also failed for {dsid}: {e2}", exc_info=True)
-				raise StorageError(f"Failed to write Parquet file {out_path}: {e2}") from e2
-		except Exception as e:
-			# Other errors (e.g., pyarrow errors) - try fallback
-			logger.warning(f"Failed to write Parquet metadata for {dsid}: {e}", exc_info=True)
-			try:
-				df.to_parquet(out_path, index=False)
-			except Exception as e2:
-				logger.error(f"Fallback Parquet write also failed for {dsid}: {e2}", exc_info=True)
-				raise StorageError(f"Failed to write Parquet file {out_path}: {e2}") from e2
+		# Serialize once: the same JSON goes to the manifest file and the Parquet schema
+		manifest_json = manifest.to_json()
+		write_text_atomic(manifest_path, manifest_json)
+
+		# Save normalized parquet; the socdata.* schema metadata is merged in the same write
+		self._write_parquet_with_metadata(
+			df=df,
+			output_path=proc_dir / "data.parquet",
+			dataset_id=dsid,
+			source=source,
+			adapter="manual",
+			manifest_path=manifest_path,
+			variable_labels=manifest.variable_labels,
+			value_labels=manifest.value_labels,
+			manifest_json=manifest_json,
+		)
 
-		# Index the dataset
-		try:
-			from ..core.registry import index_dataset_from_manifest
-			index_dataset_from_manifest(dsid, str(manifest_path))
-		except SearchIndexError as e:
-			# Expected index errors - log but don't fail ingestion
-			logger.warning(f"Failed to index dataset {dsid}: {e}", exc_info=True)
-		except Exception as e:
-			# Unexpected errors - log with full traceback
-			logger.error(f"Unexpected error indexing dataset {dsid}: {e}", exc_info=True)
+		# Index the dataset in the background; ingest returns without waiting
+		self._index_dataset_async(dsid, manifest_path)
 
 		return df
 
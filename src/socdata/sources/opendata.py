@@ -6,22 +6,30 @@ Supports various open data portals like data.gov, data.gouv.fr, etc.
 
 from __future__ import annotations
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from urllib.parse import urlparse
 
 import pandas as pd
-import requests
 
 from .base import BaseAdapter
-from ..core.config import get_config
+from ..core.config import SocDataConfig, get_config
 from ..core.download import download_file
+from ..core.http import get_session
 from ..core.logging import get_logger
+from ..core.parsers import read_csv_fast, read_csv_filtered
+from ..core.serialization import loads
+from ..core.storage import get_dataset_dir
 from ..core.types import DatasetSummary
 
 logger = get_logger(__name__)
 
+# Concurrent CKAN requests and downloads per call; portals rate-limit aggressive clients
+_MAX_CONCURRENT_REQUESTS = 5
+# Resource formats load() prefers
+_TABULAR_FORMATS = ("CSV", "TSV")
+
 
 class OpenDataAdapter(BaseAdapter):
     """
@@ -57,18 +65,8 @@ class OpenDataAdapter(BaseAdapter):
         Note: This may return a limited set or require API key for full access.
         """
         try:
-            cfg = get_config()
-            headers = {"User-Agent": cfg.user_agent}
-            
             # Try to get package list (datasets)
-            response = requests.get(
-                f"{self.api_url}/package_list",
-                headers=headers,
-                timeout=cfg.timeout_seconds,
-            )
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._fetch_json("package_list")
             if data.get("success") and "result" in data:
                 packages = data["result"][:100]  # Limit to first 100 for performance
                 return [
@@ -110,31 +108,12 @@ class OpenDataAdapter(BaseAdapter):
         
         # Try to get package metadata
         try:
-            cfg = get_config()
-            headers = {"User-Agent": cfg.user_agent}
-            
-            response = requests.get(
-                f"{self.api_url}/package_show",
-                params={"id": package_name},
-                headers=headers,
-                timeout=cfg.timeout_seconds,
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            if not data.get("success") or "result" not in data:
-                raise ValueError(f"Package '{package_name}' not found")
-            
-            package = data["result"]
-            resources = package.get("resources", [])
-            
-            if not resources:
-                raise ValueError(f"No resources found for package '{package_name}'")
+            resources = self._package_resources(package_name)
             
             # Find CSV or compatible resource
             csv_resource = None
             for resource in resources:
-                if resource.get("format", "").upper() in ["CSV", "TSV"]:
+                if resource.get("format", "").upper() in _TABULAR_FORMATS:
                     csv_resource = resource
                     break
             
@@ -148,37 +127,126 @@ class OpenDataAdapter(BaseAdapter):
                 raise ValueError(f"No URL found for resource in package '{package_name}'")
             
             # Download to temp location
-            from ..core.storage import get_dataset_dir
-            
-            cache_dir = get_dataset_dir("opendata", package_name, "latest")
-            temp_file = cache_dir / "raw" / Path(url).name
-            
+            temp_file = self._resource_path(package_name, url)
             if not temp_file.exists():
                 download_file(url, temp_file)
             
-            # Read the file
-            df = pd.read_csv(temp_file)
+            sep = "\t" if temp_file.suffix.lower() == ".tsv" else ","
+            if not filters:
+                return read_csv_fast(temp_file, sep=sep)
             
-            # Apply filters if provided
-            if filters:
-                df = self._apply_filters(df, filters)
-            
-            return df
+            # Filter block by block so only matching rows are kept in memory; the
+            # streaming reader infers dtypes like read_csv_fast does
+            return read_csv_filtered(temp_file, lambda chunk: self._apply_filters(chunk, filters), sep=sep)
             
         except Exception as e:
             logger.error(f"Failed to load dataset {dataset_id} from open data portal: {e}", exc_info=True)
             raise
 
-    def _apply_filters(self, df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
-        """Apply filters to DataFrame."""
-        result = df.copy()
-        for key, value in filters.items():
-            if key in result.columns:
-                if isinstance(value, list):
-                    result = result[result[key].isin(value)]
-                else:
-                    result = result[result[key] == value]
-        return result
+    def load_many(
+        self, dataset_ids: Iterable[str], *, filters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Load several datasets from the portal concurrently.
+        
+        Metadata requests and downloads of different packages overlap instead of
+        running one after another; at most _MAX_CONCURRENT_REQUESTS run at once.
+        An error loading any dataset is re-raised.
+        
+        Args:
+            dataset_ids: Dataset IDs in the format accepted by load()
+            filters: Optional filters applied to every dataset
+        
+        Returns:
+            Mapping of dataset ID to DataFrame, in the order of dataset_ids
+        """
+        ids = list(dict.fromkeys(dataset_ids))
+        if not ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(_MAX_CONCURRENT_REQUESTS, len(ids))) as executor:
+            frames = executor.map(lambda dataset_id: self.load(dataset_id, filters=filters or {}), ids)
+            return dict(zip(ids, frames))
+
+    def download_resources(self, dataset_id: str, *, formats: Iterable[str] = _TABULAR_FORMATS) -> List[Path]:
+        """
+        Download all resources of a package in the given formats concurrently.
+        
+        Files already in the raw cache are not downloaded again, and load()
+        picks them up from there.
+        
+        Args:
+            dataset_id: Format 'opendata:package-name'
+            formats: CKAN resource formats to fetch (case-insensitive)
+        
+        Returns:
+            Paths of the cached files, in the order of the package's resources
+        """
+        parts = dataset_id.split(":")
+        if len(parts) < 2:
+            raise ValueError(f"Invalid Open Data dataset ID: {dataset_id}")
+        package_name = parts[1]
+        
+        wanted = {f.upper() for f in formats}
+        urls = [
+            r["url"]
+            for r in self._package_resources(package_name)
+            if r.get("url") and r.get("format", "").upper() in wanted
+        ]
+        if not urls:
+            return []
+        
+        def fetch(url: str) -> Path:
+            dest = self._resource_path(package_name, url)
+            if not dest.exists():
+                download_file(url, dest)
+            return dest
+        
+        # Downloads overlap their connection setup and transfer time
+        with ThreadPoolExecutor(max_workers=min(_MAX_CONCURRENT_REQUESTS, len(urls))) as executor:
+            return list(executor.map(fetch, urls))
+
+    def _package_resources(self, package_name: str) -> List[Dict[str, Any]]:
+        """Return the resource list of a CKAN package, raising ValueError if there is none."""
+        data = self._fetch_json("package_show", params={"id": package_name})
+        if not data.get("success") or "result" not in data:
+            raise ValueError(f"Package '{package_name}' not found")
+        
+        resources = data["result"].get("resources", [])
+        if not resources:
+            raise ValueError(f"No resources found for package '{package_name}'")
+        return resources
+
+    def _resource_path(self, package_name: str, url: str) -> Path:
+        """Return the raw cache path for a resource URL (query strings are dropped)."""
+        cache_dir = get_dataset_dir("opendata", package_name, "latest")
+        return cache_dir / "raw" / Path(urlparse(url).path).name
+
+    def _fetch_json(
+        self, action: str, *, params: Optional[Dict[str, Any]] = None, cfg: Optional[SocDataConfig] = None
+    ) -> Dict[str, Any]:
+        """
+        Call a CKAN API action and return the decoded JSON response.
+        
+        Uses the shared HTTP session, so connections to the portal are reused
+        across calls and threads, and 429/5xx responses are retried.
+        
+        Args:
+            action: CKAN action name (e.g. 'package_show')
+            params: Optional query parameters
+            cfg: Optional config; resolved via get_config() if omitted
+        
+        Returns:
+            Decoded JSON response
+        """
+        cfg = cfg or get_config()
+        response = get_session().get(
+            f"{self.api_url}/{action}",
+            params=params,
+            headers={"User-Agent": cfg.user_agent},
+            timeout=cfg.timeout_seconds,
+        )
+        response.raise_for_status()
+        return loads(response.content)
 
     def ingest(self, dataset_id: str | None, *, file_path: str) -> pd.DataFrame:
         """
@@ -193,8 +261,6 @@ class OpenDataAdapter(BaseAdapter):
         """
         # If URL, download first
         if file_path.startswith(("http://", "https://")):
-            from ..core.storage import get_dataset_dir
-            
             dataset_name = dataset_id.split(":")[1] if dataset_id and ":" in dataset_id else "opendata-unknown"
             cache_dir = get_dataset_dir("opendata", dataset_name, "latest")
             temp_file = cache_dir / "raw" / Path(urlparse(file_path).path).name
@@ -211,13 +277,13 @@ class OpenDataAdapter(BaseAdapter):
         
         # Detect format and read
         if path.suffix.lower() in [".csv", ".tsv"]:
-            df = pd.read_csv(path, sep="\t" if path.suffix.lower() == ".tsv" else ",")
+            df = read_csv_fast(path, sep="\t" if path.suffix.lower() == ".tsv" else ",")
         elif path.suffix.lower() == ".json":
             df = pd.read_json(path)
         elif path.suffix.lower() == ".xlsx":
             df = pd.read_excel(path)
         else:
             # Try CSV as fallback
-            df = pd.read_csv(path)
+            df = read_csv_fast(path)
         
         return df
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import zipfile
+import shutil
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -9,8 +10,10 @@ import pandas as pd
 from .base import BaseAdapter
 from ..core.types import DatasetSummary
 from ..core.models import IngestionManifest
-from ..core.storage import get_dataset_dir
+from ..core.storage import get_dataset_dir, write_text_atomic
 from ..core.download import download_file
+from ..core.parsers import ARROW_NATIVE_SUFFIXES, read_csv_fast
+from ..core.zip_utils import extract_data_file
 
 
 class SOEPAdapter(BaseAdapter):
@@ -85,52 +88,13 @@ class SOEPAdapter(BaseAdapter):
         Returns:
             Path to the main data file
         """
-        extract_dir.mkdir(parents=True, exist_ok=True)
-        
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            zf.extractall(extract_dir)
-        
-        # Find data files (prefer Stata/SPSS, then largest CSV)
-        candidates: List[tuple[int, Path]] = []
-        for p in extract_dir.rglob("*"):
-            if p.is_file() and p.suffix.lower() in {".dta", ".sav", ".zsav", ".csv", ".tsv"}:
-                # Skip documentation subdirectories
-                if "doc" in p.parts or "readme" in p.name.lower():
-                    continue
-                candidates.append((p.stat().st_size, p))
-        
-        if not candidates:
+        # Pick the data file from the archive listing and extract only that file
+        target = extract_data_file(zip_path, extract_dir)
+        if target is None:
             raise ValueError(
                 f"No supported data files (.dta/.sav/.zsav/.csv/.tsv) found in ODF ZIP: {zip_path}"
             )
-        
-        # Prefer Stata/SPSS formats, then largest file
-        def rank(p: Path) -> int:
-            if p.suffix.lower() in {".dta", ".sav", ".zsav"}:
-                return 0
-            return 1
-        
-        candidates.sort(key=lambda t: (rank(t[1]), -t[0]))
-        return candidates[0][1]
-
-    def _apply_filters(self, df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
-        """Apply filters to DataFrame."""
-        result = df.copy()
-        for key, value in filters.items():
-            if key in result.columns:
-                if isinstance(value, list):
-                    result = result[result[key].isin(value)]
-                else:
-                    result = result[result[key] == value]
-        return result
-
-    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Normalize column names and string values."""
-        df = df.copy()
-        df.columns = [str(c).strip().lower() for c in df.columns]
-        for col in df.select_dtypes(include=["object"]).columns:
-            df[col] = df[col].astype(str).str.strip()
-        return df
+        return target
 
     def ingest(self, dataset_id: str | None, *, file_path: str) -> pd.DataFrame:
         """
@@ -172,8 +136,14 @@ class SOEPAdapter(BaseAdapter):
         extract_dir = path.parent / f"{path.stem}_extracted"
         target_file = self._extract_odf_zip(path, extract_dir)
         
-        # Read with metadata when possible
-        df, meta = self._read_table_with_meta_fallback(target_file)
+        # Read with metadata when possible; extracted CSV/TSV files carry none and
+        # go through the pyarrow CSV engine
+        if target_file.suffix.lower() in ARROW_NATIVE_SUFFIXES:
+            sep = "\t" if target_file.suffix.lower() == ".tsv" else None
+            df = read_csv_fast(target_file, sep=sep)
+            meta: Dict[str, Any] = {"variable_labels": {}, "value_labels": {}}
+        else:
+            df, meta = self._read_table_with_meta_fallback(target_file)
         
         # Normalize
         df = self._normalize(df)
@@ -181,7 +151,7 @@ class SOEPAdapter(BaseAdapter):
         # Write to cache
         cache_dir = get_dataset_dir("soep", dataset_name, version="latest")
         manifest = IngestionManifest(
-            timestamp=pd.Timestamp.utcnow().to_pydatetime(),
+            timestamp=datetime.now(timezone.utc),
             adapter="soep",
             parameters={
                 "file_path": str(path),
@@ -200,16 +170,12 @@ class SOEPAdapter(BaseAdapter):
         meta_dir = cache_dir / "meta"
         proc_dir = cache_dir / "processed"
         raw_dir = cache_dir / "raw"
-        meta_dir.mkdir(parents=True, exist_ok=True)
-        proc_dir.mkdir(parents=True, exist_ok=True)
-        raw_dir.mkdir(parents=True, exist_ok=True)
         
         # Copy original ZIP to raw cache
-        import shutil
         shutil.copy2(path, raw_dir / path.name)
         
         manifest_path = meta_dir / "ingestion_manifest.json"
-        manifest_path.write_text(manifest.to_json(), encoding="utf-8")
+        write_text_atomic(manifest_path, manifest.to_json())
         
         # Save normalized parquet with Arrow metadata
         out_path = proc_dir / "data.parquet"
@@ -0,0 +1,73 @@
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from socdata.core.storage import get_dataset_dir
+from socdata.sources.cses import CSESAdapter
+
+
+def test_cses_ingest_links_raw_file(tmp_path: Path):
+    """Test that the raw cache shares the source file instead of copying it."""
+    csv_path = tmp_path / "cses_module_5.csv"
+    csv_path.write_text("Country,Vote\nDE, A \nFR,B\n")
+    df = CSESAdapter().ingest("cses:cses-module-5-raw", file_path=str(csv_path))
+    assert df["vote"].tolist() == ["A", "B"]
+    
+    raw_file = get_dataset_dir("cses", "cses-module-5-raw", "latest") / "raw" / csv_path.name
+    assert raw_file.read_text() == csv_path.read_text()
+    if os.stat(raw_file).st_dev == os.stat(csv_path).st_dev:
+        assert os.path.samefile(raw_file, csv_path)
+
+
+def test_cses_normalize_uses_shared_implementation():
+    """Test that CSES normalizes in place and keeps missing values."""
+    df = pd.DataFrame({" Country ": [" DE ", None]})
+    assert CSESAdapter()._normalize(df) is df
+    assert list(df.columns) == ["country"]
+    assert df["country"].tolist()[0] == "DE"
+    assert df["country"].isna().tolist() == [False, True]
+
+
+def test_cses_zip_extracts_only_the_data_file(tmp_path: Path):
+    """Test that only the ranked data file is extracted from a CSES ZIP."""
+    import zipfile
+    
+    dta_path = tmp_path / "cses_module_5.dta"
+    pd.DataFrame({"country": ["DE", "FR"]}).to_stata(dta_path, write_index=False)
+    zip_path = tmp_path / "cses_module_5.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.write(dta_path, "cses_module_5.dta")
+        zf.writestr("cses_module_5_extra.csv", "country\n" + "DE\n" * 10000)
+        zf.writestr("cses_codebook.csv", "variable\ncountry\n")
+        zf.writestr("doc/readme.txt", "docs")
+    
+    extract_dir = tmp_path / "extracted"
+    target = CSESAdapter()._extract_cses_zip(zip_path, extract_dir)
+    
+    # Stata wins over the larger CSV; nothing else is decompressed
+    assert target == extract_dir / "cses_module_5.dta"
+    assert [p.name for p in extract_dir.rglob("*") if p.is_file()] == ["cses_module_5.dta"]
+
+
+def test_cses_url_ingest_reuses_download():
+    """Test that re-ingesting a URL reuses the earlier download."""
+    import uuid
+    from unittest.mock import patch
+    
+    # Downloads land in the shared cache, so use a name no earlier run has fetched
+    name = f"cses_module_5_{uuid.uuid4().hex}.csv"
+    
+    def _download(url, dest):
+        dest.write_text("Country,Vote\nDE,A\n")
+        return dest
+    
+    adapter = CSESAdapter()
+    with patch("socdata.sources.cses.download_file", side_effect=_download) as download:
+        for _ in range(2):
+            df = adapter.ingest("cses:cses-module-5-url", file_path=f"https://cses.org/{name}")
+    
+    assert download.call_count == 1
+    assert df["vote"].tolist() == ["A"]
+    raw_file = get_dataset_dir("cses", "cses-module-5-url", "latest") / "raw" / name
+    assert raw_file.read_text() == "Country,Vote\nDE,A\n"
@@ -0,0 +1,57 @@
+from pathlib import Path
+
+from socdata.api import ingest, load
+
+
+def _make_ess_csv(tmp_path: Path) -> Path:
+    csv_path = tmp_path / "ESS9e03.csv"
+    csv_path.write_text(
+        "cntry,essround,agea\nDE,9,35\nFR,9,40\nDE,9,52\nAT,9,28\n"
+    )
+    return csv_path
+
+
+def test_ess_load_with_filters(tmp_path: Path):
+    """Test ESS load with scalar and list filters."""
+    ingest("ess:ess-round-9", file_path=str(_make_ess_csv(tmp_path)))
+    
+    df = load("ess:ess-round-9", filters={"cntry": "DE"})
+    assert len(df) == 2
+    assert all(df["cntry"] == "DE")
+    
+    df = load("ess:ess-round-9", filters={"cntry": ["DE", "AT"], "essround": 9})
+    assert len(df) == 3
+    assert set(df["cntry"]) == {"DE", "AT"}
+
+
+def test_ess_apply_filters_ignores_unknown_columns():
+    """Test that filters on missing columns leave the frame untouched."""
+    import pandas as pd
+
+    from socdata.sources.ess import ESSAdapter
+    
+    df = pd.DataFrame({"cntry": ["DE", "FR"], "agea": [30, None]})
+    adapter = ESSAdapter()
+    assert adapter._apply_filters(df, {"missing": 1}) is df
+    # Missing values never match
+    assert adapter._apply_filters(df, {"agea": [30.0]})["cntry"].tolist() == ["DE"]
+
+
+def test_ess_ingest_with_filters(tmp_path: Path):
+    """Test filtering the ingested frame without reloading it."""
+    df = ingest("ess:ess-round-9", file_path=str(_make_ess_csv(tmp_path)), filters={"cntry": "FR"})
+    assert df["agea"].tolist() == [40]
+
+
+def test_ess_ingest_detects_round_for_adapter_only_id(tmp_path: Path):
+    """Test that an adapter-only id still detects the round from a plain data file."""
+    import json
+    
+    csv_path = tmp_path / "ESS10e01_1.csv"
+    csv_path.write_text(f"cntry,essround,path\nDE,10,{tmp_path}\nFR,10,{tmp_path}\n")
+    ingest("ess", file_path=str(csv_path))
+    
+    manifest_path = Path.home() / ".socdata" / "ess" / "ess-round-10" / "latest" / "meta" / "ingestion_manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    assert manifest["dataset_id"] == "ess:ess-round-10"
+    assert manifest["parameters"]["target"] == str(csv_path)
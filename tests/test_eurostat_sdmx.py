@@ -1,5 +1,6 @@
 """Tests for Eurostat SDMX XML parsing."""
 
+import io
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -9,6 +10,22 @@ import pytest
 from socdata.sources.eurostat import EurostatAdapter
 
 
+def _mock_response(content: bytes) -> MagicMock:
+    """Build a streaming response mock that serves content from .raw."""
+    mock_response = MagicMock()
+    mock_response.__enter__.return_value = mock_response
+    mock_response.raw = io.BytesIO(content)
+    mock_response.raise_for_status = MagicMock()
+    return mock_response
+
+
+def _patch_session(**get_kwargs):
+    """Patch the shared HTTP session used by the Eurostat adapter."""
+    session = MagicMock()
+    session.get = MagicMock(**get_kwargs)
+    return patch('socdata.sources.eurostat.get_session', return_value=session)
+
+
 def test_parse_sdmx_xml_simple():
     """Test parsing simple SDMX XML structure."""
     # Sample SDMX XML structure
@@ -28,11 +45,9 @@ def test_parse_sdmx_xml_simple():
     adapter = EurostatAdapter()
     
     # Mock the API response
-    mock_response = MagicMock()
-    mock_response.content = sdmx_xml.encode('utf-8')
-    mock_response.raise_for_status = MagicMock()
+    mock_response = _mock_response(sdmx_xml.encode('utf-8'))
     
-    with patch('socdata.sources.eurostat.requests.get', return_value=mock_response):
+    with _patch_session(return_value=mock_response):
         with patch('socdata.sources.eurostat.get_config') as mock_config:
             mock_config.return_value.timeout_seconds = 60
             mock_config.return_value.user_agent = "socdata/0.1"
@@ -64,11 +79,9 @@ def test_parse_sdmx_xml_alternative_structure():
     
     adapter = EurostatAdapter()
     
-    mock_response = MagicMock()
-    mock_response.content = sdmx_xml.encode('utf-8')
-    mock_response.raise_for_status = MagicMock()
+    mock_response = _mock_response(sdmx_xml.encode('utf-8'))
     
-    with patch('socdata.sources.eurostat.requests.get', return_value=mock_response):
+    with _patch_session(return_value=mock_response):
         with patch('socdata.sources.eurostat.get_config') as mock_config:
             mock_config.return_value.timeout_seconds = 60
             mock_config.return_value.user_agent = "socdata/0.1"
@@ -85,11 +98,9 @@ def test_parse_sdmx_xml_invalid():
     """Test handling of invalid XML."""
     adapter = EurostatAdapter()
     
-    mock_response = MagicMock()
-    mock_response.content = b"<invalid xml>"
-    mock_response.raise_for_status = MagicMock()
+    mock_response = _mock_response(b"<invalid xml>")
     
-    with patch('socdata.sources.eurostat.requests.get', return_value=mock_response):
+    with _patch_session(return_value=mock_response):
         with patch('socdata.sources.eurostat.get_config') as mock_config:
             mock_config.return_value.timeout_seconds = 60
             mock_config.return_value.user_agent = "socdata/0.1"
@@ -104,11 +115,9 @@ def test_parse_sdmx_xml_empty():
     """Test handling of empty XML."""
     adapter = EurostatAdapter()
     
-    mock_response = MagicMock()
-    mock_response.content = b"<?xml version='1.0'?><root></root>"
-    mock_response.raise_for_status = MagicMock()
+    mock_response = _mock_response(b"<?xml version='1.0'?><root></root>")
     
-    with patch('socdata.sources.eurostat.requests.get', return_value=mock_response):
+    with _patch_session(return_value=mock_response):
         with patch('socdata.sources.eurostat.get_config') as mock_config:
             mock_config.return_value.timeout_seconds = 60
             mock_config.return_value.user_agent = "socdata/0.1"
@@ -125,7 +134,7 @@ def test_parse_sdmx_xml_network_error():
     
     import requests
     
-    with patch('socdata.sources.eurostat.requests.get', side_effect=requests.RequestException("Network error")):
+    with _patch_session(side_effect=requests.RequestException("Network error")):
         with patch('socdata.sources.eurostat.get_config') as mock_config:
             mock_config.return_value.timeout_seconds = 60
             mock_config.return_value.user_agent = "socdata/0.1"
@@ -134,3 +143,227 @@ def test_parse_sdmx_xml_network_error():
             
             # Should return None on network error
             assert result is None
+
+
+def test_list_datasets_curated_fallback(tmp_path):
+    """Test that the curated fallback reuses the summaries built at import."""
+    from socdata.sources import eurostat as eurostat_module
+    
+    adapter = EurostatAdapter()
+    
+    with patch('socdata.sources.eurostat.get_config') as mock_config:
+        mock_config.return_value.cache_dir = tmp_path
+        mock_config.return_value.eurostat_cache_ttl_hours = 168
+        mock_config.return_value.eurostat_async_refresh = False
+        with patch.object(EurostatAdapter, '_fetch_datasets_from_api', return_value=None), \
+             patch.object(EurostatAdapter, '_fetch_metadata_batch', return_value={}):
+            first = adapter.list_datasets()
+            # Second call is served from the cache file written by the first
+            second = adapter.list_datasets()
+    
+    assert first == second
+    assert first[0] is eurostat_module._CURATED_DATASETS[0]
+    assert second[0] is eurostat_module._CURATED_DATASETS[0]
+    assert (tmp_path / "eurostat_datasets.json").exists()
+
+
+def test_dataset_list_cache_round_trip(tmp_path):
+    """Test that the dataset list cache is compact and survives corruption."""
+    adapter = EurostatAdapter()
+    datasets = [{"code": "une_rt_m", "title": "Arbeitslosenquote – monatlich"}]
+    
+    with patch('socdata.sources.eurostat.get_config') as mock_config:
+        mock_config.return_value.cache_dir = tmp_path
+        mock_config.return_value.eurostat_cache_ttl_hours = 168
+        adapter._cache_dataset_list(datasets)
+        cache_file = tmp_path / "eurostat_datasets.json"
+        assert b"\n" not in cache_file.read_bytes()
+        assert adapter._get_cached_dataset_list() == datasets
+        
+        cache_file.write_bytes(b"\xff{not json")
+        assert adapter._get_cached_dataset_list() is None
+
+
+def test_dataset_list_cache_ttl(tmp_path):
+    """Test that expired and legacy cache files are not served."""
+    adapter = EurostatAdapter()
+    datasets = [{"code": "une_rt_m", "title": "Unemployment rate - monthly"}]
+    cache_file = tmp_path / "eurostat_datasets.json"
+    
+    with patch('socdata.sources.eurostat.get_config') as mock_config:
+        mock_config.return_value.cache_dir = tmp_path
+        mock_config.return_value.eurostat_cache_ttl_hours = 1
+        
+        with patch('socdata.sources.eurostat.time.time', return_value=1_000_000.0):
+            adapter._cache_dataset_list(datasets)
+        assert not cache_file.with_suffix(".tmp").exists()
+        
+        with patch('socdata.sources.eurostat.time.time', return_value=1_000_000.0 + 1800):
+            assert adapter._get_cached_dataset_list() == datasets
+        with patch('socdata.sources.eurostat.time.time', return_value=1_000_000.0 + 7200):
+            assert adapter._get_cached_dataset_list() is None
+        
+        # Legacy format (bare list without timestamp)
+        cache_file.write_text('[{"code": "une_rt_m", "title": "x"}]', encoding="utf-8")
+        assert adapter._get_cached_dataset_list() is None
+
+
+def test_dataset_list_cache_concurrent_writes(tmp_path):
+    """Test that concurrent cache writes use separate temp files and leave none behind."""
+    import threading
+    
+    adapter = EurostatAdapter()
+    
+    with patch('socdata.sources.eurostat.get_config') as mock_config:
+        mock_config.return_value.cache_dir = tmp_path
+        mock_config.return_value.eurostat_cache_ttl_hours = 168
+        with patch('socdata.sources.eurostat.logger') as logger:
+            threads = [
+                threading.Thread(
+                    target=adapter._cache_dataset_list,
+                    args=([{"code": f"ds_{i}", "title": str(i)}] * 200,),
+                )
+                for i in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            cached = adapter._get_cached_dataset_list()
+    
+    logger.warning.assert_not_called()
+    logger.error.assert_not_called()
+    assert len(cached) == 200
+    assert [p.name for p in tmp_path.iterdir()] == ["eurostat_datasets.json"]
+
+
+def test_fetch_metadata_batch_chunks_codes():
+    """Test that dataset metadata is fetched with one request per chunk."""
+    def _dataflows(*codes):
+        flows = "".join(
+            f'<Dataflow id="{code}"><common:Name xml:lang="en">{code} title</common:Name></Dataflow>'
+            for code in codes
+        )
+        return (
+            '<Structure xmlns="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/structure" '
+            'xmlns:common="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/common">'
+            f'<Dataflows>{flows}</Dataflows></Structure>'
+        ).encode()
+    
+    def _get(url, **kwargs):
+        codes = url.rsplit('/', 1)[1].split('+')
+        return _mock_response(_dataflows(*codes))
+    
+    adapter = EurostatAdapter()
+    codes = ["une_rt_m", "nama_10_gdp", "demo_pjan"]
+    
+    with patch('socdata.sources.eurostat.get_config') as mock_config:
+        mock_config.return_value.timeout_seconds = 60
+        mock_config.return_value.user_agent = "socdata/0.1"
+        with _patch_session(side_effect=_get) as get_session:
+            metadata = adapter._fetch_metadata_batch(codes, batch_size=2)
+    
+    assert get_session.return_value.get.call_count == 2
+    assert set(metadata) == set(codes)
+    assert metadata["demo_pjan"]["title"] == "demo_pjan title"
+    assert adapter._fetch_metadata_batch([]) == {}
+
+
+def test_fetch_metadata_batch_skips_failed_chunks():
+    """Test that a failing chunk does not discard the others."""
+    import requests
+    
+    ok = _mock_response(
+        b'<Structure xmlns="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/structure">'
+        b'<Dataflows><Dataflow id="une_rt_m"><Name>Unemployment</Name></Dataflow></Dataflows></Structure>'
+    )
+    
+    def _get(url, **kwargs):
+        if "une_rt_m" in url:
+            return ok
+        raise requests.ConnectionError("boom")
+    
+    adapter = EurostatAdapter()
+    with patch('socdata.sources.eurostat.get_config') as mock_config:
+        mock_config.return_value.timeout_seconds = 60
+        mock_config.return_value.user_agent = "socdata/0.1"
+        with _patch_session(side_effect=_get):
+            metadata = adapter._fetch_metadata_batch(["une_rt_m", "nama_10_gdp"], batch_size=1)
+    
+    assert list(metadata) == ["une_rt_m"]
+
+
+def test_list_datasets_curated_titles_from_batch(tmp_path):
+    """Test that the curated fallback resolves its titles with one batched dataflow request."""
+    adapter = EurostatAdapter()
+    dataflows = (
+        b'<Structure xmlns="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/structure">'
+        b'<Dataflows><Dataflow id="une_rt_m"><Name>Unemployment by sex and age - monthly data</Name>'
+        b'</Dataflow></Dataflows></Structure>'
+    )
+    
+    with patch('socdata.sources.eurostat.get_config') as mock_config:
+        mock_config.return_value.cache_dir = tmp_path
+        mock_config.return_value.eurostat_cache_ttl_hours = 168
+        mock_config.return_value.eurostat_async_refresh = False
+        mock_config.return_value.timeout_seconds = 60
+        mock_config.return_value.user_agent = "socdata/0.1"
+        with patch.object(EurostatAdapter, '_fetch_datasets_from_api', return_value=None), \
+             _patch_session(return_value=_mock_response(dataflows)) as get_session:
+            result = adapter.list_datasets()
+            cached = adapter._get_cached_dataset_list()
+    
+    # All curated codes fit in one request
+    assert get_session.return_value.get.call_count == 1
+    titles = {d.id: d.title for d in result}
+    assert titles["eurostat:une_rt_m"] == "Unemployment by sex and age - monthly data"
+    # Codes missing from the response keep their curated title
+    assert titles["eurostat:nama_10_gdp"] == "GDP and main components"
+    assert cached[0]["title"] == "Unemployment by sex and age - monthly data"
+
+
+def test_list_datasets_async_refresh(tmp_path):
+    """Test that a cold cache answers from the curated list and refreshes in the background."""
+    from socdata.sources import eurostat as eurostat_module
+    
+    adapter = EurostatAdapter()
+    api_datasets = [{"code": "une_rt_m", "title": "Unemployment rate - monthly"}]
+    
+    with patch('socdata.sources.eurostat.get_config') as mock_config:
+        mock_config.return_value.cache_dir = tmp_path
+        mock_config.return_value.eurostat_cache_ttl_hours = 168
+        mock_config.return_value.eurostat_async_refresh = True
+        with patch.object(EurostatAdapter, '_fetch_datasets_from_api', return_value=api_datasets) as fetch:
+            first = adapter.list_datasets()
+            eurostat_module._refresh_thread.join(timeout=5)
+            second = adapter.list_datasets()
+    
+    assert first == list(eurostat_module._CURATED_DATASETS)
+    assert [d.id for d in second] == ["eurostat:une_rt_m"]
+    # The fresh cache is served without another refresh
+    assert fetch.call_count == 1
+
+
+def test_list_datasets_refresh_follows_payload_timestamp(tmp_path):
+    """Test that the stale-while-revalidate refresh goes by the cached timestamp, not the file mtime."""
+    import os
+    
+    adapter = EurostatAdapter()
+    datasets = [{"code": "une_rt_m", "title": "Unemployment rate - monthly"}]
+    cache_file = tmp_path / "eurostat_datasets.json"
+    
+    with patch('socdata.sources.eurostat.get_config') as mock_config:
+        mock_config.return_value.cache_dir = tmp_path
+        mock_config.return_value.eurostat_cache_ttl_hours = 2
+        mock_config.return_value.eurostat_async_refresh = True
+        with patch('socdata.sources.eurostat.time.time', return_value=1_000_000.0):
+            adapter._cache_dataset_list(datasets)
+        # A touched file must not make the old payload look fresh
+        os.utime(cache_file, (1_005_000.0, 1_005_000.0))
+        
+        with patch('socdata.sources.eurostat.time.time', return_value=1_000_000.0 + 5000), \
+             patch.object(EurostatAdapter, '_schedule_refresh') as schedule:
+            result = adapter.list_datasets()
+    
+    assert [d.id for d in result] == ["eurostat:une_rt_m"]
+    schedule.assert_called_once()
@@ -0,0 +1,162 @@
+import zipfile
+from pathlib import Path
+
+from socdata.sources.evs import EVSAdapter
+
+
+def _make_evs_zip(tmp_path: Path, members: dict) -> Path:
+    zip_path = tmp_path / "ZA7503.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return zip_path
+
+
+def test_evs_extract_zip_prefers_largest_spss(tmp_path: Path):
+    """Test that SPSS/Stata files win over larger CSVs and docs are skipped."""
+    zip_path = _make_evs_zip(tmp_path, {
+        "doc/EVS_2017_manual.sav": "x" * 1000,
+        "EVS_2017_codebook.dta": "x" * 500,
+        "EVS_2017.csv": "x" * 200,
+        "EVS_2017_weights.sav": "x" * 10,
+        "EVS_2017.sav": "x" * 50,
+    })
+    
+    target = EVSAdapter()._extract_evs_zip(zip_path, tmp_path / "out")
+    assert target.name == "EVS_2017.sav"
+
+
+def test_evs_extract_zip_largest_csv(tmp_path: Path):
+    """Test that the largest CSV/TSV is chosen without SPSS/Stata files."""
+    zip_path = _make_evs_zip(tmp_path, {"small.csv": "a\n1", "EVS_1999.tsv": "a\n1\n2\n3"})
+    
+    target = EVSAdapter()._extract_evs_zip(zip_path, tmp_path / "out")
+    assert target.name == "EVS_1999.tsv"
+
+
+def test_evs_extract_zip_only_writes_data_file(tmp_path: Path):
+    """Test that documentation members are not extracted."""
+    zip_path = _make_evs_zip(tmp_path, {"doc/manual.pdf": "x" * 100, "EVS_2008.dta": "x"})
+    
+    target = EVSAdapter()._extract_evs_zip(zip_path, tmp_path / "out")
+    assert [p for p in (tmp_path / "out").rglob("*") if p.is_file()] == [target]
+
+
+def test_evs_ingest_caches_raw_file(tmp_path: Path):
+    """Test that ingest places the source file in the raw cache."""
+    from socdata.core.storage import get_dataset_dir
+    
+    csv_path = tmp_path / "EVS_1990.csv"
+    csv_path.write_text("country,year\nDE,1990\nFR,1990\n")
+    
+    df = EVSAdapter().ingest(None, file_path=str(csv_path))
+    assert len(df) == 2
+    raw_file = get_dataset_dir("evs", "evs-1990", "latest") / "raw" / "EVS_1990.csv"
+    assert raw_file.read_text() == csv_path.read_text()
+
+
+def test_evs_parquet_layout(tmp_path: Path):
+    """Test that EVS caches use ZSTD and dictionary-encoded country codes."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from socdata.core.storage import get_dataset_dir
+    
+    csv_path = tmp_path / "EVS_2008.csv"
+    csv_path.write_text("country,v1\nDE,1\nFR,2\nDE,3\n")
+    EVSAdapter().ingest(None, file_path=str(csv_path))
+    
+    parquet_path = get_dataset_dir("evs", "evs-2008", "latest") / "processed" / "data.parquet"
+    meta = pq.ParquetFile(parquet_path).metadata
+    assert meta.row_group(0).column(0).compression == "ZSTD"
+    assert pa.types.is_dictionary(pq.read_schema(parquet_path).field("country").type)
+
+
+def test_evs_ingest_dtypes_match_load(tmp_path: Path):
+    """Test that the pandas ingest path returns the categorical dtypes load() reads back."""
+    from socdata.api import load
+    
+    csv_path = tmp_path / "EVS_2017.csv"
+    # Unique content so an earlier run's cache is not reused
+    csv_path.write_text(f"country,v1,tag\nDE,1,{tmp_path}\nFR,2,{tmp_path}\nDE,3,{tmp_path}\n")
+    ingested = EVSAdapter().ingest("evs:evs-2017-dtypes", file_path=str(csv_path))
+    
+    assert ingested["country"].dtype == "category"
+    assert ingested.dtypes.to_dict() == load("evs:evs-2017-dtypes").dtypes.to_dict()
+
+
+def test_evs_load_with_filters(tmp_path: Path):
+    """Test EVS load with scalar and list filters."""
+    from socdata.api import load
+    
+    csv_path = tmp_path / "EVS_1981.csv"
+    csv_path.write_text("country,v1\nDE,1\nFR,2\nDE,3\nIT,4\n")
+    EVSAdapter().ingest(None, file_path=str(csv_path))
+    
+    df = load("evs:evs-1981", filters={"country": "DE"})
+    assert df["country"].tolist() == ["DE", "DE"]
+    
+    df = load("evs:evs-1981", filters={"country": ["FR", "IT"], "wave": 1981})
+    assert sorted(df["country"]) == ["FR", "IT"]
+
+
+def test_evs_apply_filters_single_mask():
+    """Test that filters combine into one mask and unknown keys are ignored."""
+    import pandas as pd
+    
+    df = pd.DataFrame({"country": ["DE", "FR", "DE"], "year": [1990, 1990, None]})
+    adapter = EVSAdapter()
+    assert adapter._apply_filters(df, {"wave": 1990}) is df
+    result = adapter._apply_filters(df, {"country": "DE", "year": [1990.0]})
+    assert result.index.tolist() == [0]
+
+
+def test_evs_reingest_unchanged_file_is_skipped(tmp_path: Path):
+    """Test that the manifest records the source hash and unchanged files are not re-read."""
+    import json
+    from unittest.mock import patch
+
+    from socdata.core.storage import file_sha256, get_dataset_dir
+    
+    csv_path = tmp_path / "EVS_1999.csv"
+    # Unique content so runs sharing the cache directory do not collide
+    csv_path.write_text(f"country,tag\nDE,{tmp_path}\nFR,{tmp_path}\n")
+    adapter = EVSAdapter()
+    adapter.ingest("evs:evs-1999-hash", file_path=str(csv_path))
+    
+    meta_dir = get_dataset_dir("evs", "evs-1999-hash", "latest") / "meta"
+    manifest = json.loads((meta_dir / "ingestion_manifest.json").read_text())
+    assert manifest["source_hashes"] == {str(csv_path): file_sha256(csv_path)}
+    assert not list(meta_dir.glob("*.tmp"))
+    
+    with patch.object(EVSAdapter, "_read_table_with_meta_fallback") as read:
+        df = adapter.ingest("evs:evs-1999-hash", file_path=str(csv_path))
+    read.assert_not_called()
+    assert df["country"].tolist() == ["DE", "FR"]
+
+
+def test_evs_reingest_unchanged_zip_skips_extraction(tmp_path: Path):
+    """Test that the source hash is checked before an unchanged ZIP is decompressed again."""
+    from unittest.mock import patch
+    
+    zip_path = tmp_path / "EVS_2008.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("data.csv", f"country,tag\nDE,{tmp_path}\n")
+    adapter = EVSAdapter()
+    adapter.ingest("evs:evs-2008-zip", file_path=str(zip_path))
+    
+    with patch.object(EVSAdapter, "_extract_evs_zip") as extract:
+        df = adapter.ingest("evs:evs-2008-zip", file_path=str(zip_path))
+    extract.assert_not_called()
+    assert df["country"].tolist() == ["DE"]
+
+
+def test_evs_normalize_in_place():
+    """Test that normalization mutates the freshly read frame instead of copying it."""
+    import pandas as pd
+    
+    df = pd.DataFrame({" Country ": [" DE ", "FR"], "V1": [1, 2]})
+    result = EVSAdapter()._normalize(df)
+    assert result is df
+    assert list(df.columns) == ["country", "v1"]
+    assert df["country"].tolist() == ["DE", "FR"]
@@ -37,6 +37,14 @@ def test_ingest_gss_file(tmp_path: Path):
     meta = table.schema.metadata or {}
     assert b"socdata.variable_labels" in meta
     assert b"socdata.value_labels" in meta
+    # CSV input has no labels; the empty mappings are stored without a JSON encoding pass
+    assert meta[b"socdata.value_labels"] == b"{}"
+    assert meta[b"socdata.dataset_id"] == b"gss:gss-2022"
+    # Cached Parquet uses ZSTD by default
+    assert pq.ParquetFile(parquet_path).metadata.row_group(0).column(0).compression == "ZSTD"
+    # Low-cardinality string columns are stored dictionary encoded
+    import pyarrow as pa
+    assert pa.types.is_dictionary(table.schema.field("sex").type)
     # Manifest JSON loads
     manifest = json.loads(manifest_path.read_text())
     assert manifest.get("adapter") == "gss"
@@ -66,3 +74,186 @@ def test_gss_load_with_filters(tmp_path: Path):
     df = load("gss:gss-2022", filters={"year": 2022})
     assert not df.empty
     assert all(df["year"] == 2022)
+
+
+def test_gss_apply_filters_single_mask():
+    """Test that scalar and list filters combine into one mask without copying."""
+    from socdata.sources.gss import GSSAdapter
+    
+    df = pd.DataFrame({"year": [2021, 2022, 2022], "sex": ["M", "F", "M"]})
+    adapter = GSSAdapter()
+    assert adapter._apply_filters(df, {"wtssall": 1.0}) is df
+    result = adapter._apply_filters(df, {"year": 2022, "sex": ["M"]})
+    assert result.index.tolist() == [2]
+
+
+def test_gss_normalize_in_place():
+    """Test that normalization does not copy the freshly read frame."""
+    from socdata.sources.gss import GSSAdapter
+    
+    df = pd.DataFrame({" YEAR ": [2022], "Sex": [" M "]})
+    assert GSSAdapter()._normalize(df) is df
+    assert list(df.columns) == ["year", "sex"]
+    assert df["sex"].tolist() == ["M"]
+
+
+def test_gss_normalize_keeps_missing_values_and_load_dtype():
+    """Test that trimming keeps nulls and yields the dtype a Parquet round trip gives."""
+    import pyarrow as pa
+
+    from socdata.sources.gss import GSSAdapter
+    
+    df = pd.DataFrame({"sex": [" M ", None, "F"], "code": pd.Series([" 1", 2, None], dtype=object)})
+    GSSAdapter()._normalize(df)
+    assert df["sex"].tolist()[::2] == ["M", "F"]
+    assert df["sex"].isna().tolist() == [False, True, False]
+    assert df["code"].tolist()[:2] == ["1", "2"]
+    assert df["code"].isna().tolist() == [False, False, True]
+    assert df["sex"].dtype == pa.Table.from_pandas(df).to_pandas()["sex"].dtype
+
+
+def test_gss_manifest_records_source_hash(tmp_path: Path):
+    """Test that the ingestion manifest records the SHA-256 of the source file."""
+    import hashlib
+    
+    csv_path = tmp_path / "GSS2022.csv"
+    # Unique content so an earlier run's cache is not reused
+    csv_path.write_text(f"year,tag\n2022,{tmp_path}\n")
+    ingest("gss:gss-2022", file_path=str(csv_path))
+    
+    manifest_path = Path.home() / ".socdata" / "gss" / "gss-2022" / "latest" / "meta" / "ingestion_manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    assert manifest["source_hashes"] == {str(csv_path): hashlib.sha256(csv_path.read_bytes()).hexdigest()}
+
+
+def test_gss_reingest_unchanged_file_is_skipped(tmp_path: Path):
+    """Test that re-ingesting an unchanged file reuses the processed cache."""
+    from unittest.mock import patch
+
+    from socdata.sources.gss import GSSAdapter
+    
+    csv_path = tmp_path / "GSS2022.csv"
+    csv_path.write_text(f"year,tag\n2022,{tmp_path}\n2021,{tmp_path}\n")
+    adapter = GSSAdapter()
+    adapter.ingest("gss:gss-2022-hash", file_path=str(csv_path))
+    
+    with patch.object(GSSAdapter, "_read_arrow_with_meta_fallback") as read:
+        df = adapter.ingest("gss:gss-2022-hash", file_path=str(csv_path))
+    read.assert_not_called()
+    assert df["year"].tolist() == [2021, 2022]
+    
+    # A changed source is ingested again
+    csv_path.write_text(f"year,tag\n2020,{tmp_path}\n")
+    df = adapter.ingest("gss:gss-2022-hash", file_path=str(csv_path))
+    assert df["year"].tolist() == [2020]
+
+
+def test_gss_first_ingest_hashes_in_background(tmp_path: Path):
+    """Test that a first ingest does not hash the source before reading it."""
+    import hashlib
+    import uuid
+    from unittest.mock import patch
+
+    from socdata.sources.gss import GSSAdapter
+    
+    dataset_name = f"gss-2022-{uuid.uuid4().hex[:8]}"
+    csv_path = tmp_path / "GSS2022.csv"
+    csv_path.write_text("year,sex\n2022,M\n")
+    
+    with patch("socdata.sources.gss.file_sha256") as sync_hash:
+        GSSAdapter().ingest(f"gss:{dataset_name}", file_path=str(csv_path))
+    sync_hash.assert_not_called()
+    
+    manifest_path = Path.home() / ".socdata" / "gss" / dataset_name / "latest" / "meta" / "ingestion_manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    assert manifest["source_hashes"] == {str(csv_path): hashlib.sha256(csv_path.read_bytes()).hexdigest()}
+
+
+def test_gss_load_memory_maps_parquet(tmp_path: Path):
+    """Test that cached reads memory-map the Parquet file and push filters down."""
+    from unittest.mock import patch
+
+    from socdata.api import load
+    
+    csv_path = tmp_path / "GSS2022.csv"
+    csv_path.write_text("year,sex\n2022,M\n2021,F\n")
+    ingest("gss:gss-2022", file_path=str(csv_path))
+    
+    with patch("pyarrow.parquet.read_table", wraps=pq.read_table) as read_table:
+        df = load("gss:gss-2022", filters={"year": 2022})
+    assert df["year"].tolist() == [2022]
+    kwargs = read_table.call_args.kwargs
+    assert kwargs["memory_map"] is True
+    assert kwargs["filters"] == [("year", "==", 2022)]
+
+
+def test_gss_cumulative_clustered_by_year(tmp_path: Path):
+    """Test that the cached file is sorted by year while ingest keeps the source row order."""
+    from socdata.core.storage import get_dataset_dir
+    
+    csv_path = tmp_path / "GSS7222_R1.csv"
+    # Unique content so an earlier run's cache is not reused
+    csv_path.write_text(f"year,tag\n2022,{tmp_path}\n1972,{tmp_path}\n2022,{tmp_path}\n1990,{tmp_path}\n")
+    df = ingest("gss:gss-cumulative-test", file_path=str(csv_path))
+    assert df["year"].tolist() == [2022, 1972, 2022, 1990]
+    
+    parquet_path = get_dataset_dir("gss", "gss-cumulative-test") / "processed" / "data.parquet"
+    assert pq.read_table(parquet_path).column("year").to_pylist() == [1972, 1990, 2022, 2022]
+    stats = pq.ParquetFile(parquet_path).metadata.row_group(0).column(0).statistics
+    assert (stats.min, stats.max) == (1972, 2022)
+
+
+def test_gss_non_arrow_ingest_keeps_row_order(tmp_path: Path):
+    """Test that the pandas read path sorts only the Arrow table that is written."""
+    from socdata.core.storage import get_dataset_dir
+    
+    dta_path = tmp_path / "GSS7222_R2.dta"
+    pd.DataFrame({"year": [2022, 1972], "tag": [str(tmp_path)] * 2}).to_stata(dta_path, write_index=False)
+    df = ingest("gss:gss-cumulative-order", file_path=str(dta_path))
+    assert df["year"].tolist() == [2022, 1972]
+    assert df.index.tolist() == [0, 1]
+    
+    parquet_path = get_dataset_dir("gss", "gss-cumulative-order") / "processed" / "data.parquet"
+    assert pq.read_table(parquet_path).column("year").to_pylist() == [1972, 2022]
+
+
+def test_gss_apply_filters_typed_fast_paths():
+    """Test filters on NumPy numeric, Arrow-backed and mismatched-type columns."""
+    import pyarrow as pa
+
+    from socdata.sources.gss import GSSAdapter
+    
+    df = pd.DataFrame({
+        "year": [2021, 2022, 2022],
+        "sex": pd.arrays.ArrowExtensionArray(pa.array(["M", None, "F"])),
+    })
+    adapter = GSSAdapter()
+    assert adapter._apply_filters(df, {"year": [2022], "sex": "F"}).index.tolist() == [2]
+    assert adapter._apply_filters(df, {"sex": ["M", "F"]}).index.tolist() == [0, 2]
+    # Values of another type never match instead of raising
+    assert adapter._apply_filters(df, {"year": "2022"}).empty
+    assert adapter._apply_filters(df, {"sex": 1}).empty
+
+
+def test_gss_mixed_type_column_falls_back_to_pandas_writer(tmp_path: Path):
+    """Test that a column Arrow cannot convert skips clustering instead of failing the ingest."""
+    import uuid
+    from unittest.mock import patch
+
+    from socdata.sources.gss import GSSAdapter
+    
+    dataset_name = f"gss-mixed-{uuid.uuid4().hex[:8]}"
+    dta_path = tmp_path / "GSS2022.dta"
+    pd.DataFrame({"year": [2022, 2021], "sex": ["M", "F"]}).to_stata(dta_path, write_index=False)
+    
+    mixed = pd.DataFrame({"year": [2022, 2021], "note": pd.Series([1, "x"], dtype=object)})
+    
+    # Keep the mixed column as read; pa.Table.from_pandas rejects it
+    with patch.object(GSSAdapter, "_read_table_with_meta_fallback", return_value=(mixed, {})), \
+         patch.object(GSSAdapter, "_normalize", side_effect=lambda df: df), \
+         patch.object(GSSAdapter, "_write_parquet_with_metadata") as write:
+        df = GSSAdapter().ingest(f"gss:{dataset_name}", file_path=str(dta_path))
+    
+    write.assert_called_once()
+    assert write.call_args.kwargs["df"] is df
+    assert df["year"].tolist() == [2022, 2021]
@@ -54,3 +54,55 @@ def test_icpsr_auto_detect_study_number(tmp_path: Path):
     cache_root = Path.home() / ".socdata" / "icpsr"
     # The exact path depends on detection logic, but should exist
     assert any(cache_root.rglob("*/processed/data.parquet"))
+
+
+def test_icpsr_extract_zip_only_data_member(tmp_path: Path):
+    """Test that only the main data file is extracted, skipping docs and tiny files."""
+    from socdata.sources.icpsr import ICPSRAdapter
+    
+    zip_path = tmp_path / "ICPSR_24680.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("ICPSR_24680/documentation/big.sav", "x" * 5000)
+        zf.writestr("ICPSR_24680/setup/setup.dta", "x" * 5000)
+        zf.writestr("ICPSR_24680/tiny.sav", "x" * 10)
+        zf.writestr("ICPSR_24680/DS0001/24680-0001-Data.csv", "x" * 4000)
+        zf.writestr("ICPSR_24680/DS0001/24680-0001-Data.dta", "x" * 2000)
+    
+    extract_dir = tmp_path / "out"
+    target = ICPSRAdapter()._extract_icpsr_zip(zip_path, extract_dir)
+    assert target == extract_dir / "ICPSR_24680" / "DS0001" / "24680-0001-Data.dta"
+    assert [p for p in extract_dir.rglob("*") if p.is_file()] == [target]
+
+
+def test_icpsr_detect_study_patterns():
+    """Test study detection from common file names."""
+    from socdata.sources.icpsr import ICPSRAdapter
+    
+    adapter = ICPSRAdapter()
+    assert adapter._detect_icpsr_study(Path("ICPSR_36873.zip")) == "icpsr-36873"
+    assert adapter._detect_icpsr_study(Path("anes_timeseries_2020.dta")) == "anes-2020"
+    assert adapter._detect_icpsr_study(Path("wvs_wave7.sav")) == "wvs-wave7"
+    assert adapter._detect_icpsr_study(Path("study.csv")) == "icpsr-general"
+
+
+def test_icpsr_reingest_unchanged_zip_skips_extraction(tmp_path: Path):
+    """Test that an unchanged ZIP is recognised by its hash before anything is extracted."""
+    from unittest.mock import patch
+
+    from socdata.sources.icpsr import ICPSRAdapter
+    
+    # Unique content (over the 1 KB data threshold) so an earlier run's cache is not reused
+    rows = "".join(f"{i},{tmp_path}\n" for i in range(100))
+    zip_path = tmp_path / "ICPSR_13579.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("ICPSR_13579/ICPSR_13579.csv", "id,tag\n" + rows)
+    
+    adapter = ICPSRAdapter()
+    first = adapter.ingest(None, file_path=str(zip_path))
+    with patch.object(ICPSRAdapter, "_extract_icpsr_zip") as extract:
+        second = adapter.ingest(None, file_path=str(zip_path))
+    
+    extract.assert_not_called()
+    assert second["id"].tolist() == first["id"].tolist()
+    manifest_path = Path.home() / ".socdata" / "icpsr" / "icpsr-13579" / "latest" / "meta" / "ingestion_manifest.json"
+    assert str(zip_path) in json.loads(manifest_path.read_text())["source_hashes"]
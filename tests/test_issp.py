@@ -0,0 +1,274 @@
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+from socdata.sources.issp import ISSPAdapter
+
+
+def test_issp_load_pushes_filters_down(tmp_path: Path):
+    """Test that load filters are passed to the Parquet reader."""
+    from unittest.mock import patch
+    
+    csv_path = tmp_path / "ISSP2015.csv"
+    csv_path.write_text("country,v1\nDE,1\nFR,2\nDE,3\n")
+    adapter = ISSPAdapter()
+    adapter.ingest("issp:issp-2015-load", file_path=str(csv_path))
+    
+    with patch("pyarrow.parquet.read_table", wraps=pq.read_table) as read_table:
+        df = adapter.load("issp:issp-2015-load", filters={"country": "DE"})
+    assert read_table.call_args.kwargs["filters"] == [("country", "==", "DE")]
+    assert df["country"].tolist() == ["DE", "DE"]
+    
+    # Keys missing from the file are ignored rather than failing the read
+    df = adapter.load("issp:issp-2015-load", filters={"country": ["FR"], "missing": 1})
+    assert df["country"].tolist() == ["FR"]
+
+
+def test_issp_load_memory_maps_parquet(tmp_path: Path):
+    """Test that unfiltered loads also read the cache through a memory map."""
+    from unittest.mock import patch
+    
+    csv_path = tmp_path / "ISSP2016.csv"
+    csv_path.write_text("country,v1\nDE,1\nFR,2\n")
+    adapter = ISSPAdapter()
+    adapter.ingest("issp:issp-2016-mmap", file_path=str(csv_path))
+    
+    with patch("pyarrow.parquet.read_table", wraps=pq.read_table) as read_table:
+        df = adapter.load("issp:issp-2016-mmap", filters={})
+    assert len(df) == 2
+    assert read_table.call_args.kwargs["memory_map"] is True
+
+
+def test_issp_normalize_in_place():
+    """Test that normalization mutates the freshly read frame instead of copying it."""
+    import pandas as pd
+    
+    df = pd.DataFrame({" Country ": [" DE ", "FR"], "V1": [1, 2]})
+    result = ISSPAdapter()._normalize(df)
+    assert result is df
+    assert list(df.columns) == ["country", "v1"]
+    assert df["country"].tolist() == ["DE", "FR"]
+
+
+def test_issp_ingest_csv_via_arrow(tmp_path: Path):
+    """Test that CSV files are normalized and written without a pandas round trip."""
+    from unittest.mock import patch
+    
+    csv_path = tmp_path / "ISSP2017.csv"
+    csv_path.write_text(" Country ,V1\n DE ,1\nFR,2\n")
+    with patch.object(ISSPAdapter, "_write_parquet_with_metadata") as write_df:
+        df = ISSPAdapter().ingest("issp:issp-2017-arrow", file_path=str(csv_path))
+    write_df.assert_not_called()
+    assert list(df.columns) == ["country", "v1"]
+    assert df["country"].tolist() == ["DE", "FR"]
+
+
+def test_issp_list_datasets_returns_fresh_list():
+    """Test that the static catalogue is shared but callers get their own list."""
+    adapter = ISSPAdapter()
+    datasets = adapter.list_datasets()
+    assert len(datasets) == 35
+    assert datasets[0].id == "issp:issp-1985"
+    datasets.clear()
+    assert len(adapter.list_datasets()) == 35
+
+
+def test_issp_extract_zip_prefers_spss(tmp_path: Path):
+    """Test that SPSS/Stata files win over larger CSVs and docs are skipped."""
+    import zipfile
+    
+    zip_path = tmp_path / "ZA6900.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("doc/ISSP2015_manual.sav", "x" * 1000)
+        zf.writestr("ISSP2015.csv", "x" * 200)
+        zf.writestr("data/ISSP2015.sav", "x" * 50)
+    
+    target = ISSPAdapter()._extract_issp_zip(zip_path, tmp_path / "out")
+    assert target == tmp_path / "out" / "data" / "ISSP2015.sav"
+    assert target.read_text() == "x" * 50
+
+
+def test_issp_extract_zip_skips_documentation(tmp_path: Path):
+    """Test that documentation and non-data members are not written to disk."""
+    import zipfile
+    
+    zip_path = tmp_path / "ZA5900.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("doc/ISSP2012_manual.pdf", "x" * 100)
+        zf.writestr("ISSP2012_codebook.sav", "x" * 100)
+        zf.writestr("ISSP2012.dta", "x")
+    
+    target = ISSPAdapter()._extract_issp_zip(zip_path, tmp_path / "out")
+    assert [p for p in (tmp_path / "out").rglob("*") if p.is_file()] == [target]
+
+
+def test_issp_extract_zip_only_writes_selected_member(tmp_path: Path):
+    """Test that only the chosen data file is decompressed."""
+    import zipfile
+    
+    zip_path = tmp_path / "ZA4850.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("ISSP2009_extra.csv", "x" * 100)
+        zf.writestr("ISSP2009.sav", "x")
+    
+    target = ISSPAdapter()._extract_issp_zip(zip_path, tmp_path / "out")
+    assert target.name == "ISSP2009.sav"
+    assert [p for p in (tmp_path / "out").rglob("*") if p.is_file()] == [target]
+
+
+def test_issp_parquet_layout(tmp_path: Path):
+    """Test that ISSP caches use ZSTD, a page index and ISSP-sized row groups."""
+    from socdata.core.storage import get_dataset_dir
+    
+    csv_path = tmp_path / "ISSP2010.csv"
+    csv_path.write_text("country,v1\nDE,1\nFR,2\n")
+    ISSPAdapter().ingest("issp:issp-2010-layout", file_path=str(csv_path))
+    
+    parquet_path = get_dataset_dir("issp", "issp-2010-layout", "latest") / "processed" / "data.parquet"
+    column = pq.ParquetFile(parquet_path).metadata.row_group(0).column(0)
+    assert column.compression == "ZSTD"
+    assert column.has_column_index and column.has_offset_index
+    assert ISSPAdapter.parquet_row_group_size == 64_000
+
+
+def test_issp_dictionary_encodes_categoricals(tmp_path: Path):
+    """Test that country codes and other low-cardinality strings are stored as dictionaries."""
+    import pyarrow as pa
+
+    from socdata.core.storage import get_dataset_dir
+    
+    rows = "\n".join(f"{c},{i},id{i}" for i, c in enumerate(["DE", "FR"] * 100))
+    csv_path = tmp_path / "ISSP2018.csv"
+    csv_path.write_text(f"c_alphan,v1,respid\n{rows}\n")
+    ISSPAdapter().ingest("issp:issp-2018-dict", file_path=str(csv_path))
+    
+    schema = pq.read_schema(get_dataset_dir("issp", "issp-2018-dict", "latest") / "processed" / "data.parquet")
+    assert pa.types.is_dictionary(schema.field("c_alphan").type)
+    assert not pa.types.is_dictionary(schema.field("respid").type)
+
+
+def test_issp_ingest_dtypes_match_load(tmp_path: Path):
+    """Test that ingest returns dictionary-encoded columns with the dtypes load() reads back."""
+    from socdata.api import load
+    
+    rows = "\n".join(f"{c},{i},id{i}" for i, c in enumerate(["DE", "FR"] * 100))
+    csv_path = tmp_path / "ISSP2018.csv"
+    csv_path.write_text(f"c_alphan,v1,respid\n{rows}\n")
+    ingested = ISSPAdapter().ingest("issp:issp-2018-dtypes", file_path=str(csv_path))
+    
+    assert ingested["c_alphan"].dtype == "category"
+    assert ingested.dtypes.to_dict() == load("issp:issp-2018-dtypes").dtypes.to_dict()
+
+
+def test_issp_detect_year_patterns():
+    """Test year detection from common ISSP file names."""
+    adapter = ISSPAdapter()
+    assert adapter._detect_issp_year(Path("ISSP1985.sav")) == "issp-1985"
+    assert adapter._detect_issp_year(Path("issp_1990.dta")) == "issp-1990"
+    assert adapter._detect_issp_year(Path("ZA5900_v4-0-0.sav")) == "issp-unknown"
+    assert adapter._detect_issp_year(Path("ZA1234_ISSP2000.sav")) == "issp-2000"
+
+
+def test_issp_ingest_links_raw_file(tmp_path: Path):
+    """Test that the raw cache shares the source file instead of copying it."""
+    import os
+
+    from socdata.core.storage import get_dataset_dir
+    
+    csv_path = tmp_path / "ISSP2019.csv"
+    csv_path.write_text("country,v1\nDE,1\n")
+    ISSPAdapter().ingest("issp:issp-2019-raw", file_path=str(csv_path))
+    
+    raw_file = get_dataset_dir("issp", "issp-2019-raw", "latest") / "raw" / "ISSP2019.csv"
+    assert raw_file.read_text() == csv_path.read_text()
+    if os.stat(raw_file).st_dev == os.stat(csv_path).st_dev:
+        assert os.path.samefile(raw_file, csv_path)
+
+
+def test_issp_ingest_indexes_in_background(tmp_path: Path):
+    """Test that search indexing is handed to the background executor."""
+    from unittest.mock import patch
+    
+    csv_path = tmp_path / "ISSP2020.csv"
+    csv_path.write_text("country,v1\nDE,1\n")
+    with patch.object(ISSPAdapter, "_index_dataset_safe") as index_sync, \
+            patch.object(ISSPAdapter, "_index_dataset_async") as index_async:
+        ISSPAdapter().ingest("issp:issp-2020-index", file_path=str(csv_path))
+    index_sync.assert_not_called()
+    dataset_id, manifest_path = index_async.call_args.args
+    assert dataset_id == "issp:issp-2020-index"
+    assert manifest_path.name == "ingestion_manifest.json"
+
+
+def test_issp_apply_filters_single_mask():
+    """Test that all filters are combined into one mask and unknown keys are ignored."""
+    import pandas as pd
+    
+    df = pd.DataFrame({"country": ["DE", "FR", "DE", "IT"], "year": [2015, 2015, 2016, 2015]})
+    result = ISSPAdapter()._apply_filters(df, {"country": ["DE", "IT"], "year": 2015, "missing": 1})
+    assert result["country"].tolist() == ["DE", "IT"]
+    assert len(df) == 4
+
+
+def test_issp_arrow_write_overlaps_conversion(tmp_path: Path):
+    """Test that the Parquet write of Arrow ingests runs off the calling thread."""
+    import threading
+    from unittest.mock import patch
+    
+    csv_path = tmp_path / "ISSP2014.csv"
+    csv_path.write_text("country,v1\nDE,1\nFR,2\n")
+    write_threads = []
+    original = ISSPAdapter._write_arrow_with_metadata
+    
+    def record(self, table, **kwargs):
+        write_threads.append(threading.current_thread())
+        return original(self, table, **kwargs)
+    
+    with patch.object(ISSPAdapter, "_write_arrow_with_metadata", record):
+        df = ISSPAdapter().ingest("issp:issp-2014-overlap", file_path=str(csv_path))
+    assert df["country"].tolist() == ["DE", "FR"]
+    assert write_threads and write_threads[0] is not threading.current_thread()
+    # Not queued behind background indexing or raw-file copies
+    assert write_threads[0].name.startswith("socdata-write")
+
+
+def test_issp_ingest_detects_year_once(tmp_path: Path):
+    """Test that the dataset name is detected from the target file exactly once."""
+    from unittest.mock import patch
+
+    from socdata.core.storage import get_dataset_dir
+    
+    csv_path = tmp_path / "ISSP1999.csv"
+    csv_path.write_text(f"country,tag\nDE,{tmp_path}\n")
+    with patch.object(ISSPAdapter, "_detect_issp_year", wraps=ISSPAdapter()._detect_issp_year) as detect:
+        ISSPAdapter().ingest(None, file_path=str(csv_path))
+    detect.assert_called_once_with(csv_path)
+    assert (get_dataset_dir("issp", "issp-1999", "latest") / "processed" / "data.parquet").exists()
+    
+    with patch.object(ISSPAdapter, "_detect_issp_year") as detect:
+        ISSPAdapter().ingest("issp:issp-1999-named:v2", file_path=str(csv_path))
+    detect.assert_not_called()
+    assert (get_dataset_dir("issp", "issp-1999-named", "v2") / "processed" / "data.parquet").exists()
+
+
+def test_issp_load_arrow_dtypes(tmp_path: Path):
+    """Test that arrow_dtypes returns Arrow-backed columns from load."""
+    from unittest.mock import patch
+
+    import pandas as pd
+
+    from socdata.core.config import get_config
+    
+    csv_path = tmp_path / "ISSP2013.csv"
+    csv_path.write_text("country,v1\nDE,1\nFR,2\nDE,3\n")
+    adapter = ISSPAdapter()
+    adapter.ingest("issp:issp-2013-arrow", file_path=str(csv_path))
+    
+    with patch.object(get_config(), "arrow_dtypes", True):
+        df = adapter.load("issp:issp-2013-arrow", filters={})
+        filtered = adapter.load("issp:issp-2013-arrow", filters={"country": "DE"})
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+    assert filtered["country"].tolist() == ["DE", "DE"]
+    
+    df = adapter.load("issp:issp-2013-arrow", filters={})
+    assert not any(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
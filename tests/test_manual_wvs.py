@@ -34,4 +34,37 @@ def test_ingest_manual_wvs_zip(tmp_path: Path):
 	assert b"socdata.value_labels" in meta
 	# Manifest JSON loads
 	manifest = json.loads(manifest_path.read_text())
-	assert manifest.get("adapter") == "manual"
\ No newline at end of file
+	assert manifest.get("adapter") == "manual"
+	# The same manifest is embedded in the Parquet schema
+	assert json.loads(meta[b"socdata.manifest_json"]) == manifest
+
+def test_manual_select_target_prefers_spss(tmp_path: Path):
+	from socdata.sources.manual import ManualAdapter
+
+	zip_path = tmp_path / "wvs7.zip"
+	with zipfile.ZipFile(zip_path, "w") as zf:
+		zf.writestr("WVS_big.csv", "x" * 200)
+		zf.writestr("data/WVS_Wave7.sav", "x" * 10)
+	target = ManualAdapter()._select_target_from_zip(zip_path)
+	assert target == tmp_path / "wvs7" / "data" / "WVS_Wave7.sav"
+	assert target.read_text() == "x" * 10
+
+
+def test_manual_parquet_uses_write_options(tmp_path: Path):
+	zip_path = _make_zip(tmp_path)
+	ingest("manual:wvs", file_path=str(zip_path))
+	parquet_path = Path.home() / ".socdata" / "manual" / "manual_wvs" / "latest" / "processed" / "data.parquet"
+	column = pq.ParquetFile(parquet_path).metadata.row_group(0).column(0)
+	assert column.compression == "ZSTD"
+	assert column.has_column_index
+
+
+def test_manual_select_target_extracts_only_data_file(tmp_path: Path):
+	from socdata.sources.manual import ManualAdapter
+
+	zip_path = tmp_path / "wvs6.zip"
+	with zipfile.ZipFile(zip_path, "w") as zf:
+		zf.writestr("WVS_Wave6.dta", "x" * 10)
+		zf.writestr("WVS_Wave6_questionnaire.pdf", "x" * 1000)
+	target = ManualAdapter()._select_target_from_zip(zip_path)
+	assert [p for p in (tmp_path / "wvs6").rglob("*") if p.is_file()] == [target]
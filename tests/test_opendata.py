@@ -0,0 +1,100 @@
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from socdata.core.parsers import read_csv_filtered
+from socdata.sources.opendata import OpenDataAdapter
+
+
+def _response(payload: bytes) -> MagicMock:
+    response = MagicMock()
+    response.content = payload
+    response.raise_for_status.return_value = None
+    return response
+
+
+def test_opendata_list_datasets_uses_shared_session():
+    """Test that the package list is fetched through the pooled HTTP session."""
+    session = MagicMock()
+    session.get.return_value = _response(b'{"success": true, "result": ["census_2020", "air_quality"]}')
+    
+    with patch("socdata.sources.opendata.get_session", return_value=session):
+        datasets = OpenDataAdapter("https://portal.example/").list_datasets()
+    
+    assert [d.id for d in datasets] == ["opendata:census_2020", "opendata:air_quality"]
+    assert session.get.call_args.args[0] == "https://portal.example/api/3/action/package_list"
+
+
+def test_opendata_load_many_runs_concurrently(tmp_path: Path):
+    """Test that load_many overlaps loads and keeps the requested order."""
+    adapter = OpenDataAdapter("https://portal.example")
+    barrier = threading.Barrier(2, timeout=5)
+    
+    def fake_load(dataset_id, *, filters):
+        # Both loads must be in flight at the same time to pass the barrier
+        barrier.wait()
+        return dataset_id.upper()
+    
+    with patch.object(adapter, "load", side_effect=fake_load):
+        result = adapter.load_many(["opendata:a", "opendata:b", "opendata:a"])
+    
+    assert list(result.items()) == [("opendata:a", "OPENDATA:A"), ("opendata:b", "OPENDATA:B")]
+    assert adapter.load_many([]) == {}
+
+
+def test_opendata_download_resources_fetches_tabular_resources_concurrently(tmp_path: Path):
+    """Test that download_resources downloads matching resources in parallel into the raw cache."""
+    adapter = OpenDataAdapter("https://portal.example")
+    session = MagicMock()
+    session.get.return_value = _response(
+        b'{"success": true, "result": {"resources": ['
+        b'{"format": "csv", "url": "https://portal.example/files/a.csv?v=2"},'
+        b'{"format": "PDF", "url": "https://portal.example/files/doc.pdf"},'
+        b'{"format": "TSV", "url": "https://portal.example/files/b.tsv"}]}}'
+    )
+    barrier = threading.Barrier(2, timeout=5)
+    
+    def fake_download(url, dest):
+        barrier.wait()
+        dest.write_text(url)
+    
+    with patch("socdata.sources.opendata.get_session", return_value=session), \
+         patch("socdata.sources.opendata.get_dataset_dir", return_value=tmp_path), \
+         patch("socdata.sources.opendata.download_file", side_effect=fake_download) as download:
+        (tmp_path / "raw").mkdir()
+        paths = adapter.download_resources("opendata:pkg")
+        # Cached files are not downloaded again
+        assert adapter.download_resources("opendata:pkg") == paths
+    
+    assert paths == [tmp_path / "raw" / "a.csv", tmp_path / "raw" / "b.tsv"]
+    assert download.call_count == 2
+
+
+def test_opendata_load_filtered_matches_unfiltered_dtypes(tmp_path: Path):
+    """Test that filtered loads stream the file and return what an unfiltered load would."""
+    adapter = OpenDataAdapter("https://portal.example")
+    (tmp_path / "raw").mkdir()
+    (tmp_path / "raw" / "data.csv").write_text(
+        "region,value,share,note,flag,empty,when\n"
+        + "".join(
+            f"{'north' if i % 3 == 0 else 'south'},{i},{i / 4},{'None' if i % 4 == 0 else 'n'},"
+            f"{'true' if i % 2 else 'false'},,2024-01-0{i % 9 + 1} 00:00:00\n"
+            for i in range(10)
+        )
+    )
+    session = MagicMock()
+    session.get.return_value = _response(
+        b'{"success": true, "result": {"resources": [{"format": "CSV", "url": "https://portal.example/data.csv"}]}}'
+    )
+    
+    with patch("socdata.sources.opendata.get_session", return_value=session), \
+         patch("socdata.sources.opendata.get_dataset_dir", return_value=tmp_path), \
+         patch("socdata.sources.opendata.read_csv_filtered", wraps=read_csv_filtered) as streamed:
+        full = adapter.load("opendata:pkg", filters=None)
+        filtered = adapter.load("opendata:pkg", filters={"region": "north"})
+    
+    streamed.assert_called_once()
+    assert filtered["value"].tolist() == [0, 3, 6, 9]
+    pd.testing.assert_frame_equal(filtered, full[full["region"] == "north"])
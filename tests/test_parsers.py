@@ -1,11 +1,18 @@
 """Tests for socdata.core.parsers module."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
 
-from socdata.core.parsers import read_table, read_table_with_meta
+from socdata.core.parsers import (
+    read_arrow_table,
+    read_csv_fast,
+    read_csv_filtered,
+    read_table,
+    read_table_with_meta,
+)
 
 
 def test_read_table_csv(tmp_path):
@@ -144,3 +151,87 @@ def test_read_table_with_meta_sav_not_found(tmp_path):
     # This will fail because file doesn't exist
     with pytest.raises((FileNotFoundError, ValueError)):
         read_table_with_meta(sav_file)
+
+
+def test_read_arrow_table_sniffs_delimiter(tmp_path):
+    """Test reading a semicolon-delimited CSV directly into Arrow."""
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text("col1;col2\n1;a\n3;b")
+    
+    table = read_arrow_table(csv_file)
+    assert table.column_names == ["col1", "col2"]
+    assert table.num_rows == 2
+    assert table.column("col2").to_pylist() == ["a", "b"]
+
+
+def test_read_arrow_table_unsupported_format(tmp_path):
+    """Test that non-delimited formats are rejected."""
+    with pytest.raises(ValueError):
+        read_arrow_table(tmp_path / "test.sav")
+
+
+def test_read_csv_fast_same_engine_for_all_sizes(tmp_path):
+    """Test that small and large files go through the pyarrow engine and infer the same dtypes."""
+    small = tmp_path / "small.csv"
+    small.write_text("a;when\n1;2024-01-01 10:00:00\n")
+    large = tmp_path / "large.csv"
+    large.write_text("a;when\n" + "1;2024-01-01 10:00:00\n" * 300_000)
+    
+    with patch("socdata.core.parsers.pd.read_csv", wraps=pd.read_csv) as read_csv:
+        small_df = read_csv_fast(small, sep=None)
+        assert read_csv.call_args.kwargs["engine"] == "pyarrow"
+        large_df = read_csv_fast(large, sep=None)
+        assert read_csv.call_args.kwargs["engine"] == "pyarrow"
+    
+    assert len(large_df) == 300_000
+    assert small_df.dtypes.to_dict() == large_df.dtypes.to_dict()
+
+
+def test_read_csv_fast_falls_back_to_c_engine(tmp_path):
+    """Test that files the pyarrow engine rejects are re-read with the C engine."""
+    csv_file = tmp_path / "data.csv"
+    csv_file.write_text("a,b\n1,2\n3,4\n")
+    real_read_csv = pd.read_csv
+    
+    def fake_read_csv(path, **kwargs):
+        if kwargs.get("engine") == "pyarrow":
+            raise ValueError("unsupported")
+        return real_read_csv(path, **kwargs)
+    
+    with patch("socdata.core.parsers.pd.read_csv", side_effect=fake_read_csv) as read_csv, \
+         patch("socdata.core.parsers.logger") as logger:
+        df = read_csv_fast(csv_file)
+    
+    assert [c.kwargs["engine"] for c in read_csv.call_args_list] == ["pyarrow", "c"]
+    assert len(df) == 2
+    logger.debug.assert_called_once()
+
+
+def test_read_csv_filtered_streams_blocks(tmp_path):
+    """Test that filtered reads convert one bounded block at a time and match a full read."""
+    csv_file = tmp_path / "data.csv"
+    csv_file.write_text("id,group,score\n" + "".join(f"{i},{'a' if i % 2 else 'b'},{i / 2}\n" for i in range(2000)))
+    
+    chunk_sizes = []
+    
+    def keep_a(chunk):
+        chunk_sizes.append(len(chunk))
+        return chunk[chunk["group"] == "a"]
+    
+    df = read_csv_filtered(csv_file, keep_a, block_size=1024)
+    full = read_csv_fast(csv_file)
+    
+    assert len(chunk_sizes) > 10
+    assert max(chunk_sizes) < 200
+    pd.testing.assert_frame_equal(df, full[full["group"] == "a"])
+
+
+def test_read_csv_filtered_falls_back_to_full_read(tmp_path):
+    """Test that a later block that does not fit the inferred types falls back to a full read."""
+    csv_file = tmp_path / "data.csv"
+    csv_file.write_text("id,value\n" + "".join(f"{i},{i}\n" for i in range(500)) + "500,x\n")
+    
+    df = read_csv_filtered(csv_file, lambda chunk: chunk[chunk["id"] >= 499], block_size=256)
+    
+    assert df["id"].tolist() == [499, 500]
+    assert df["value"].tolist() == ["499", "x"]
@@ -0,0 +1,28 @@
+"""Tests for socdata.core.serialization module."""
+
+import json
+
+from socdata.core import serialization
+from socdata.core.serialization import dumps_bytes, loads
+
+
+def test_dumps_bytes_roundtrip():
+    """Test that serialized labels round-trip through loads."""
+    labels = {"age": "Alter", "sex": {"1": "männlich", "2": "weiblich"}}
+    data = dumps_bytes(labels)
+    assert isinstance(data, bytes)
+    assert loads(data) == labels
+    assert json.loads(data.decode("utf-8")) == labels
+
+
+def test_dumps_bytes_empty_dict():
+    """Test that empty dicts serialize to an empty JSON object."""
+    assert dumps_bytes({}) == b"{}"
+
+
+def test_dumps_bytes_stdlib_fallback(monkeypatch):
+    """Test serialization without orjson installed."""
+    monkeypatch.setattr(serialization, "orjson", None)
+    data = dumps_bytes({"a": "ä"})
+    assert data == '{"a":"ä"}'.encode()
+    assert loads(data) == {"a": "ä"}
@@ -48,3 +48,33 @@ def test_soep_list_datasets():
     datasets = list_datasets(source="soep")
     assert len(datasets) > 0
     assert any(ds.id == "soep:soep-core" for ds in datasets)
+
+
+def test_soep_normalize_and_filter_without_copy():
+    """Test that SOEP uses the shared in-place normalization and single-mask filter."""
+    from socdata.sources.soep import SOEPAdapter
+    
+    adapter = SOEPAdapter()
+    df = pd.DataFrame({" PID ": [1, 2, 3], "Sex": [" m ", "f", "m"]})
+    result = adapter._normalize(df)
+    assert result is df
+    assert list(df.columns) == ["pid", "sex"]
+    
+    filtered = adapter._apply_filters(df, {"sex": "m", "missing": 1})
+    assert filtered["pid"].tolist() == [1, 3]
+    assert adapter._apply_filters(df, {"missing": 1}) is df
+
+
+def test_soep_csv_uses_pyarrow_engine(tmp_path: Path):
+    """Test that CSV files extracted from an ODF ZIP are read with the pyarrow engine."""
+    from unittest.mock import patch
+    
+    zip_path = tmp_path / "soep_csv.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("soep_data.csv", f"id;tag\n1;{tmp_path}\n2;{tmp_path}\n")
+    
+    with patch("socdata.core.parsers.pd.read_csv", wraps=pd.read_csv) as read_csv:
+        df = ingest("soep:soep-csv", file_path=str(zip_path))
+    
+    assert read_csv.call_args.kwargs["engine"] == "pyarrow"
+    assert df["id"].tolist() == [1, 2]
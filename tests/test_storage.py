@@ -0,0 +1,72 @@
+"""Tests for socdata.core.storage module."""
+
+from socdata.core.storage import cache_raw_file, hash_files
+
+
+def test_cache_raw_file(tmp_path):
+    """Test placing a file in the raw cache."""
+    src = tmp_path / "source.sav"
+    src.write_bytes(b"data")
+    dst = tmp_path / "raw" / "source.sav"
+    dst.parent.mkdir()
+
+    assert cache_raw_file(src, dst) == dst
+    assert dst.read_bytes() == b"data"
+
+
+def test_cache_raw_file_replaces_existing(tmp_path):
+    """Test that a stale cached file is replaced."""
+    src = tmp_path / "source.sav"
+    src.write_bytes(b"new")
+    dst = tmp_path / "cached.sav"
+    dst.write_bytes(b"old")
+
+    cache_raw_file(src, dst)
+    assert dst.read_bytes() == b"new"
+    # Calling again with the same file is a no-op
+    cache_raw_file(src, dst)
+    assert dst.read_bytes() == b"new"
+
+
+def test_hash_files(tmp_path):
+    """Test that files are hashed concurrently and duplicates collapse."""
+    import hashlib
+    
+    a = tmp_path / "a.csv"
+    b = tmp_path / "b.csv"
+    a.write_bytes(b"a,b\n1,2\n")
+    b.write_bytes(b"c\n3\n")
+    
+    hashes = hash_files([a, b, a])
+    assert hashes == {
+        str(a): hashlib.sha256(a.read_bytes()).hexdigest(),
+        str(b): hashlib.sha256(b.read_bytes()).hexdigest(),
+    }
+    assert hash_files([a]) == {str(a): hashes[str(a)]}
+
+
+def test_cache_raw_file_without_hardlinks(tmp_path):
+    """Test the kernel-side copy used when hard links are not possible."""
+    from unittest.mock import patch
+    
+    src = tmp_path / "source.dta"
+    src.write_bytes(b"x" * 100_000)
+    dst = tmp_path / "cached.dta"
+    
+    with patch("socdata.core.storage.os.link", side_effect=OSError("cross-device")):
+        cache_raw_file(src, dst)
+    assert dst.read_bytes() == src.read_bytes()
+    assert not dst.samefile(src)
+
+
+def test_cache_raw_file_hardlink_flag(tmp_path):
+    """Test that hard links are used by default and can be turned off."""
+    src = tmp_path / "source.dta"
+    src.write_bytes(b"data")
+    
+    linked = cache_raw_file(src, tmp_path / "linked.dta")
+    assert linked.samefile(src)
+    
+    copied = cache_raw_file(src, tmp_path / "copied.dta", hardlink=False)
+    assert not copied.samefile(src)
+    assert copied.read_bytes() == b"data"
@@ -0,0 +1,83 @@
+"""Tests for socdata.core.zip_utils module."""
+
+import zipfile
+
+from socdata.core.zip_utils import extract_data_file, select_data_member, walk_files
+
+
+def _make_zip(path, members):
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return path
+
+
+def test_extract_data_file_prefers_spss_and_skips_docs(tmp_path):
+    """Test that SPSS/Stata files win over larger CSVs and docs are ignored."""
+    zip_path = _make_zip(tmp_path / "bundle.zip", {
+        "doc/manual.sav": "x" * 1000,
+        "data/codebook.dta": "x" * 500,
+        "data/big.csv": "x" * 200,
+        "data/main.sav": "x" * 10,
+    })
+
+    target = extract_data_file(zip_path, tmp_path / "out")
+    assert target == tmp_path / "out" / "data" / "main.sav"
+    assert target.read_text() == "x" * 10
+    # Nothing else is extracted
+    assert [p for p in (tmp_path / "out").rglob("*") if p.is_file()] == [target]
+
+
+def test_extract_data_file_largest_csv(tmp_path):
+    """Test that the largest delimited file is chosen without SPSS/Stata files."""
+    zip_path = _make_zip(tmp_path / "bundle.zip", {
+        "small.csv": "a\n1",
+        "large.tsv": "a\n1\n2\n3",
+    })
+
+    target = extract_data_file(zip_path, tmp_path / "out")
+    assert target.name == "large.tsv"
+
+
+def test_extract_data_file_no_data(tmp_path):
+    """Test that archives without data files return None."""
+    zip_path = _make_zip(tmp_path / "bundle.zip", {"readme.txt": "hello"})
+
+    assert extract_data_file(zip_path, tmp_path / "out") is None
+
+
+def test_extract_data_file_skip_dirs_and_min_size(tmp_path):
+    """Test custom documentation directories and minimum member size."""
+    zip_path = _make_zip(tmp_path / "bundle.zip", {
+        "setup/setup.sav": "x" * 100,
+        "tiny.dta": "x",
+        "data.csv": "x" * 50,
+    })
+
+    target = extract_data_file(zip_path, tmp_path / "out", skip_dirs=("setup",), min_size=10)
+    assert target.name == "data.csv"
+
+
+def test_select_data_member_keeps_first_of_equal_candidates(tmp_path):
+    """Test that ties on format and size go to the first member in the archive."""
+    zip_path = _make_zip(tmp_path / "bundle.zip", {
+        "b.sav": "x" * 10,
+        "a.sav": "x" * 10,
+        "c.dta": "x" * 5,
+    })
+
+    with zipfile.ZipFile(zip_path) as zf:
+        assert select_data_member(zf).filename == "b.sav"
+
+
+def test_walk_files_prunes_skip_dirs(tmp_path):
+    """Test that the scandir walk yields files recursively and skips documentation dirs."""
+    (tmp_path / "data" / "doc").mkdir(parents=True)
+    (tmp_path / "data" / "main.sav").write_text("x")
+    (tmp_path / "data" / "doc" / "manual.sav").write_text("x")
+    (tmp_path / "top.csv").write_text("x")
+
+    names = sorted(entry.name for entry in walk_files(tmp_path))
+    assert names == ["main.sav", "top.csv"]
+    names = sorted(entry.name for entry in walk_files(tmp_path, skip_dirs=()))
+    assert names == ["main.sav", "manual.sav", "top.csv"]